@@ -1,5 +1,6 @@
-from typing import List
-from packages.core.ports import InventoryPort, ReviewsPort
+from typing import Dict, List, Optional
+from packages.core.ports import InventoryPort, ReviewsPort, SchedulePort, POSPort
+from packages.core.port_cache import CachedPort, cache_port
 from packages.adapters.inventory_mock import InventoryMockAdapter
 from packages.adapters.reviews_mock import ReviewsMockAdapter
 # Placeholders for future real adapters:
@@ -8,15 +9,33 @@ from packages.adapters.reviews_mock import ReviewsMockAdapter
 # from adapters.reviews_email import ReviewsEmailAdapter
 
 class AdapterRegistry:
-    def __init__(self, flags: List[str]):
+    def __init__(self, flags: List[str], cache: bool = False):
         self.flags = set(f.strip().lower() for f in flags)
+        # Request paths read ports through a CachedPort; the worker wants raw ones
+        self.cache = cache
+        self.cached_ports: Dict[str, CachedPort] = {}
+
+    def _wrap(self, name: str, port):
+        if not self.cache:
+            return port
+        if name not in self.cached_ports:
+            self.cached_ports[name] = cache_port(port, name)
+        return self.cached_ports[name]
 
     def inventory(self) -> InventoryPort:
         # if "csv" in self.flags: return InventoryCSVAdapter(path="data/inbox/inventory.csv")
         # if "toast" in self.flags: return InventoryToastAdapter(...)
-        return InventoryMockAdapter()
+        return self._wrap("inventory", InventoryMockAdapter())
 
     def reviews(self) -> ReviewsPort:
         # if "google" in self.flags: return ReviewsGoogleAdapter(location_id=...)
         # if "email" in self.flags: return ReviewsEmailAdapter(...)
-        return ReviewsMockAdapter()
\ No newline at end of file
+        return self._wrap("reviews", ReviewsMockAdapter())
+
+    def schedule(self) -> Optional[SchedulePort]:
+        # if "7shifts" in self.flags: return Schedule7ShiftsAdapter(...)
+        return None
+
+    def pos(self) -> Optional[POSPort]:
+        # if "toast" in self.flags: return POSToastAdapter(...)
+        return None
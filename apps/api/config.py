@@ -16,6 +16,7 @@ class Settings:
     imap_url: Optional[str]
     imap_user: Optional[str]
     imap_pass: Optional[str]
+    theme_keywords: List[str]
 
 def get_settings() -> Settings:
     adapters = [a.strip() for a in os.getenv("ADAPTERS", "mock").split(",") if a.strip()]
@@ -26,4 +27,6 @@ def get_settings() -> Settings:
         imap_url=os.getenv("IMAP_URL"),
         imap_user=os.getenv("IMAP_USER"),
         imap_pass=os.getenv("IMAP_PASS"),
+        # Location-specific theme phrases; empty keeps ReviewService.KEYWORDS
+        theme_keywords=[k.strip() for k in os.getenv("THEME_KEYWORDS", "").split(",") if k.strip()],
     )
\ No newline at end of file
@@ -1,9 +1,13 @@
-from fastapi import FastAPI, Query, Depends, HTTPException, UploadFile, File
+from fastapi import FastAPI, Query, Depends, HTTPException, UploadFile, File, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from contextlib import asynccontextmanager
+from typing import List, Optional, Union
 from datetime import datetime, date, timedelta
+import csv
 import sys
 import os
 
@@ -15,21 +19,63 @@ from apps.api.adapter_registry import AdapterRegistry
 from apps.api.schemas import (
     InventoryResponse, ReviewResponse, ChangeResponse, BriefResponse,
     InventoryOut, ReviewOut, ThemeOut, InventoryCreate, MenuCreate, 
-    ChangeCreate, MenuResponse
+    ChangeCreate, MenuResponse, RatingTrendPoint, ThemeTrend, Page,
+    AcknowledgementBulkCreate, AcknowledgementBulkResult, AckCoverage, ReviewSearchHit
 )
 from packages.core.services import InventoryService, ReviewService
-from packages.core.database import get_db, Inventory, Review, Change, Menu, User, StockStatus
-from packages.core.pdf_service import PDFService
+from packages.core.database import get_db, get_async_db, Inventory, Review, Change, Menu, User, StockStatus
+from packages.core.brief_cache import get_brief_cache
+from packages.core.brief_repository import load_brief
+from packages.core.inventory_import import import_inventory_csv
+from packages.core.theme_tagging import theme_counts
+from packages.core.review_rollup import rating_trend, theme_trend
+from packages.core.review_search import MAX_LIMIT as SEARCH_MAX_LIMIT, ReviewSearch, search_reviews
+from packages.core.pagination import (
+    INVENTORY, MENU, REVIEWS, CHANGES, MAX_LIMIT, PaginationError, prepare_page, page_envelope, wants_page
+)
+from packages.core.engine import (
+    init_engine, dispose_engine, init_async_engine, dispose_async_engine, pool_stats
+)
+from packages.core.pdf_pool import get_pdf_pool
+from packages.core.port_cache import UpstreamUnavailable
+from packages.core.acknowledgements import ack_coverage, record_acks, unacknowledged_changes
+from packages.core.http_cache import READ_POLICIES, ConditionalGetMiddleware, get_table_versions
+from packages.core.metrics import install_metrics
+from packages.core.push import (
+    KEEPALIVE_SECONDS, SubscriptionClosed, get_push_hub, inventory_event, parse_kinds, sse_stream
+)
+from packages.core.serializers import change_serializer, review_serializer
 
 settings = get_settings()
-registry = AdapterRegistry(settings.adapters)
+registry = AdapterRegistry(settings.adapters, cache=True)
+brief_cache = get_brief_cache()
+table_versions = get_table_versions()
+push_hub = get_push_hub()
+pdf_pool = get_pdf_pool()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared DB engines/pools on startup and release them on shutdown"""
+    init_engine()
+    init_async_engine()
+    pdf_pool.start()
+    yield
+    pdf_pool.shutdown()
+    for port in registry.cached_ports.values():
+        port.shutdown()
+    await dispose_async_engine()
+    dispose_engine()
 
 app = FastAPI(
     title="Restaurant Ops Hub API", 
     version="0.1.0",
-    description="Centralized operations management for restaurants"
+    description="Centralized operations management for restaurants",
+    lifespan=lifespan
 )
 
+# ETag/304 for polled read endpoints; added first so CORS wraps the 304s too
+app.add_middleware(ConditionalGetMiddleware, policies=READ_POLICIES, versions=table_versions)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -39,9 +85,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GET /metrics and per-route timings when METRICS_ENABLED; added last so it times the whole stack
+install_metrics(app)
+
 # Legacy services for backward compatibility
 inv_svc = InventoryService(registry.inventory())
-rev_svc = ReviewService(registry.reviews())
+rev_svc = ReviewService(registry.reviews(), settings.theme_keywords)
 
 @app.get("/ping")
 def ping():
@@ -52,6 +101,20 @@ def ping():
 def health():
     return {"ok": True, "adapters": settings.adapters}
 
+@app.exception_handler(UpstreamUnavailable)
+async def upstream_unavailable(request: Request, exc: UpstreamUnavailable):
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+@app.get("/api/v1/admin/ports")
+def get_port_cache_stats():
+    """Hit/stale/refresh counters and circuit state of the cached adapter ports"""
+    return {name: port.stats() for name, port in registry.cached_ports.items()}
+
+@app.get("/api/v1/admin/db-pool")
+def get_db_pool_stats():
+    """Connection pool occupancy and counters, for sizing DB_POOL_SIZE/DB_MAX_OVERFLOW"""
+    return pool_stats()
+
 # Legacy endpoints for backward compatibility
 @app.get("/inventory", response_model=List[InventoryOut])
 def get_inventory():
@@ -62,125 +125,236 @@ def get_reviews(days: int = Query(7, ge=1, le=30)):
     return [r.__dict__ for r in rev_svc.recent(days)]
 
 @app.get("/themes", response_model=List[ThemeOut])
-def get_themes(days: int = Query(7, ge=1, le=30)):
-    return [{"name": k, "count": v} for k, v in rev_svc.themes(days)]
+def get_themes(days: int = Query(7, ge=1, le=30), db: Session = Depends(get_db)):
+    return review_theme_counts(db, days)
 
 # New database-backed endpoints
-@app.get("/api/v1/inventory", response_model=List[InventoryResponse])
-def get_inventory_v1(db: Session = Depends(get_db)):
+# Read-heavy endpoints polled by tablets run on the async engine so they do
+# not hold a threadpool worker while waiting on the database.
+async def fetch_page(db: AsyncSession, resource, limit, cursor, fields, where=()) -> dict:
+    try:
+        stmt, names, limit = prepare_page(resource, limit, cursor, fields, where)
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    rows = (await db.execute(stmt)).all()
+    return page_envelope(resource, names, rows, limit)
+
+def fetch_page_sync(db: Session, resource, limit, cursor, fields, where=()) -> dict:
+    try:
+        stmt, names, limit = prepare_page(resource, limit, cursor, fields, where)
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return page_envelope(resource, names, db.execute(stmt).all(), limit)
+
+# List endpoints return a bare array unless limit/cursor/fields is given, in
+# which case they return a keyset-paginated Page
+@app.get("/api/v1/inventory", response_model=Union[List[InventoryResponse], Page])
+async def get_inventory_v1(limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT), cursor: Optional[str] = None,
+                           fields: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
     """Get current inventory status from database"""
-    inventory_items = db.query(Inventory).all()
-    return inventory_items
+    if wants_page(limit, cursor, fields):
+        return await fetch_page(db, INVENTORY, limit, cursor, fields)
+    result = await db.execute(select(Inventory).options(selectinload(Inventory.menu_item)))
+    return result.scalars().all()
 
-@app.get("/api/v1/reviews", response_model=List[ReviewResponse])
-def get_reviews_v1(days: int = Query(7, ge=1, le=30), db: Session = Depends(get_db)):
+@app.get("/api/v1/reviews", response_model=Union[List[ReviewResponse], Page])
+async def get_reviews_v1(days: int = Query(7, ge=1, le=30), limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT),
+                         cursor: Optional[str] = None, fields: Optional[str] = None,
+                         db: AsyncSession = Depends(get_async_db)):
     """Get recent reviews from database"""
     cutoff_date = datetime.utcnow() - timedelta(days=days)
-    reviews = db.query(Review).filter(Review.created_at >= cutoff_date).all()
-    return reviews
+    if wants_page(limit, cursor, fields):
+        return await fetch_page(db, REVIEWS, limit, cursor, fields, where=[Review.created_at >= cutoff_date])
+    result = await db.execute(select(Review).where(Review.created_at >= cutoff_date))
+    return result.scalars().all()
+
+@app.get("/api/v1/reviews/search", response_model=List[ReviewSearchHit])
+def search_reviews_v1(q: str = Query(..., min_length=1), source: Optional[str] = None,
+                      min_rating: Optional[int] = Query(None, ge=1, le=5), max_rating: Optional[int] = Query(None, ge=1, le=5),
+                      since: Optional[date] = None, until: Optional[date] = None,
+                      limit: int = Query(20, ge=1, le=SEARCH_MAX_LIMIT), db: Session = Depends(get_db)):
+    """Ranked full-text search over review text, best match first"""
+    try:
+        search = ReviewSearch(q, source, min_rating, max_rating, since, until, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [{**review_serializer(review), "rank": rank} for review, rank in search_reviews(db, search)]
+
+@app.get("/api/v1/reviews/themes", response_model=List[ThemeOut])
+def get_review_themes_v1(days: int = Query(7, ge=1, le=365), db: Session = Depends(get_db)):
+    """Theme counts for reviews in the window, aggregated from review_themes"""
+    return review_theme_counts(db, days)
+
+def review_theme_counts(db: Session, days: int) -> List[dict]:
+    # Read-only: tagging is the worker's themes job
+    return [{"name": theme, "count": count} for theme, count in theme_counts(db, days)]
+
+# Trends read only the daily rollup, so a 365-day chart costs O(days)
+@app.get("/api/v1/reviews/trends/ratings", response_model=List[RatingTrendPoint])
+def get_rating_trend(days: int = Query(30, ge=1, le=365), source: Optional[str] = None,
+                     db: Session = Depends(get_db)):
+    """Daily review count and average rating"""
+    return rating_trend(db, days, source=source)
 
-@app.get("/api/v1/changes", response_model=List[ChangeResponse])
-def get_changes(db: Session = Depends(get_db)):
+@app.get("/api/v1/reviews/trends/themes", response_model=List[ThemeTrend])
+def get_theme_trend(days: int = Query(30, ge=1, le=365), db: Session = Depends(get_db)):
+    """Per-theme totals, average rating and daily counts"""
+    return theme_trend(db, days)
+
+@app.get("/api/v1/changes", response_model=Union[List[ChangeResponse], Page])
+async def get_changes(limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT), cursor: Optional[str] = None,
+                      fields: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
     """Get active changes/announcements"""
-    changes = db.query(Change).filter(Change.is_active == True).all()
-    return changes
+    if wants_page(limit, cursor, fields):
+        return await fetch_page(db, CHANGES, limit, cursor, fields, where=[Change.is_active == True])
+    result = await db.execute(select(Change).where(Change.is_active == True))
+    return result.scalars().all()
+
+# Push channel for tablets: 86/inventory transitions and new changes as they are written
+@app.get("/api/v1/events")
+async def stream_events(kinds: Optional[str] = None):
+    """Server-sent events; ?kinds=eighty_six,inventory,change filters (default all)"""
+    try:
+        subscriber = push_hub.subscribe(parse_kinds(kinds))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(
+        sse_stream(push_hub, subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.websocket("/api/v1/ws")
+async def push_socket(websocket: WebSocket, kinds: Optional[str] = None):
+    """The same events over a WebSocket, one JSON text frame each"""
+    try:
+        requested = parse_kinds(kinds)
+    except ValueError:
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    subscriber = push_hub.subscribe(requested)
+    try:
+        while True:
+            event = await subscriber.get(timeout=KEEPALIVE_SECONDS)
+            # Keepalives also surface a vanished client, since we never read
+            await websocket.send_text(event.json.decode() if event is not None else '{"kind":"keepalive"}')
+    except SubscriptionClosed:
+        await websocket.close(code=1013)  # dropped for falling behind: reconnect and refetch
+    except WebSocketDisconnect:
+        pass
+    finally:
+        push_hub.unsubscribe(subscriber)
 
 @app.get("/api/v1/brief/today", response_model=BriefResponse)
-def get_today_brief(db: Session = Depends(get_db)):
-    """Generate today's pre-shift brief"""
-    today = date.today()
-    
-    # Get 86 items
-    eighty_six_items = db.query(Inventory).filter(Inventory.status == StockStatus.EIGHTY_SIX).all()
-    
-    # Get low stock items
-    low_stock_items = db.query(Inventory).filter(Inventory.status == StockStatus.LOW).all()
-    
-    # Get recent reviews (last 7 days)
-    cutoff_date = datetime.utcnow() - timedelta(days=7)
-    recent_reviews = db.query(Review).filter(Review.created_at >= cutoff_date).all()
-    
-    # Get active changes
-    changes = db.query(Change).filter(Change.is_active == True).all()
+async def get_today_brief(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Generate today's pre-shift brief (served from the snapshot cache until a write invalidates it)"""
+    cached, generation = brief_cache.get()
+    if cached is None:
+        snapshot = await db.run_sync(load_brief)
+        brief = BriefResponse(
+            date=date.today(),
+            eighty_six_items=snapshot.eighty_six_items,
+            low_stock_items=snapshot.low_stock_items,
+            recent_reviews=snapshot.recent_reviews,
+            changes=snapshot.changes,
+            generated_at=datetime.utcnow()
+        )
+        cached = brief_cache.put(
+            brief.model_dump_json().encode(), generation,
+            fingerprint=brief.model_dump_json(exclude={"generated_at"}).encode()
+        )
     
-    return BriefResponse(
-        date=today,
-        eighty_six_items=eighty_six_items,
-        low_stock_items=low_stock_items,
-        recent_reviews=recent_reviews,
-        changes=changes,
-        generated_at=datetime.utcnow()
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if cached.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+def brief_pdf_data(snapshot) -> dict:
+    """Flatten a BriefSnapshot into the dict PDFService renders (timestamps stay datetimes)"""
+    return {
+        'date': date.today().isoformat(),
+        'eighty_six_items': [
+            {
+                'name': item.menu_item.name if item.menu_item else 'Unknown Item',
+                'item_id': item.item_id,
+                'notes': item.notes or 'No notes'
+            }
+            for item in snapshot.eighty_six_items
+        ],
+        'low_stock_items': [
+            {
+                'name': item.menu_item.name if item.menu_item else 'Unknown Item',
+                'item_id': item.item_id,
+                'notes': item.notes or 'No notes'
+            }
+            for item in snapshot.low_stock_items
+        ],
+        'recent_reviews': [
+            {
+                'source': review.source,
+                'rating': review.rating,
+                'text': review.text or 'No text',
+                'created_at': review.created_at
+            }
+            for review in snapshot.recent_reviews
+        ],
+        'changes': [
+            {
+                'title': change.title,
+                'detail': change.detail or 'No details',
+                'created_by': change.created_by,
+                'created_at': change.created_at
+            }
+            for change in snapshot.changes
+        ],
+        'generated_at': datetime.utcnow().isoformat()
+    }
+
+def pdf_response(pdf_bytes: bytes, brief_date: str) -> Response:
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename=pre-shift-brief-{brief_date}.pdf"
+        }
     )
 
 @app.get("/api/v1/brief/today/pdf")
-def get_today_brief_pdf(db: Session = Depends(get_db)):
-    """Generate and download today's pre-shift brief as PDF"""
+async def get_today_brief_pdf(db: AsyncSession = Depends(get_async_db)):
+    """Generate and download today's pre-shift brief as PDF (rendered in the PDF worker pool)"""
     try:
-        # Get brief data (same as the JSON endpoint)
-        today = date.today()
-        
-        eighty_six_items = db.query(Inventory).filter(Inventory.status == StockStatus.EIGHTY_SIX).all()
-        low_stock_items = db.query(Inventory).filter(Inventory.status == StockStatus.LOW).all()
-        cutoff_date = datetime.utcnow() - timedelta(days=7)
-        recent_reviews = db.query(Review).filter(Review.created_at >= cutoff_date).all()
-        changes = db.query(Change).filter(Change.is_active == True).all()
-        
-        # Convert to dictionaries for PDF generation
-        brief_data = {
-            'date': today.isoformat(),
-            'eighty_six_items': [
-                {
-                    'name': item.menu_item.name if item.menu_item else 'Unknown Item',
-                    'item_id': item.item_id,
-                    'notes': item.notes or 'No notes'
-                }
-                for item in eighty_six_items
-            ],
-            'low_stock_items': [
-                {
-                    'name': item.menu_item.name if item.menu_item else 'Unknown Item',
-                    'item_id': item.item_id,
-                    'notes': item.notes or 'No notes'
-                }
-                for item in low_stock_items
-            ],
-            'recent_reviews': [
-                {
-                    'source': review.source,
-                    'rating': review.rating,
-                    'text': review.text or 'No text',
-                    'created_at': review.created_at.isoformat()
-                }
-                for review in recent_reviews
-            ],
-            'changes': [
-                {
-                    'title': change.title,
-                    'detail': change.detail or 'No details',
-                    'created_by': change.created_by,
-                    'created_at': change.created_at.isoformat()
-                }
-                for change in changes
-            ],
-            'generated_at': datetime.utcnow().isoformat()
-        }
-        
-        # Generate PDF
-        pdf_service = PDFService()
-        pdf_bytes = pdf_service.generate_brief_pdf(brief_data)
-        
-        # Return PDF response
-        return Response(
-            content=pdf_bytes,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename=pre-shift-brief-{today.isoformat()}.pdf"
-            }
-        )
+        brief_data = brief_pdf_data(await db.run_sync(load_brief))
+        pdf_bytes = await pdf_pool.render(brief_data)
+        return pdf_response(pdf_bytes, brief_data['date'])
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
+@app.post("/api/v1/brief/today/pdf/jobs", status_code=202)
+async def enqueue_today_brief_pdf(db: AsyncSession = Depends(get_async_db)):
+    """Queue a PDF render of today's brief; identical briefs share one job"""
+    brief_data = brief_pdf_data(await db.run_sync(load_brief))
+    job = pdf_pool.submit(brief_data)
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "url": f"/api/v1/brief/today/pdf/jobs/{job.job_id}"
+    }
+
+@app.get("/api/v1/brief/today/pdf/jobs/{job_id}")
+def get_today_brief_pdf_job(job_id: str):
+    """Fetch a queued PDF: 202 while rendering, the PDF once done"""
+    job = pdf_pool.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="PDF job not found")
+    if job.status == "pending":
+        return JSONResponse(status_code=202, content={"job_id": job.job_id, "status": job.status})
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {job.error}")
+    # The brief's own date: a job queued before midnight is still that day's brief
+    return pdf_response(job.future.result(), job.brief_date)
+
 # Inventory CRUD endpoints
 @app.post("/api/v1/inventory", response_model=InventoryResponse)
 def create_inventory_item(item: InventoryCreate, db: Session = Depends(get_db)):
@@ -200,6 +374,9 @@ def create_inventory_item(item: InventoryCreate, db: Session = Depends(get_db)):
     
     db.add(db_item)
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("inventory")
+    inventory_event(push_hub, db_item.item_id, None, db_item.status, db_item.notes)
     db.refresh(db_item)
     
     return db_item
@@ -217,6 +394,7 @@ def update_inventory_item(item_id: int, item: InventoryCreate, db: Session = Dep
         raise HTTPException(status_code=404, detail="Menu item not found")
     
     # Update inventory item
+    previous_status = db_item.status if db_item.item_id == item.item_id else None
     db_item.item_id = item.item_id
     db_item.status = item.status
     db_item.notes = item.notes
@@ -224,6 +402,9 @@ def update_inventory_item(item_id: int, item: InventoryCreate, db: Session = Dep
     db_item.updated_at = datetime.utcnow()
     
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("inventory")
+    inventory_event(push_hub, db_item.item_id, previous_status, db_item.status, db_item.notes)
     db.refresh(db_item)
     
     return db_item
@@ -237,70 +418,41 @@ def delete_inventory_item(item_id: int, db: Session = Depends(get_db)):
     
     db.delete(db_item)
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("inventory")
     
     return {"message": "Inventory item deleted successfully"}
 
 @app.post("/api/v1/inventory/upload")
 def upload_inventory_csv(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Upload CSV file to update inventory"""
+    """Upload CSV file to update inventory (columns: item_id, status, notes)"""
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="File must be a CSV")
     
     try:
-        # Read CSV content
-        content = file.file.read().decode('utf-8')
-        lines = content.strip().split('\n')
-        
-        # Skip header row
-        data_lines = lines[1:] if len(lines) > 1 else []
-        
-        updated_count = 0
-        for line in data_lines:
-            if not line.strip():
-                continue
-                
-            parts = line.split(',')
-            if len(parts) >= 2:
-                item_id = parts[0].strip()
-                status_str = parts[1].strip().lower()
-                
-                # Map status string to enum
-                status_mapping = {
-                    'ok': StockStatus.OK,
-                    'low': StockStatus.LOW,
-                    '86': StockStatus.EIGHTY_SIX,
-                    'eighty_six': StockStatus.EIGHTY_SIX
-                }
-                
-                status = status_mapping.get(status_str, StockStatus.OK)
-                notes = parts[2].strip() if len(parts) > 2 else None
-                
-                # Find or create inventory item
-                inventory_item = db.query(Inventory).filter(Inventory.item_id == item_id).first()
-                if inventory_item:
-                    inventory_item.status = status
-                    inventory_item.notes = notes
-                    inventory_item.updated_at = datetime.utcnow()
-                else:
-                    inventory_item = Inventory(
-                        item_id=item_id,
-                        status=status,
-                        notes=notes
-                    )
-                    db.add(inventory_item)
-                
-                updated_count += 1
-        
+        report = import_inventory_csv(db, file.file)
         db.commit()
-        return {"message": f"Successfully updated {updated_count} inventory items"}
-        
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {str(e)}")
     except Exception as e:
+        db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to process CSV: {str(e)}")
 
+    if report.inserted or report.updated:
+        brief_cache.invalidate()
+        table_versions.bump("inventory")
+    for item_id, previous, status in report.transitions:
+        inventory_event(push_hub, item_id, previous, status)
+    return report.to_dict()
+
 # Menu CRUD endpoints
-@app.get("/api/v1/menu", response_model=List[MenuResponse])
-def get_menu_items(db: Session = Depends(get_db)):
+@app.get("/api/v1/menu", response_model=Union[List[MenuResponse], Page])
+def get_menu_items(limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT), cursor: Optional[str] = None,
+                   fields: Optional[str] = None, db: Session = Depends(get_db)):
     """Get all menu items"""
+    if wants_page(limit, cursor, fields):
+        return fetch_page_sync(db, MENU, limit, cursor, fields)
     menu_items = db.query(Menu).all()
     return menu_items
 
@@ -322,6 +474,8 @@ def create_menu_item(item: MenuCreate, db: Session = Depends(get_db)):
     
     db.add(db_item)
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("menus")
     db.refresh(db_item)
     
     return db_item
@@ -340,6 +494,8 @@ def update_menu_item(item_id: str, item: MenuCreate, db: Session = Depends(get_d
     db_item.updated_at = datetime.utcnow()
     
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("menus")
     db.refresh(db_item)
     
     return db_item
@@ -358,6 +514,8 @@ def delete_menu_item(item_id: str, db: Session = Depends(get_db)):
     
     db.delete(db_item)
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("menus")
     
     return {"message": "Menu item deleted successfully"}
 
@@ -378,7 +536,10 @@ def create_change(change: ChangeCreate, db: Session = Depends(get_db)):
     
     db.add(db_item)
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("changes")
     db.refresh(db_item)
+    push_hub.publish("change", change_serializer(db_item))
     
     return db_item
 
@@ -394,6 +555,8 @@ def update_change(change_id: str, change: ChangeCreate, db: Session = Depends(ge
     db_item.effective_from = change.effective_from or db_item.effective_from
     
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("changes")
     db.refresh(db_item)
     
     return db_item
@@ -407,5 +570,25 @@ def delete_change(change_id: str, db: Session = Depends(get_db)):
     
     db.delete(db_item)
     db.commit()
+    brief_cache.invalidate()
+    table_versions.bump("changes")
     
-    return {"message": "Change deleted successfully"}
\ No newline at end of file
+    return {"message": "Change deleted successfully"}
+
+# Acknowledgement endpoints
+@app.post("/api/v1/acknowledgements/bulk", response_model=AcknowledgementBulkResult)
+def acknowledge_changes(body: AcknowledgementBulkCreate, db: Session = Depends(get_db)):
+    """Record many acks in one statement; repeats are ignored, unknown ids reported"""
+    report = record_acks(db, [(ack.user_id, ack.change_id) for ack in body.acks])
+    db.commit()
+    return report.to_dict()
+
+@app.get("/api/v1/users/{user_id}/unacknowledged-changes", response_model=List[ChangeResponse])
+def get_unacknowledged_changes(user_id: str, db: Session = Depends(get_db)):
+    """Active changes the user has not acknowledged yet"""
+    return unacknowledged_changes(db, user_id)
+
+@app.get("/api/v1/acknowledgements/coverage", response_model=List[AckCoverage])
+def get_ack_coverage(db: Session = Depends(get_db)):
+    """Per active change: acknowledged staff out of active staff"""
+    return ack_coverage(db)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing import Any, Dict, Optional, List
 from datetime import datetime, date
 from enum import Enum
 
@@ -24,6 +24,8 @@ class MenuCreate(MenuBase):
     item_id: str
 
 class MenuResponse(MenuBase):
+    model_config = ConfigDict(from_attributes=True)
+
     item_id: str
     created_at: datetime
     updated_at: datetime
@@ -37,6 +39,8 @@ class InventoryCreate(InventoryBase):
     item_id: str
 
 class InventoryResponse(InventoryBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     item_id: str
     updated_at: datetime
@@ -53,9 +57,14 @@ class ReviewCreate(ReviewBase):
     pass
 
 class ReviewResponse(ReviewBase):
+    model_config = ConfigDict(from_attributes=True)
+
     review_id: str
     created_at: datetime
 
+class ReviewSearchHit(ReviewResponse):
+    rank: float
+
 class ChangeBase(BaseModel):
     title: str
     detail: Optional[str] = None
@@ -65,6 +74,8 @@ class ChangeCreate(ChangeBase):
     pass
 
 class ChangeResponse(ChangeBase):
+    model_config = ConfigDict(from_attributes=True)
+
     change_id: str
     created_by: str
     created_at: datetime
@@ -80,6 +91,8 @@ class UserCreate(UserBase):
     pass
 
 class UserResponse(UserBase):
+    model_config = ConfigDict(from_attributes=True)
+
     user_id: str
     created_at: datetime
     updated_at: datetime
@@ -95,6 +108,8 @@ class ShiftCreate(ShiftBase):
     employee: str
 
 class ShiftResponse(ShiftBase):
+    model_config = ConfigDict(from_attributes=True)
+
     shift_id: str
     employee: str
     created_at: datetime
@@ -107,9 +122,28 @@ class AcknowledgementCreate(AcknowledgementBase):
     pass
 
 class AcknowledgementResponse(AcknowledgementBase):
+    model_config = ConfigDict(from_attributes=True)
+
     ack_id: str
     acknowledged_at: datetime
 
+class AcknowledgementBulkCreate(BaseModel):
+    acks: List[AcknowledgementCreate]
+
+class AcknowledgementBulkResult(BaseModel):
+    requested: int
+    recorded: int
+    already_acknowledged: int
+    unknown_users: List[str]
+    unknown_changes: List[str]
+
+class AckCoverage(BaseModel):
+    change_id: str
+    title: str
+    acknowledged: int
+    staff: int
+    coverage: float
+
 # Brief schemas
 class BriefResponse(BaseModel):
     date: date
@@ -137,4 +171,25 @@ class ReviewOut(BaseModel):
 
 class ThemeOut(BaseModel):
     name: str
-    count: int
\ No newline at end of file
+    count: int
+
+class RatingTrendPoint(BaseModel):
+    date: str
+    reviews: int
+    average_rating: Optional[float] = None
+
+class ThemeTrendPoint(BaseModel):
+    date: str
+    count: int
+
+class ThemeTrend(BaseModel):
+    theme: str
+    total: int
+    average_rating: float
+    points: List[ThemeTrendPoint]
+
+class Page(BaseModel):
+    """Keyset-paginated list; pass next_cursor back as ?cursor= for the next page"""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    limit: int
@@ -0,0 +1,135 @@
+# apps/worker/jobs.py
+"""Ingestion jobs: pull from the configured ports and write to the database.
+
+Each job opens its own session, commits once, and invalidates the brief
+cache (and bumps the HTTP cache version of the tables it wrote) when it
+changed anything the brief shows. Intervals default to the values below and
+can be overridden with INGEST_<NAME>_INTERVAL (seconds).
+"""
+from functools import partial
+from typing import Callable, List, Mapping, Sequence
+import logging
+import os
+
+from sqlalchemy import insert, select, update
+
+from apps.worker.scheduler import Job
+from packages.core.brief_cache import get_brief_cache
+from packages.core.database import Review, Shift, StockStatus
+from packages.core.http_cache import get_table_versions
+from packages.core.inventory_import import upsert_inventory
+from packages.core.ports import InventoryPort, POSPort, ReviewsPort, SchedulePort
+from packages.core.services import ReviewService
+from packages.core.theme_tagging import tag_new_reviews
+from packages.core.themes import ThemeMatcher, get_matcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVALS = {
+    "inventory": 300,
+    "reviews": 900,
+    "schedule": 1800,
+    "pos": 300,
+    "themes": 60,
+}
+
+SHIFT_FIELDS = ("shift_id", "starts", "ends", "role", "employee", "section")
+
+
+def ingest_inventory(port: InventoryPort, session_factory: Callable) -> int:
+    rows = [
+        {"item_id": item.item_id, "status": StockStatus(item.status.value), "notes": item.notes or None}
+        for item in port.fetch_current()
+    ]
+    with session_factory() as session:
+        report = upsert_inventory(session, rows)
+        session.commit()
+    for error in report.errors:
+        logger.warning("inventory ingest skipped %s: %s", error.item_id, error.message)
+    if report.inserted or report.updated:
+        get_brief_cache().invalidate()
+        get_table_versions().bump("inventory")
+    return report.inserted + report.updated
+
+
+def ingest_reviews(port: ReviewsPort, session_factory: Callable, days: int = 14) -> int:
+    reviews = {review.review_id: review for review in port.fetch_recent(days)}
+    if not reviews:
+        return 0
+    with session_factory() as session:
+        seen = set(session.scalars(select(Review.review_id).where(Review.review_id.in_(list(reviews)))))
+        new = [
+            {
+                "review_id": r.review_id, "source": r.source, "rating": r.rating,
+                "text": r.text, "created_at": r.created_at, "url": r.url,
+            }
+            for review_id, r in reviews.items() if review_id not in seen
+        ]
+        if new:
+            session.execute(insert(Review), new)
+            session.commit()
+    if new:
+        get_brief_cache().invalidate()
+    return len(new)
+
+
+def ingest_schedule(port: SchedulePort, session_factory: Callable, day_offset: int = 0) -> int:
+    shifts = {}
+    for shift in port.fetch_shifts(day_offset):
+        values = shift if isinstance(shift, Mapping) else vars(shift)
+        shifts[values["shift_id"]] = {name: values.get(name) for name in SHIFT_FIELDS}
+    if not shifts:
+        return 0
+    with session_factory() as session:
+        existing = set(session.scalars(select(Shift.shift_id).where(Shift.shift_id.in_(list(shifts)))))
+        updates = [values for shift_id, values in shifts.items() if shift_id in existing]
+        inserts = [values for shift_id, values in shifts.items() if shift_id not in existing]
+        if updates:
+            session.execute(update(Shift), updates)  # bulk UPDATE by primary key
+        if inserts:
+            session.execute(insert(Shift), inserts)
+        session.commit()
+    return len(shifts)
+
+
+def tag_themes(session_factory: Callable, matcher: ThemeMatcher) -> int:
+    with session_factory() as session:
+        return tag_new_reviews(session, matcher)
+
+
+def ingest_pos(port: POSPort, since_hours: int = 24) -> int:
+    # No ticket-time table yet; the pull keeps the adapter warm and visible in metrics
+    tickets = list(port.fetch_ticket_times(since_hours))
+    logger.info("pos ingest fetched %d ticket times", len(tickets))
+    return len(tickets)
+
+
+def _interval(name: str, env: Mapping[str, str]) -> float:
+    return float(env.get(f"INGEST_{name.upper()}_INTERVAL", DEFAULT_INTERVALS[name]))
+
+
+def build_jobs(registry, session_factory: Callable, env: Mapping[str, str] = os.environ,
+               theme_keywords: Sequence[str] = ()) -> List[Job]:
+    """Jobs for every port the registry provides (schedule/POS have no adapter
+    yet), plus theme tagging of newly ingested reviews."""
+    candidates = [
+        ("inventory", registry.inventory(), lambda port: partial(ingest_inventory, port, session_factory)),
+        ("reviews", registry.reviews(), lambda port: partial(ingest_reviews, port, session_factory)),
+        ("schedule", registry.schedule(), lambda port: partial(ingest_schedule, port, session_factory)),
+        ("pos", registry.pos(), lambda port: partial(ingest_pos, port)),
+    ]
+    jobs = []
+    for name, port, make in candidates:
+        if port is None:
+            continue
+        interval = _interval(name, env)
+        jobs.append(Job(
+            name=name,
+            func=make(port),
+            interval=interval,
+            jitter=min(30.0, interval * 0.1),
+            timeout=max(interval * 0.5, 10.0),
+        ))
+    matcher = get_matcher(tuple(theme_keywords or ReviewService.KEYWORDS))
+    jobs.append(Job("themes", partial(tag_themes, session_factory, matcher), interval=_interval("themes", env)))
+    return jobs
@@ -1,9 +1,49 @@
-import time, os
-from datetime import datetime
-# In the future; swap mocks for real adapters based on ENV flags
-ADAPTERS = os.getenv("ADAPTERS","mock").split(",")
-
-while True:
-    print(datetime.utcnow(),"tick; run scheduled ingestions")
-    # pos_ingest(); review_ingest(); schedule_ingest()
-    time.sleep(300)
\ No newline at end of file
+import asyncio
+import logging
+import os
+import signal
+
+from apps.api.adapter_registry import AdapterRegistry
+from apps.api.config import get_settings
+from apps.worker.jobs import build_jobs
+from apps.worker.scheduler import Job, Scheduler
+from packages.core.engine import init_engine, dispose_engine, get_session_factory
+
+logger = logging.getLogger("apps.worker")
+
+# How often the scheduler's per-job latency/lag metrics are logged
+METRICS_INTERVAL = float(os.getenv("WORKER_METRICS_INTERVAL", "60"))
+
+
+def log_metrics(scheduler: Scheduler) -> None:
+    for name, metrics in scheduler.metrics().items():
+        level = logging.WARNING if metrics["behind"] else logging.INFO
+        logger.log(
+            level, "job=%s runs=%d failures=%d skipped=%d last_duration=%s p95=%s lag=%s behind=%s",
+            name, metrics["runs"], metrics["failures"], metrics["skipped"],
+            metrics["last_duration"], metrics["p95_duration"], metrics["last_lag"], metrics["behind"],
+        )
+
+
+async def main() -> None:
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    init_engine()
+    # In the future; swap mocks for real adapters based on ENV flags
+    settings = get_settings()
+    registry = AdapterRegistry(settings.adapters)
+    jobs = build_jobs(registry, get_session_factory(), theme_keywords=settings.theme_keywords)
+    jobs.append(Job("metrics", lambda: log_metrics(scheduler), METRICS_INTERVAL, run_at_start=False))
+    scheduler = Scheduler(jobs)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await scheduler.run(stop)
+    finally:
+        dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
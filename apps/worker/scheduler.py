@@ -0,0 +1,206 @@
+# apps/worker/scheduler.py
+"""Asyncio scheduler for the background ingestion jobs.
+
+Each registered job runs on its own interval, in its own task, so a slow
+reviews pull never delays the inventory count. Per job:
+
+- fixed-rate schedule (``interval`` seconds) plus up to ``jitter`` seconds of
+  random delay, so workers started together don't hit an adapter in lockstep
+- no overlap: if the previous run is still going (a timed-out sync job keeps
+  its thread), the tick is skipped and counted
+- ``timeout`` seconds per run; a timeout counts as a failure
+- after a failure, retries back off exponentially from ``backoff`` up to
+  ``max_backoff`` seconds, and return to the normal interval on success
+
+Sync callables run in a thread pool; coroutine functions run on the loop.
+``metrics()`` reports latency and lag (how late a run started compared with
+its schedule) per job; ``behind`` is set when ingest is falling behind.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import inspect
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    jitter: float = 0.0
+    timeout: Optional[float] = None
+    backoff: float = 30.0
+    max_backoff: float = 1800.0
+    run_at_start: bool = True
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    last_duration: Optional[float] = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_lag: Optional[float] = None
+    max_lag: float = 0.0
+    last_success_at: Optional[float] = None
+    next_run_at: Optional[float] = None
+    durations: List[float] = field(default_factory=list)
+
+
+class Scheduler:
+    LATENCY_WINDOW = 100
+
+    def __init__(
+        self,
+        jobs: List[Job],
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        names = [job.name for job in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate job names: {names}")
+        self.jobs = {job.name: job for job in jobs}
+        self.stats: Dict[str, JobStats] = {job.name: JobStats() for job in jobs}
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max(len(jobs), 1), thread_name_prefix="ingest"
+        )
+        self._inflight: Dict[str, Any] = {}
+
+    def _start(self, job: Job) -> "asyncio.Future":
+        if inspect.iscoroutinefunction(job.func):
+            task = asyncio.ensure_future(job.func())
+            self._inflight[job.name] = task
+            return task
+        # Keep the concurrent future: it stays running after a timeout, which
+        # is what the overlap check has to see
+        future = self._executor.submit(job.func)
+        self._inflight[job.name] = future
+        return asyncio.wrap_future(future)
+
+    def _busy(self, job: Job) -> bool:
+        inflight = self._inflight.get(job.name)
+        return inflight is not None and not inflight.done()
+
+    async def run_once(self, job: Job, scheduled_at: Optional[float] = None) -> bool:
+        """Run ``job`` now; returns True on success. Skipped runs return False."""
+        stats = self.stats[job.name]
+        started = self._clock()
+        if scheduled_at is not None:
+            stats.last_lag = max(0.0, started - scheduled_at)
+            stats.max_lag = max(stats.max_lag, stats.last_lag)
+
+        if self._busy(job):
+            stats.skipped += 1
+            logger.warning("ingest job %s still running; skipping this tick", job.name)
+            return False
+
+        stats.runs += 1
+        try:
+            await asyncio.wait_for(self._start(job), timeout=job.timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            self._record_failure(stats, f"timed out after {job.timeout}s")
+            logger.error("ingest job %s timed out after %ss", job.name, job.timeout)
+            return False
+        except Exception as e:
+            self._record_failure(stats, repr(e))
+            logger.exception("ingest job %s failed", job.name)
+            return False
+        finally:
+            duration = self._clock() - started
+            stats.last_duration = duration
+            stats.max_duration = max(stats.max_duration, duration)
+            stats.total_duration += duration
+            stats.durations.append(duration)
+            del stats.durations[:-self.LATENCY_WINDOW]
+
+        stats.consecutive_failures = 0
+        stats.last_error = None
+        stats.last_success_at = self._clock()
+        return True
+
+    @staticmethod
+    def _record_failure(stats: JobStats, error: str) -> None:
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.last_error = error
+
+    def next_delay(self, job: Job) -> float:
+        """Seconds from the scheduled start of the last run to the next one."""
+        failures = self.stats[job.name].consecutive_failures
+        if failures:
+            delay = min(job.max_backoff, job.backoff * 2 ** (failures - 1))
+        else:
+            delay = job.interval
+        return delay + (self._rng.uniform(0, job.jitter) if job.jitter else 0.0)
+
+    async def _loop(self, job: Job, stop: asyncio.Event) -> None:
+        stats = self.stats[job.name]
+        due = self._clock() + (0.0 if job.run_at_start else self.next_delay(job))
+        while not stop.is_set():
+            stats.next_run_at = due
+            wait = due - self._clock()
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=wait)
+                    return
+                except asyncio.TimeoutError:
+                    pass
+            await self.run_once(job, scheduled_at=due)
+            # Fixed rate, but never try to catch up on ticks missed while behind
+            due = max(due + self.next_delay(job), self._clock())
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Run every job until ``stop`` is set."""
+        stop = stop or asyncio.Event()
+        logger.info("scheduler starting jobs: %s", ", ".join(self.jobs))
+        try:
+            await asyncio.gather(*(self._loop(job, stop) for job in self.jobs.values()))
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        now = self._clock()
+        report = {}
+        for name, job in self.jobs.items():
+            stats = self.stats[name]
+            durations = sorted(stats.durations)
+            since_success = now - stats.last_success_at if stats.last_success_at is not None else None
+            report[name] = {
+                "interval": job.interval,
+                "runs": stats.runs,
+                "failures": stats.failures,
+                "timeouts": stats.timeouts,
+                "skipped": stats.skipped,
+                "consecutive_failures": stats.consecutive_failures,
+                "last_error": stats.last_error,
+                "running": self._busy(job),
+                "last_duration": stats.last_duration,
+                "max_duration": stats.max_duration,
+                "mean_duration": stats.total_duration / stats.runs if stats.runs else None,
+                "p95_duration": durations[int(0.95 * (len(durations) - 1))] if durations else None,
+                "last_lag": stats.last_lag,
+                "max_lag": stats.max_lag,
+                "seconds_since_success": since_success,
+                "next_run_in": max(0.0, stats.next_run_at - now) if stats.next_run_at is not None else None,
+                # Behind: a run started more than one interval late, or no
+                # success for two intervals (counting from start-up if none yet)
+                "behind": (stats.last_lag or 0.0) > job.interval
+                or (since_success is not None and since_success > 2 * job.interval)
+                or (since_success is None and stats.runs > 0 and stats.consecutive_failures > 0),
+            }
+        return report
@@ -0,0 +1,267 @@
+# benchmarks/bench_brief_html.py
+"""Brief HTML render time: string concatenation (before) vs compiled template.
+
+    python -m benchmarks.bench_brief_html [--rows 10 1000 10000] [--pdf]
+
+``--pdf`` also times the full WeasyPrint render with the cached stylesheet
+(needs WeasyPrint's native libraries).
+"""
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List
+
+from packages.core.brief_html import render_brief_html
+
+
+class LegacyBriefHTML:
+    """The f-string/+= implementation PDFService used before the template."""
+
+    def _create_brief_html(self, brief_data: Dict[str, Any]) -> str:
+        """Create HTML content for the brief"""
+        
+        date_str = brief_data.get('date', date.today().strftime('%Y-%m-%d'))
+        generated_at = brief_data.get('generated_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        
+        eighty_six_items = brief_data.get('eighty_six_items', [])
+        low_stock_items = brief_data.get('low_stock_items', [])
+        recent_reviews = brief_data.get('recent_reviews', [])
+        changes = brief_data.get('changes', [])
+        
+        html = f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <title>Pre-Shift Brief - {date_str}</title>
+        </head>
+        <body>
+            <div class="header">
+                <h1>🍽️ Restaurant Ops Hub</h1>
+                <h2>Pre-Shift Brief - {date_str}</h2>
+                <p class="generated">Generated: {generated_at}</p>
+            </div>
+            
+            <div class="content">
+                {self._create_86_section(eighty_six_items)}
+                {self._create_low_stock_section(low_stock_items)}
+                {self._create_reviews_section(recent_reviews)}
+                {self._create_changes_section(changes)}
+            </div>
+            
+            <div class="footer">
+                <p>Restaurant Ops Hub - Pre-Shift Brief</p>
+            </div>
+        </body>
+        </html>
+        """
+        
+        return html
+    
+    def _create_86_section(self, items: List[Dict]) -> str:
+        """Create HTML for 86 items section"""
+        if not items:
+            return """
+            <div class="section">
+                <h3 class="section-title success">✅ 86 Items (0)</h3>
+                <p class="no-items">No items are currently 86'd</p>
+            </div>
+            """
+        
+        items_html = ""
+        for item in items:
+            items_html += f"""
+            <div class="item-card danger">
+                <div class="item-name">{item.get('name', 'Unknown Item')}</div>
+                <div class="item-id">{item.get('item_id', 'N/A')}</div>
+                <div class="item-notes">{item.get('notes', 'No notes')}</div>
+            </div>
+            """
+        
+        return f"""
+        <div class="section">
+            <h3 class="section-title danger">🚫 86 Items ({len(items)})</h3>
+            <div class="items-grid">
+                {items_html}
+            </div>
+        </div>
+        """
+    
+    def _create_low_stock_section(self, items: List[Dict]) -> str:
+        """Create HTML for low stock items section"""
+        if not items:
+            return """
+            <div class="section">
+                <h3 class="section-title success">✅ Low Stock Items (0)</h3>
+                <p class="no-items">All items are well stocked</p>
+            </div>
+            """
+        
+        items_html = ""
+        for item in items:
+            items_html += f"""
+            <div class="item-card warning">
+                <div class="item-name">{item.get('name', 'Unknown Item')}</div>
+                <div class="item-id">{item.get('item_id', 'N/A')}</div>
+                <div class="item-notes">{item.get('notes', 'No notes')}</div>
+            </div>
+            """
+        
+        return f"""
+        <div class="section">
+            <h3 class="section-title warning">⚠️ Low Stock Items ({len(items)})</h3>
+            <div class="items-grid">
+                {items_html}
+            </div>
+        </div>
+        """
+    
+    def _create_reviews_section(self, reviews: List[Dict]) -> str:
+        """Create HTML for reviews section"""
+        if not reviews:
+            return """
+            <div class="section">
+                <h3 class="section-title">📝 Recent Reviews (0)</h3>
+                <p class="no-items">No recent reviews</p>
+            </div>
+            """
+        
+        reviews_html = ""
+        for review in reviews:
+            rating = review.get('rating', 0)
+            stars = "★" * rating + "☆" * (5 - rating)
+            created_at = review.get('created_at', '')
+            if created_at:
+                try:
+                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                    created_at = dt.strftime('%Y-%m-%d %H:%M')
+                except:
+                    pass
+            
+            reviews_html += f"""
+            <div class="review-card">
+                <div class="review-header">
+                    <div class="stars">{stars}</div>
+                    <div class="source">{review.get('source', 'Unknown')}</div>
+                    <div class="date">{created_at}</div>
+                </div>
+                <div class="review-text">{review.get('text', 'No text')}</div>
+            </div>
+            """
+        
+        return f"""
+        <div class="section">
+            <h3 class="section-title">📝 Recent Reviews ({len(reviews)})</h3>
+            <div class="reviews-list">
+                {reviews_html}
+            </div>
+        </div>
+        """
+    
+    def _create_changes_section(self, changes: List[Dict]) -> str:
+        """Create HTML for changes section"""
+        if not changes:
+            return """
+            <div class="section">
+                <h3 class="section-title">📢 Changes & Announcements (0)</h3>
+                <p class="no-items">No active changes</p>
+            </div>
+            """
+        
+        changes_html = ""
+        for change in changes:
+            created_at = change.get('created_at', '')
+            if created_at:
+                try:
+                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                    created_at = dt.strftime('%Y-%m-%d %H:%M')
+                except:
+                    pass
+            
+            changes_html += f"""
+            <div class="change-card">
+                <div class="change-title">{change.get('title', 'Untitled')}</div>
+                <div class="change-detail">{change.get('detail', 'No details')}</div>
+                <div class="change-meta">
+                    <span class="created-by">By {change.get('created_by', 'Unknown')}</span>
+                    <span class="created-at">{created_at}</span>
+                </div>
+            </div>
+            """
+        
+        return f"""
+        <div class="section">
+            <h3 class="section-title">📢 Changes & Announcements ({len(changes)})</h3>
+            <div class="changes-list">
+                {changes_html}
+            </div>
+        </div>
+        """
+
+
+def make_brief(rows: int) -> Dict:
+    now = datetime(2026, 1, 1, 16, 45)
+    quarter = max(rows // 4, 1)
+    return {
+        'date': now.date().isoformat(),
+        'generated_at': now.isoformat(),
+        'eighty_six_items': [
+            {'name': f'Item {n}', 'item_id': f'ITEM-{n}', 'notes': 'Supplier delay <urgent>'}
+            for n in range(quarter)
+        ],
+        'low_stock_items': [
+            {'name': f'Item {n}', 'item_id': f'ITEM-{n}', 'notes': '8 bottles left'}
+            for n in range(quarter)
+        ],
+        'recent_reviews': [
+            {'source': 'google', 'rating': n % 5 + 1, 'text': 'Service was slow on patio & drinks were cold',
+             'created_at': (now - timedelta(minutes=n)).isoformat()}
+            for n in range(quarter)
+        ],
+        'changes': [
+            {'title': f'Change {n}', 'detail': 'New wine list', 'created_by': 'user-001',
+             'created_at': (now - timedelta(hours=n)).isoformat()}
+            for n in range(quarter)
+        ],
+    }
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--pdf", action="store_true", help="also time the full PDF render")
+    args = parser.parse_args()
+
+    legacy = LegacyBriefHTML()
+    render_brief_html(make_brief(1))  # compile the template outside the timings
+    if args.pdf:
+        from weasyprint import CSS
+        from packages.core.brief_html import get_brief_css
+        from packages.core.pdf_service import PDFService
+        service = PDFService()
+        parse = best_of(lambda: CSS(string=get_brief_css(), font_config=service.font_config), args.repeat)
+        print(f"stylesheet parse: {parse * 1000:.1f} ms (previously paid on every render)")
+
+    print(f"{'rows':>8} {'concat ms':>12} {'template ms':>12} {'speedup':>8}" + (f" {'pdf ms':>10}" if args.pdf else ""))
+    for rows in args.rows:
+        brief = make_brief(rows)
+        before = best_of(lambda: legacy._create_brief_html(brief), args.repeat)
+        after = best_of(lambda: render_brief_html(brief), args.repeat)
+        line = f"{rows:>8} {before * 1000:>12.2f} {after * 1000:>12.2f} {before / after:>7.1f}x"
+        if args.pdf:
+            line += f" {best_of(lambda: service.generate_brief_pdf(brief), 1) * 1000:>10.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_login.py
+"""Event-loop stall during a login burst: bcrypt inline in an async handler
+(before) vs awaiting ``PasswordHasher`` (after).
+
+    python -m benchmarks.bench_login [--logins 16] [--rounds 12] [--workers 2]
+
+While the burst runs, a probe task stands in for every other request on the
+worker: it sleeps 5ms in a loop and records how late it wakes up. Inline
+hashing makes the probe wait out whole bcrypt calls; with the executor it
+keeps ticking while the hashes run on the pool.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from packages.core.passwords import PasswordHasher, hash_sync, verify_sync
+
+TICK = 0.005
+
+
+async def probe(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def burst(login, count: int):
+    stop, lags = asyncio.Event(), []
+    ticker = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(TICK * 2)
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(count)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed, lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    stored = hash_sync("s3cret", args.rounds)
+    hasher = PasswordHasher(rounds=args.rounds, workers=args.workers, max_pending=args.logins)
+
+    async def inline_login():
+        assert verify_sync("s3cret", stored)
+
+    async def pooled_login():
+        assert (await hasher.verify("s3cret", stored)).ok
+
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}, {args.workers} hasher workers")
+    print(f"{'mode':>8} {'burst s':>8} {'probe ticks':>12} {'p50 lag ms':>11} {'max lag ms':>11}")
+    try:
+        for name, login in (("inline", inline_login), ("executor", pooled_login)):
+            elapsed, lags = asyncio.run(burst(login, args.logins))
+            print(f"{name:>8} {elapsed:>8.2f} {len(lags):>12} "
+                  f"{statistics.median(lags) * 1000:>11.1f} {max(lags) * 1000:>11.1f}")
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
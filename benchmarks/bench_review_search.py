@@ -0,0 +1,113 @@
+# benchmarks/bench_review_search.py
+"""Review search latency over a large synthetic corpus.
+
+    python -m benchmarks.bench_review_search [--rows 2000000] [--url postgresql://...]
+
+Seeds ``--rows`` reviews (in a throwaway SQLite file unless ``--url`` names a
+scratch database, whose tables are dropped and recreated) and times the
+``/api/v1/reviews/search`` query for a mix of rare and common terms, with and
+without filters. The target is p95 under 50ms for unfiltered searches.
+Only the newest ``RANK_CANDIDATES`` matches are ranked, so a term in every
+seventh review (``food``) costs about what one in every 5,000th
+(``special42``) does. Selective filters are checked match by match and can
+exceed the target.
+
+SQLite, 2M reviews, 1 CPU (p95): rare 15ms, dish 43ms, common 17ms, two
+terms 27ms, phrase 26ms, term + filters 116ms. There is no Postgres
+baseline yet; run with ``--url``.
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from packages.core.database import Base, Review
+from packages.core.review_search import ReviewSearch, search_reviews
+
+BATCH = 20_000
+PHRASES = [
+    "the food was great", "service was slow", "we waited forever for a table", "soup arrived cold",
+    "lovely patio and friendly staff", "the wine list is excellent", "overpriced for the portion size",
+    "best burger in town", "music too loud to talk", "dessert was the highlight", "rude host at the door",
+    "the branzino was perfectly cooked", "kids menu is limited", "parking is a nightmare",
+]
+FILLER = "dinner lunch brunch evening table menu dish plate night friends family date visit again".split()
+# One of 5,000 specials per review, so a search for one matches ~0.02% of rows
+SPECIALS = [f"special{n}" for n in range(5000)]
+
+QUERIES = [
+    ("rare term", ReviewSearch("special42")),
+    ("dish", ReviewSearch("branzino")),
+    ("common term", ReviewSearch("food")),
+    ("two terms", ReviewSearch("cold soup")),
+    ("phrase", ReviewSearch('"wine list"')),
+    ("term + filters", ReviewSearch("slow service", source="yelp", max_rating=2,
+                                    since=date(2025, 6, 1), until=date(2025, 12, 31))),
+]
+
+
+def seed(engine, rows: int, seed: int = 11) -> None:
+    rng = random.Random(seed)
+    start = datetime(2026, 3, 1)
+    with engine.begin() as conn:
+        for offset in range(0, rows, BATCH):
+            conn.execute(insert(Review), [
+                {
+                    "review_id": f"R-{n:08d}", "source": rng.choice(["google", "yelp", "opentable"]),
+                    "rating": rng.randint(1, 5),
+                    "text": ". ".join(rng.sample(PHRASES, rng.randint(1, 3))) + " " + " ".join(rng.sample(FILLER, 4))
+                            + " " + rng.choice(SPECIALS),
+                    "created_at": start - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60)),
+                }
+                for n in range(offset, min(offset + BATCH, rows))
+            ])
+        if engine.dialect.name != "sqlite":
+            conn.execute(text("ANALYZE reviews"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--url", default=None)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    path = None
+    if args.url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+    engine = create_engine(args.url or f"sqlite:///{path}")
+    try:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        started = time.perf_counter()
+        seed(engine, args.rows)
+        print(f"{engine.dialect.name}: seeded {args.rows:,} reviews in {time.perf_counter() - started:.0f}s")
+        print(f"{'query':>16} {'hits':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        with Session(engine) as session:
+            for name, search in QUERIES:
+                hits = len(search_reviews(session, search))  # warm the cache
+                times = []
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    search_reviews(session, search)
+                    times.append((time.perf_counter() - t0) * 1000)
+                times.sort()
+                p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+                print(f"{name:>16} {hits:>5} {statistics.median(times):>8.1f} {p95:>8.1f} {times[-1]:>8.1f}")
+    finally:
+        if args.url:
+            Base.metadata.drop_all(engine)
+        engine.dispose()
+        if path:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
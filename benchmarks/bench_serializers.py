@@ -0,0 +1,126 @@
+# benchmarks/bench_serializers.py
+"""Response serialization per 10k rows: hand-built dicts + jsonable_encoder +
+json.dumps (before) vs the shared model serializers + dumps.
+
+    python -m benchmarks.bench_serializers [--rows 10000] [--repeat 5]
+
+Rows are transient model instances (no database), so only serialization is
+timed. The encoder backend (orjson or the stdlib fallback) is printed;
+install ``ops-hub[speedups]`` to compare both.
+"""
+import argparse
+import json
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+
+from packages.core.database import Inventory, Menu, Review, StockStatus
+from packages.core.serializers import BACKEND, dumps, inventory_serializer, review_serializer
+
+
+def synthetic_inventory(count: int, seed: int = 3) -> List[Inventory]:
+    rng = random.Random(seed)
+    now = datetime(2026, 3, 1, 12, 0)
+    items = []
+    for n in range(count):
+        item = Inventory(
+            id=n, item_id=f"ITEM-{n:05d}", status=rng.choice(list(StockStatus)),
+            notes=rng.choice([None, "Supplier delay", "8 bottles left"]),
+            expected_back=date(2026, 3, 2) if n % 3 else None, updated_at=now - timedelta(minutes=n),
+        )
+        item.menu_item = Menu(item_id=item.item_id, name=f"Dish {n}", price=1000 + n % 900,
+                              allergy_flags='["gluten"]', active=True)
+        items.append(item)
+    return items
+
+
+def synthetic_reviews(count: int, seed: int = 5) -> List[Review]:
+    rng = random.Random(seed)
+    now = datetime(2026, 3, 1, 12, 0)
+    return [
+        Review(review_id=f"R-{n:06d}", source=rng.choice(["google", "yelp"]), rating=rng.randint(1, 5),
+               text="Service was slow but the food was great " * rng.randint(1, 4),
+               created_at=now - timedelta(minutes=n), theme=rng.choice([None, "slow", "cold"]),
+               url="https://example.com/r")
+        for n in range(count)
+    ]
+
+
+def legacy_inventory(items):
+    """simple_api.get_inventory before the serializer module."""
+    return [
+        {
+            "id": item.id,
+            "item_id": item.item_id,
+            "status": item.status.value if hasattr(item.status, 'value') else str(item.status),
+            "notes": item.notes,
+            "expected_back": item.expected_back.isoformat() if item.expected_back else None,
+            "updated_at": item.updated_at.isoformat() if item.updated_at else None,
+            "menu_item": {
+                "item_id": item.menu_item.item_id if item.menu_item else None,
+                "name": item.menu_item.name if item.menu_item else None,
+                "price": item.menu_item.price if item.menu_item else None,
+                "allergy_flags": item.menu_item.allergy_flags if item.menu_item else None,
+                "active": item.menu_item.active if item.menu_item else None
+            } if item.menu_item else None
+        }
+        for item in items
+    ]
+
+
+def legacy_reviews(reviews):
+    """simple_api.get_reviews before the serializer module."""
+    return [
+        {
+            "review_id": review.review_id,
+            "source": review.source,
+            "rating": review.rating,
+            "text": review.text,
+            "created_at": review.created_at.isoformat() if review.created_at else None,
+            "theme": review.theme,
+            "url": review.url
+        }
+        for review in reviews
+    ]
+
+
+def fastapi_render(content) -> bytes:
+    """What FastAPI does with a returned list: jsonable_encoder, then JSONResponse.render."""
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode()
+
+
+def best_of(repeat: int, fn: Callable[[], bytes]) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    per = 10_000 / args.rows
+    print(f"encoder backend: {BACKEND}; {args.rows:,} rows, best of {args.repeat}")
+    print(f"{'shape':>10} {'before ms/10k':>14} {'after ms/10k':>13} {'speedup':>8}")
+    cases = [
+        ("inventory", synthetic_inventory(args.rows), legacy_inventory, inventory_serializer),
+        ("reviews", synthetic_reviews(args.rows), legacy_reviews, review_serializer),
+    ]
+    for name, rows, legacy, serializer in cases:
+        assert json.loads(fastapi_render(legacy(rows))) == json.loads(dumps(serializer.many(rows)))
+        before = best_of(args.repeat, lambda: fastapi_render(legacy(rows))) * per
+        after = best_of(args.repeat, lambda: dumps(serializer.many(rows))) * per
+        print(f"{name:>10} {before * 1000:>14.1f} {after * 1000:>13.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# benchmarks/bench_themes.py
+"""Review theme counting: per-keyword substring scan (before) vs compiled matcher.
+
+    python -m benchmarks.bench_themes [--reviews 1000000] [--phrases 5 200]
+
+Reviews are synthetic sentences of neutral filler with a few theme words
+mixed in (seeded, so runs are comparable). The legacy scan uses substring matching, so its counts
+can differ where a keyword sits inside a longer word; the timing is the point.
+"""
+import argparse
+import random
+import time
+from collections import Counter
+from typing import List
+
+from packages.core.services import ReviewService
+from packages.core.themes import ThemeMatcher
+
+NEUTRAL = (
+    "we came for dinner on friday with friends and ordered the tasting menu our server "
+    "brought bread then the starters arrived next we had mains and shared a bottle of "
+    "red the room was busy but table by the window felt nice would come back again "
+    "really enjoyed it though a little pricey overall good night out for family birthday "
+    "lunch brunch weekend evening booked online staff menu plate sauce side fries salad "
+    "fish chicken pasta cocktail glass dessert coffee bill tip parking street host"
+).split()
+
+THEME_WORDS = (
+    "slow cold overcooked rude loud salty bland noisy dirty wait waited late burnt "
+    "undercooked greasy cramped expensive friendly attentive fresh perfect delicious "
+    "lovely amazing ticket times expo backed service kitchen manager music patio"
+).split()
+
+
+def synthetic_reviews(count: int, seed: int = 7) -> List[str]:
+    """Neutral filler with 0-3 theme words per review, like real feedback."""
+    rng = random.Random(seed)
+    reviews = []
+    for _ in range(count):
+        words = rng.choices(NEUTRAL, k=rng.randint(8, 40))
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(THEME_WORDS))
+        reviews.append(" ".join(words).capitalize() + ".")
+    return reviews
+
+
+def synthetic_phrases(count: int, seed: int = 11) -> List[str]:
+    phrases = list(ReviewService.KEYWORDS)
+    rng = random.Random(seed)
+    while len(phrases) < count:
+        words = [rng.choice(THEME_WORDS)] + rng.choices(NEUTRAL + THEME_WORDS, k=rng.randint(0, 2))
+        phrase = " ".join(words)
+        if phrase not in phrases:
+            phrases.append(phrase)
+    return phrases[:count]
+
+
+def legacy_themes(texts: List[str], keywords: List[str]):
+    """The ReviewService.themes implementation before the compiled matcher."""
+    texts = [t.lower() for t in texts]
+    counts = Counter({k: sum(k in t for t in texts) for k in keywords})
+    return sorted([(k, v) for k, v in counts.items() if v > 0], key=lambda x: -x[1])
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reviews", type=int, default=1_000_000)
+    parser.add_argument("--phrases", type=int, nargs="+", default=[5, 200])
+    args = parser.parse_args()
+
+    print(f"generating {args.reviews:,} reviews...")
+    texts = synthetic_reviews(args.reviews)
+    print(f"{'phrases':>8} {'legacy s':>10} {'compile ms':>11} {'matcher s':>10} {'speedup':>8}")
+    for count in args.phrases:
+        phrases = synthetic_phrases(count)
+        legacy_s, _ = timed(legacy_themes, texts, phrases)
+        compile_s, matcher = timed(ThemeMatcher, phrases)
+        matcher_s, _ = timed(matcher.ranked, texts)
+        print(f"{count:>8} {legacy_s:>10.2f} {compile_s * 1000:>11.1f} {matcher_s:>10.2f} {legacy_s / matcher_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+# benchmarks/endpoints.py
+"""Endpoint latency, throughput and SQL statements per request.
+
+    python -m benchmarks.endpoints --app simple_api --url sqlite:///load.db \\
+        [--seed-reviews 100000] [--transport asgi|socket] [--concurrency 16] \\
+        [--requests 400] [--only reviews,search] [--out results.json] \\
+        [--baseline baseline.json --threshold 0.2]
+
+Drives ``simple_api.py`` or ``apps/api/main.py`` (``--app main``) against the
+database at ``--url``, one endpoint at a time: in-process through the ASGI
+interface (``asgi``, no network), or over a real socket to uvicorn running in
+a background thread (``socket``). ``--seed-reviews`` first rebuilds the
+database with ``benchmarks.synthetic``; otherwise an already seeded database
+is used as is.
+
+Per endpoint it reports p50/p95/p99 latency, requests per second, errors and
+SQL statements per request (counted on the engines, so they include any
+statements the request triggers). ``--out`` writes the run as JSON. Given
+``--baseline`` (a previous ``--out``), the run exits 1 when an endpoint's p95
+grows by more than ``--threshold`` (and at least ``--min-delta-ms``), when it
+issues more statements per request, or when it starts failing.
+"""
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import platform
+import socket
+import sys
+import threading
+import time
+
+import httpx
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+
+from packages.core import engine as db_engine
+from packages.core.database import Base, Change, Review, User, UserRole
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    path: str
+    params: Dict[str, object] = field(default_factory=dict)
+    auth: bool = False
+
+
+# {user} is filled with a staff member from the dataset
+COMMON = [
+    Endpoint("inventory", "/api/v1/inventory"),
+    Endpoint("inventory page", "/api/v1/inventory", {"limit": 50}),
+    Endpoint("menu", "/api/v1/menu"),
+    Endpoint("reviews 1d", "/api/v1/reviews", {"days": 1}),
+    Endpoint("reviews page", "/api/v1/reviews", {"days": 7, "limit": 50}),
+    Endpoint("review search", "/api/v1/reviews/search", {"q": "slow service", "limit": 20}),
+    Endpoint("review themes", "/api/v1/reviews/themes", {"days": 30}),
+    Endpoint("rating trend", "/api/v1/reviews/trends/ratings", {"days": 90}),
+    Endpoint("theme trend", "/api/v1/reviews/trends/themes", {"days": 90}),
+    Endpoint("changes", "/api/v1/changes"),
+    Endpoint("unacknowledged", "/api/v1/users/{user}/unacknowledged-changes"),
+    Endpoint("ack coverage", "/api/v1/acknowledgements/coverage"),
+    Endpoint("brief", "/api/v1/brief/today"),
+]
+SUITES: Dict[str, Tuple[str, List[Endpoint]]] = {
+    "simple_api": ("simple_api", COMMON + [Endpoint("auth me", "/api/v1/auth/me", auth=True)]),
+    "main": ("apps.api.main", COMMON + [
+        Endpoint("legacy inventory", "/inventory"),
+        Endpoint("legacy reviews", "/reviews", {"days": 7}),
+    ]),
+}
+
+
+@dataclass
+class EndpointResult:
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    rps: float
+    statements_per_request: float
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StatementCounter:
+    """Counts cursor executions on the process-wide sync and async engines."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._engines = [db_engine.get_engine(), db_engine.get_async_engine().sync_engine]
+
+    def _listener(self, *args):
+        with self._lock:
+            self.count += 1
+
+    def __enter__(self):
+        for engine in self._engines:
+            event.listen(engine, "before_cursor_execute", self._listener)
+        return self
+
+    def __exit__(self, *exc):
+        for engine in self._engines:
+            event.remove(engine, "before_cursor_execute", self._listener)
+
+
+async def measure(client: httpx.AsyncClient, endpoint: Endpoint, path: str, headers: Dict[str, str],
+                  requests: int, concurrency: int, warmup: int = 5) -> EndpointResult:
+    for _ in range(warmup):
+        await client.get(path, params=endpoint.params, headers=headers)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get(path, params=endpoint.params, headers=headers)
+            await response.aread()
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    with StatementCounter() as statements:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return EndpointResult(
+        requests=requests,
+        errors=errors,
+        p50_ms=round(percentile(latencies, 50) * 1000, 3),
+        p95_ms=round(percentile(latencies, 95) * 1000, 3),
+        p99_ms=round(percentile(latencies, 99) * 1000, 3),
+        rps=round(requests / elapsed, 1),
+        statements_per_request=round(statements.count / requests, 2),
+    )
+
+
+class SocketServer:
+    """uvicorn on an ephemeral localhost port, in a background thread."""
+
+    def __init__(self, app):
+        import uvicorn  # only needed for --transport socket
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", 0))
+        # Engines are initialized by the harness, not the app's lifespan
+        self.server = uvicorn.Server(uvicorn.Config(app, lifespan="off", log_level="warning", access_log=False))
+        self.thread = threading.Thread(target=self.server.run, kwargs={"sockets": [self.sock]}, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.sock.getsockname()
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        deadline = time.monotonic() + 10
+        while not self.server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("uvicorn did not start within 10s")
+            time.sleep(0.02)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(10)
+        self.sock.close()
+
+
+def dataset_info() -> Dict[str, object]:
+    """Sizes and ids the endpoints need, read from the seeded database."""
+    with db_engine.get_session_factory()() as session:
+        manager = session.scalar(select(User.user_id).where(User.role == UserRole.MANAGER).order_by(User.user_id))
+        staff = session.scalar(select(User.user_id).where(User.role == UserRole.STAFF).order_by(User.user_id))
+        return {
+            "reviews": session.scalar(select(func.count()).select_from(Review)),
+            "changes": session.scalar(select(func.count()).select_from(Change)),
+            "users": session.scalar(select(func.count()).select_from(User)),
+            "manager": manager,
+            "staff": staff,
+        }
+
+
+async def run_suite(app_name: str, transport: str = "asgi", requests: int = 200, concurrency: int = 8,
+                    only: Optional[List[str]] = None) -> Dict[str, object]:
+    """Benchmark every endpoint of ``app_name`` against the initialized engines."""
+    module_name, endpoints = SUITES[app_name]
+    module = importlib.import_module(module_name)
+    info = dataset_info()
+    headers = {}
+    if hasattr(module, "create_access_token") and info["manager"]:
+        token = module.create_access_token({"sub": info["manager"], "role": UserRole.MANAGER.value})
+        headers = {"Authorization": f"Bearer {token}"}
+
+    results: Dict[str, Dict[str, object]] = {}
+
+    async def run_all(client: httpx.AsyncClient):
+        for endpoint in endpoints:
+            if only and endpoint.name not in only:
+                continue
+            path = endpoint.path.format(user=info["staff"])
+            result = await measure(client, endpoint, path, headers if endpoint.auth else {}, requests, concurrency)
+            results[endpoint.name] = asdict(result)
+            print(f"{endpoint.name:>18} {result.p50_ms:>8.1f} {result.p95_ms:>8.1f} {result.p99_ms:>8.1f} "
+                  f"{result.rps:>8.1f} {result.statements_per_request:>6.1f} {result.errors:>6}", flush=True)
+
+    print(f"{'endpoint':>18} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>8} {'stmts':>6} {'errors':>6}")
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if transport == "asgi":
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=module.app),
+                                     base_url="http://bench", limits=limits, timeout=60) as client:
+            await run_all(client)
+    else:
+        with SocketServer(module.app) as server:
+            async with httpx.AsyncClient(base_url=server.base_url, limits=limits, timeout=60) as client:
+                await run_all(client)
+
+    return {
+        "meta": {
+            "app": app_name,
+            "transport": transport,
+            "requests": requests,
+            "concurrency": concurrency,
+            "database": db_engine.get_engine().dialect.name,
+            "dataset": {k: info[k] for k in ("reviews", "changes", "users")},
+            "python": platform.python_version(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "endpoints": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.2, min_delta_ms: float = 1.0) -> List[str]:
+    """Regressions of ``current`` against ``baseline`` (endpoints missing from either are skipped)."""
+    regressions = []
+    for name, now in current["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if before is None:
+            continue
+        if now["p95_ms"] > before["p95_ms"] * (1 + threshold) and now["p95_ms"] - before["p95_ms"] >= min_delta_ms:
+            regressions.append(f"{name}: p95 {before['p95_ms']:.1f}ms -> {now['p95_ms']:.1f}ms")
+        if now["statements_per_request"] > before["statements_per_request"] + 0.5:
+            regressions.append(f"{name}: SQL statements/request "
+                               f"{before['statements_per_request']:g} -> {now['statements_per_request']:g}")
+        if now["errors"] and not before["errors"]:
+            regressions.append(f"{name}: {now['errors']} errors (baseline had none)")
+    return regressions
+
+
+def async_url(url: str) -> str:
+    drivers = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+    parsed = make_url(url)
+    return parsed.set(drivername=drivers.get(parsed.get_backend_name(), parsed.drivername)).render_as_string(
+        hide_password=False
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", choices=sorted(SUITES), default="simple_api")
+    parser.add_argument("--url", required=True, help="database to benchmark against")
+    parser.add_argument("--seed-reviews", type=int, default=None,
+                        help="drop, recreate and seed the database with this many reviews first")
+    parser.add_argument("--transport", choices=["asgi", "socket"], default="asgi")
+    parser.add_argument("--requests", type=int, default=200, help="per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--only", default=None, help="comma-separated endpoint names")
+    parser.add_argument("--out", default=None, help="write results JSON here")
+    parser.add_argument("--baseline", default=None, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p95 growth (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore p95 changes smaller than this")
+    args = parser.parse_args()
+
+    engine = db_engine.init_engine(args.url)
+    db_engine.init_async_engine(async_url(args.url))
+    if args.seed_reviews is not None:
+        from benchmarks.synthetic import SeedConfig, load
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        counts = load(engine, SeedConfig(reviews=args.seed_reviews, end=date.today()))
+        print("seeded " + ", ".join(f"{table} {rows:,}" for table, rows in counts.items()))
+
+    only = [name.strip() for name in args.only.split(",")] if args.only else None
+    try:
+        results = asyncio.run(run_suite(args.app, args.transport, args.requests, args.concurrency, only))
+    finally:
+        asyncio.run(db_engine.dispose_async_engine())
+        db_engine.dispose_engine()
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold, args.min_delta_ms)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+# benchmarks/synthetic.py
+"""Production-scale synthetic dataset for load tests and endpoint benchmarks.
+
+    python -m benchmarks.synthetic --url postgresql://.../scratch --reset \\
+        [--locations 20] [--menu-size 120] [--staff 40] [--years 3] \\
+        [--reviews 10000000] [--seed 7] [--end 2026-10-18] [--tag-themes]
+
+Rows are generated lazily in batches and bulk-loaded table by table: with
+``COPY ... FROM STDIN`` on Postgres (psycopg2) and ``executemany`` inserts
+elsewhere. Every table draws from its own RNG seeded from ``--seed``, so a
+given seed and ``--end`` always produce the same rows.
+
+The schema has no location column, so a location is an id prefix
+(``L03-...``) on its menu items and staff. Inventory is one current row per
+item; there is no history table to fill.
+
+``--reset`` drops and recreates every table first; only point it at a
+scratch database. Without it, the tables must be empty.
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Dict, Iterator, List, Optional
+import argparse
+import csv
+import io
+import itertools
+import random
+import time as timer
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from packages.core.database import (
+    Acknowledgement, Base, Change, Inventory, Menu, Review, Shift, StockStatus, User, UserRole
+)
+
+BATCH_SIZE = 10_000
+
+CATEGORIES = {
+    "APP": ["Calamari", "Wings", "Bruschetta", "Burrata", "Meatballs", "Dumplings", "Croquettes"],
+    "SAL": ["Caesar", "Garden Salad", "Cobb", "Greek Salad", "Beet Salad"],
+    "MAIN": ["Branzino", "Ribeye", "Roast Chicken", "Short Rib", "Salmon", "Risotto", "Pork Chop",
+             "Mushroom Pappardelle", "Burger", "Lamb Shank"],
+    "DES": ["Tiramisu", "Cheesecake", "Creme Brulee", "Gelato", "Chocolate Torte"],
+    "WINE": ["Assyrtiko", "Pinot Noir", "Chardonnay", "Rioja", "Prosecco", "Malbec"],
+}
+ALLERGENS = [None, '["gluten"]', '["dairy"]', '["nuts"]', '["shellfish"]', '["gluten", "dairy"]']
+SOURCES = ["google"] * 5 + ["yelp"] * 3 + ["opentable", "internal"]
+GOOD = ["the {dish} was perfect", "friendly and attentive server", "great wine list", "lovely patio",
+        "best {dish} in town", "dessert was the highlight", "will be back"]
+BAD = ["service was slow", "the {dish} arrived cold", "{dish} was overcooked", "rude host at the door",
+       "music too loud to talk", "waited forever for a table", "overpriced for the portion"]
+CHANGE_TITLES = ["New {dish} special", "{dish} recipe update", "Allergen update for {dish}",
+                 "Patio closed tonight", "New POS modifiers", "Section changes for Friday", "Wine pairing for {dish}"]
+SHIFT_ROLES = ["server", "line cook", "host", "bartender", "dishwasher", "expo"]
+SHIFT_STARTS = [time(7), time(10), time(11), time(16), time(17)]
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    locations: int = 5
+    menu_size: int = 60  # items per location
+    staff: int = 30  # per location, plus one manager
+    years: float = 2.0
+    reviews: int = 100_000  # across all locations
+    changes_per_week: int = 3  # per location
+    shifts_per_day: int = 12  # per location
+    ack_rate: float = 0.8  # share of a location's staff acknowledging each change
+    seed: int = 7
+    end: date = field(default_factory=date.today)
+
+    @property
+    def days(self) -> int:
+        return max(1, int(self.years * 365))
+
+    @property
+    def end_at(self) -> datetime:
+        return datetime.combine(self.end, time(23, 0))
+
+
+def _rng(config: SeedConfig, table: str) -> random.Random:
+    return random.Random(f"{config.seed}:{table}")
+
+
+def _location(n: int) -> str:
+    return f"L{n:02d}"
+
+
+def _user_id(location: int, n: int) -> str:
+    return f"{_location(location)}-U{n:03d}"
+
+
+def _dishes(config: SeedConfig) -> List[str]:
+    names = [name for names in CATEGORIES.values() for name in names]
+    return [names[n % len(names)] for n in range(config.menu_size)]
+
+
+def users(config: SeedConfig) -> Iterator[dict]:
+    for location in range(config.locations):
+        for n in range(config.staff + 1):
+            manager = n == config.staff
+            yield {
+                "user_id": _user_id(location, n), "role": UserRole.MANAGER if manager else UserRole.STAFF,
+                "name": f"{'Manager' if manager else 'Staff'} {_location(location)}-{n}",
+                "email": f"{_location(location).lower()}.u{n}@example.com", "is_active": True,
+            }
+
+
+def menus(config: SeedConfig) -> Iterator[dict]:
+    rng = _rng(config, "menus")
+    categories = list(CATEGORIES)
+    for location in range(config.locations):
+        for n, dish in enumerate(_dishes(config)):
+            category = categories[n % len(categories)]
+            yield {
+                "item_id": f"{_location(location)}-{category}-{n:04d}", "name": dish,
+                "price": rng.randrange(700, 5200, 50), "allergy_flags": rng.choice(ALLERGENS),
+                "active": rng.random() > 0.05, "created_at": config.end_at - timedelta(days=config.days),
+                "updated_at": config.end_at - timedelta(days=rng.randint(0, 30)),
+            }
+
+
+def inventory(config: SeedConfig) -> Iterator[dict]:
+    rng = _rng(config, "inventory")
+    # Realistic skew: almost everything is in stock
+    statuses = [StockStatus.OK] * 46 + [StockStatus.LOW] * 3 + [StockStatus.EIGHTY_SIX]
+    for item in menus(config):
+        status = rng.choice(statuses)
+        yield {
+            "item_id": item["item_id"], "status": status,
+            "notes": {StockStatus.OK: None, StockStatus.LOW: "Running low",
+                      StockStatus.EIGHTY_SIX: "Supplier delay"}[status],
+            "expected_back": config.end + timedelta(days=rng.randint(1, 3)) if status != StockStatus.OK else None,
+            "updated_at": config.end_at - timedelta(minutes=rng.randint(0, 7 * 24 * 60)),
+        }
+
+
+def reviews(config: SeedConfig) -> Iterator[dict]:
+    rng = _rng(config, "reviews")
+    dishes = _dishes(config)
+    span = config.days * 24 * 60
+    for n in range(config.reviews):
+        rating = rng.choices([1, 2, 3, 4, 5], weights=[6, 8, 14, 32, 40])[0]
+        pool = BAD if rating <= 2 else GOOD if rating >= 4 else BAD + GOOD
+        dish = rng.choice(dishes)
+        text = ". ".join(phrase.format(dish=dish.lower()) for phrase in rng.sample(pool, rng.randint(1, 3)))
+        created = config.end_at - timedelta(minutes=rng.randint(0, span))
+        yield {
+            "review_id": f"{_location(n % config.locations)}-R{n:09d}", "source": rng.choice(SOURCES),
+            "rating": rating, "text": text.capitalize() + ".", "created_at": created,
+            "url": f"https://reviews.example.com/{n}",
+            "ingested_at": created + timedelta(minutes=rng.randint(5, 240)),
+        }
+
+
+def _change_times(config: SeedConfig) -> Iterator[tuple]:
+    """(location, change number, created_at) for every change, oldest first per location."""
+    total = int(config.days / 7 * config.changes_per_week)
+    step = timedelta(days=config.days) / max(1, total)
+    for location in range(config.locations):
+        for n in range(total):
+            yield location, n, config.end_at - timedelta(days=config.days) + step * (n + 1)
+
+
+def changes(config: SeedConfig) -> Iterator[dict]:
+    rng = _rng(config, "changes")
+    dishes = _dishes(config)
+    for location, n, created in _change_times(config):
+        yield {
+            "change_id": f"{_location(location)}-C{n:06d}",
+            "title": rng.choice(CHANGE_TITLES).format(dish=rng.choice(dishes)),
+            "detail": "See the pass for plating notes.", "effective_from": created,
+            "created_by": _user_id(location, config.staff), "created_at": created,
+            # Announcements from the last two weeks are still active
+            "is_active": created >= config.end_at - timedelta(days=14),
+        }
+
+
+def acknowledgements(config: SeedConfig) -> Iterator[dict]:
+    rng = _rng(config, "acknowledgements")
+    per_change = round(config.ack_rate * config.staff)
+    ids = itertools.count()
+    for location, n, created in _change_times(config):
+        for staff in sorted(rng.sample(range(config.staff), per_change)):
+            yield {
+                "ack_id": f"{_location(location)}-A{next(ids):09d}", "user_id": _user_id(location, staff),
+                "change_id": f"{_location(location)}-C{n:06d}",
+                "acknowledged_at": created + timedelta(minutes=rng.randint(1, 48 * 60)),
+            }
+
+
+def shifts(config: SeedConfig) -> Iterator[dict]:
+    rng = _rng(config, "shifts")
+    first = config.end - timedelta(days=config.days)
+    ids = itertools.count()
+    # A week of upcoming shifts too, for the schedule views
+    for offset in range(config.days + 7):
+        day = first + timedelta(days=offset)
+        for location in range(config.locations):
+            for _ in range(config.shifts_per_day):
+                starts = datetime.combine(day, rng.choice(SHIFT_STARTS))
+                yield {
+                    "shift_id": f"{_location(location)}-S{next(ids):09d}", "starts": starts,
+                    "ends": starts + timedelta(hours=rng.choice([4, 6, 8])), "role": rng.choice(SHIFT_ROLES),
+                    "employee": _user_id(location, rng.randrange(config.staff)),
+                    "section": rng.choice([None, "patio", "bar", "main", "private"]),
+                }
+
+
+# Load order respects foreign keys
+TABLES = [
+    (User, users), (Menu, menus), (Inventory, inventory), (Change, changes),
+    (Acknowledgement, acknowledgements), (Shift, shifts), (Review, reviews),
+]
+
+
+def _batches(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def copy_csv(table, batch: List[dict], dialect) -> io.StringIO:
+    """``batch`` as COPY CSV, values rendered as SQLAlchemy would bind them
+    (enums as their names). None is written unquoted, which COPY reads as NULL."""
+    columns = list(batch[0])
+    processors = [table.c[name].type.bind_processor(dialect) for name in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in batch:
+        writer.writerow([
+            process(row[name]) if process is not None else row[name]
+            for name, process in zip(columns, processors)
+        ])
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_batch(conn, table, batch: List[dict]) -> None:
+    columns = list(batch[0])
+    buffer = copy_csv(table, batch, conn.dialect)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
+def load(engine, config: SeedConfig, batch_size: int = BATCH_SIZE,
+         progress: Optional[Callable[[str, int], None]] = None) -> Dict[str, int]:
+    """Generate and insert every table; one transaction per table. Returns rows per table."""
+    use_copy = engine.dialect.name == "postgresql" and engine.dialect.driver == "psycopg2"
+    counts = {}
+    for model, generate in TABLES:
+        table = model.__table__
+        loaded = 0
+        with engine.begin() as conn:
+            for batch in _batches(generate(config), batch_size):
+                if use_copy:
+                    _copy_batch(conn, table, batch)
+                else:
+                    conn.execute(insert(table), batch)
+                loaded += len(batch)
+                if progress:
+                    progress(table.name, loaded)
+        counts[table.name] = loaded
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True, help="scratch database URL")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    parser.add_argument("--locations", type=int, default=SeedConfig.locations)
+    parser.add_argument("--menu-size", type=int, default=SeedConfig.menu_size)
+    parser.add_argument("--staff", type=int, default=SeedConfig.staff)
+    parser.add_argument("--years", type=float, default=SeedConfig.years)
+    parser.add_argument("--reviews", type=int, default=SeedConfig.reviews)
+    parser.add_argument("--changes-per-week", type=int, default=SeedConfig.changes_per_week)
+    parser.add_argument("--shifts-per-day", type=int, default=SeedConfig.shifts_per_day)
+    parser.add_argument("--seed", type=int, default=SeedConfig.seed)
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="last day of data (YYYY-MM-DD)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--tag-themes", action="store_true", help="run review theme tagging after loading")
+    args = parser.parse_args()
+
+    config = SeedConfig(
+        locations=args.locations, menu_size=args.menu_size, staff=args.staff, years=args.years,
+        reviews=args.reviews, changes_per_week=args.changes_per_week, shifts_per_day=args.shifts_per_day,
+        seed=args.seed, end=args.end,
+    )
+    engine = create_engine(args.url)
+    if args.reset:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    started = timer.perf_counter()
+    reported = {}
+
+    def progress(table: str, rows: int) -> None:
+        if rows - reported.get(table, 0) >= 500_000:
+            reported[table] = rows
+            print(f"  {table}: {rows:,} rows ({timer.perf_counter() - started:.0f}s)", flush=True)
+
+    counts = load(engine, config, args.batch_size, progress)
+    for table, rows in counts.items():
+        print(f"{table:>16} {rows:>12,}")
+    print(f"loaded in {timer.perf_counter() - started:.0f}s")
+
+    if args.tag_themes:
+        from packages.core.services import ReviewService
+        from packages.core.theme_tagging import tag_new_reviews
+        from packages.core.themes import get_matcher
+        with Session(engine) as session:
+            tagged = tag_new_reviews(session, get_matcher(tuple(ReviewService.KEYWORDS)))
+        print(f"tagged {tagged:,} reviews in {timer.perf_counter() - started:.0f}s total")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Add secondary indexes for hot filter columns
+
+Revision ID: 002_hot_path_indexes
+Revises: 001_initial
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_hot_path_indexes'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Inventory: brief/86 board filter on status, CSV import and menu deletes look up by item_id
+    op.create_index('ix_inventory_status', 'inventory', ['status'])
+    op.create_index('ix_inventory_item_id', 'inventory', ['item_id'])
+
+    # Reviews: every listing is a created_at window
+    op.create_index('ix_reviews_created_at', 'reviews', ['created_at'])
+
+    # Changes: only active announcements are listed, newest first
+    op.create_index(
+        'ix_changes_active_created_at', 'changes', ['created_at'],
+        postgresql_where=sa.text('is_active'),
+    )
+
+    # Acknowledgements: coverage per change and outstanding acks per user
+    op.create_index('ix_acknowledgements_change_id', 'acknowledgements', ['change_id'])
+    op.create_index('ix_acknowledgements_user_id', 'acknowledgements', ['user_id'])
+
+    # Shifts: looked up by start time window
+    op.create_index('ix_shifts_starts', 'shifts', ['starts'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_shifts_starts', table_name='shifts')
+    op.drop_index('ix_acknowledgements_user_id', table_name='acknowledgements')
+    op.drop_index('ix_acknowledgements_change_id', table_name='acknowledgements')
+    op.drop_index('ix_changes_active_created_at', table_name='changes')
+    op.drop_index('ix_reviews_created_at', table_name='reviews')
+    op.drop_index('ix_inventory_item_id', table_name='inventory')
+    op.drop_index('ix_inventory_status', table_name='inventory')
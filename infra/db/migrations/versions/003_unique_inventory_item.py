@@ -0,0 +1,30 @@
+"""Make inventory.item_id unique so the CSV import can upsert on it
+
+Revision ID: 003_unique_inventory_item
+Revises: 002_hot_path_indexes
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_unique_inventory_item'
+down_revision = '002_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The old per-line import could leave duplicates; keep the most recent row per item
+    op.execute(sa.text(
+        "DELETE FROM inventory WHERE id NOT IN "
+        "(SELECT MAX(id) FROM inventory GROUP BY item_id)"
+    ))
+    op.drop_index('ix_inventory_item_id', table_name='inventory')
+    op.create_index('ix_inventory_item_id', 'inventory', ['item_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_inventory_item_id', table_name='inventory')
+    op.create_index('ix_inventory_item_id', 'inventory', ['item_id'])
@@ -0,0 +1,46 @@
+"""Persist review themes: review_themes, a watermark table and reviews.ingested_at
+
+Revision ID: 004_review_themes
+Revises: 003_unique_inventory_item
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004_review_themes'
+down_revision = '003_unique_inventory_item'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows get the migration time, so the first tagging run covers them all
+    op.add_column('reviews', sa.Column('ingested_at', sa.DateTime(), server_default=sa.func.now(), nullable=False))
+    op.create_index('ix_reviews_ingested_at_review_id', 'reviews', ['ingested_at', 'review_id'])
+
+    op.create_table('review_themes',
+        sa.Column('review_id', sa.String(), nullable=False),
+        sa.Column('theme', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['review_id'], ['reviews.review_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('review_id', 'theme')
+    )
+    op.create_index('ix_review_themes_theme', 'review_themes', ['theme'])
+
+    op.create_table('watermarks',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('position', sa.DateTime(), nullable=True),
+        sa.Column('last_key', sa.String(), nullable=True),
+        sa.Column('version', sa.String(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('watermarks')
+    op.drop_index('ix_review_themes_theme', table_name='review_themes')
+    op.drop_table('review_themes')
+    op.drop_index('ix_reviews_ingested_at_review_id', table_name='reviews')
+    op.drop_column('reviews', 'ingested_at')
@@ -0,0 +1,34 @@
+"""Daily review rollup for rating and theme trends
+
+Revision ID: 005_review_daily_rollups
+Revises: 004_review_themes
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005_review_daily_rollups'
+down_revision = '004_review_themes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('review_daily_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('source', sa.String(), nullable=False),
+        sa.Column('rating', sa.Integer(), nullable=False),
+        sa.Column('theme', sa.String(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'source', 'rating', 'theme')
+    )
+    # The rollup is filled by the theme tagging stage; drop its watermark so
+    # the next run re-tags every review and backfills the rollup
+    op.execute("DELETE FROM review_themes")
+    op.execute("DELETE FROM watermarks WHERE name = 'review_themes'")
+
+
+def downgrade() -> None:
+    op.drop_table('review_daily_rollups')
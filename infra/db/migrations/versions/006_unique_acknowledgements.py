@@ -0,0 +1,31 @@
+"""One acknowledgement per user and change, for bulk ON CONFLICT acks
+
+Revision ID: 006_unique_acknowledgements
+Revises: 005_review_daily_rollups
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_unique_acknowledgements'
+down_revision = '005_review_daily_rollups'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Repeated taps could record the same ack twice; keep one row per pair
+    op.execute(sa.text(
+        "DELETE FROM acknowledgements WHERE ack_id NOT IN "
+        "(SELECT MIN(ack_id) FROM acknowledgements GROUP BY user_id, change_id)"
+    ))
+    # The unique index leads with user_id, so it replaces the single-column one
+    op.drop_index('ix_acknowledgements_user_id', table_name='acknowledgements')
+    op.create_index('uq_acknowledgements_user_change', 'acknowledgements', ['user_id', 'change_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_acknowledgements_user_change', table_name='acknowledgements')
+    op.create_index('ix_acknowledgements_user_id', 'acknowledgements', ['user_id'])
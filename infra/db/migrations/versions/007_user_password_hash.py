@@ -0,0 +1,23 @@
+"""Password hashes for staff login
+
+Revision ID: 007_user_password_hash
+Revises: 006_unique_acknowledgements
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_user_password_hash'
+down_revision = '006_unique_acknowledgements'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('password_hash', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'password_hash')
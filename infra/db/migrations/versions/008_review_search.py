@@ -0,0 +1,29 @@
+"""Full-text search over review text (generated tsvector + GIN)
+
+Revision ID: 008_review_search
+Revises: 007_user_password_hash
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_review_search'
+down_revision = '007_user_password_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Generated, so every insert/update path keeps it current without app code;
+    # adding it rewrites the table once to fill existing rows
+    op.execute(
+        "ALTER TABLE reviews ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(text, ''))) STORED"
+    )
+    op.execute("CREATE INDEX ix_reviews_search_vector ON reviews USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ix_reviews_search_vector")
+    op.execute("ALTER TABLE reviews DROP COLUMN search_vector")
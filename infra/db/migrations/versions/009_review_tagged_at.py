@@ -0,0 +1,36 @@
+"""Mark tagged reviews instead of resuming from an ingested_at watermark
+
+Revision ID: 009_review_tagged_at
+Revises: 008_review_search
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_review_tagged_at'
+down_revision = '008_review_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('reviews', sa.Column('tagged_at', sa.DateTime(), nullable=True))
+    # Everything up to the old watermark is already tagged and in the rollup
+    op.execute(
+        "UPDATE reviews SET tagged_at = coalesce(w.updated_at, now()) FROM watermarks w "
+        "WHERE w.name = 'review_themes' AND (reviews.ingested_at < w.position "
+        "OR (reviews.ingested_at = w.position AND reviews.review_id <= w.last_key))"
+    )
+    op.drop_index('ix_reviews_ingested_at_review_id', table_name='reviews')
+    op.create_index(
+        'ix_reviews_untagged', 'reviews', ['ingested_at', 'review_id'],
+        postgresql_where=sa.text('tagged_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_untagged', table_name='reviews')
+    op.create_index('ix_reviews_ingested_at_review_id', 'reviews', ['ingested_at', 'review_id'])
+    op.drop_column('reviews', 'tagged_at')
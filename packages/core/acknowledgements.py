@@ -0,0 +1,116 @@
+# packages/core/acknowledgements.py
+"""Staff acknowledgements of changes/announcements.
+
+At shift start the whole team acknowledges the same handful of changes at
+once, so ``record_acks`` writes a request's acks as one multi-row
+``INSERT ... ON CONFLICT (user_id, change_id) DO NOTHING``: repeats and
+concurrent double-taps are no-ops rather than errors or duplicate rows.
+
+The read side is set-based: "what has this user not acknowledged yet" is an
+anti-join (``NOT EXISTS``) against the unique ``(user_id, change_id)`` index,
+and coverage per change is one grouped count over the ``change_id`` index,
+instead of a loop over users.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import uuid
+
+from sqlalchemy import and_, exists, func, select
+from sqlalchemy.orm import Session
+
+from .database import Acknowledgement, Change, User, dialect_insert
+
+
+@dataclass
+class AckReport:
+    requested: int = 0
+    recorded: int = 0
+    skipped: int = 0  # naming an unknown user or change
+    unknown_users: List[str] = field(default_factory=list)
+    unknown_changes: List[str] = field(default_factory=list)
+
+    @property
+    def already_acknowledged(self) -> int:
+        return self.requested - self.recorded - self.skipped
+
+    def to_dict(self) -> dict:
+        return {
+            "requested": self.requested,
+            "recorded": self.recorded,
+            "already_acknowledged": self.already_acknowledged,
+            "unknown_users": self.unknown_users,
+            "unknown_changes": self.unknown_changes,
+        }
+
+
+def record_acks(session: Session, pairs: Iterable[Tuple[str, str]],
+                now: Optional[datetime] = None) -> AckReport:
+    """Insert ``(user_id, change_id)`` acks in one statement; the caller commits.
+    Pairs naming an unknown user or change are skipped and reported."""
+    # Sorted: concurrent requests take row locks in the same order
+    wanted = sorted(set(pairs))
+    report = AckReport(requested=len(wanted))
+    if not wanted:
+        return report
+
+    user_ids = {user_id for user_id, _ in wanted}
+    change_ids = {change_id for _, change_id in wanted}
+    known_users = set(session.scalars(select(User.user_id).where(User.user_id.in_(user_ids))))
+    known_changes = set(session.scalars(select(Change.change_id).where(Change.change_id.in_(change_ids))))
+    report.unknown_users = sorted(user_ids - known_users)
+    report.unknown_changes = sorted(change_ids - known_changes)
+
+    now = now or datetime.utcnow()
+    values = [
+        {"ack_id": str(uuid.uuid4()), "user_id": user_id, "change_id": change_id, "acknowledged_at": now}
+        for user_id, change_id in wanted
+        if user_id in known_users and change_id in known_changes
+    ]
+    report.skipped = len(wanted) - len(values)
+    if values:
+        stmt = dialect_insert(session, Acknowledgement).values(values).on_conflict_do_nothing(
+            index_elements=[Acknowledgement.user_id, Acknowledgement.change_id]
+        )
+        report.recorded = session.execute(stmt).rowcount
+    return report
+
+
+def unacknowledged_changes(session: Session, user_id: str) -> Sequence[Change]:
+    """Active changes ``user_id`` has not acknowledged, newest first."""
+    acked = exists().where(
+        Acknowledgement.change_id == Change.change_id, Acknowledgement.user_id == user_id
+    )
+    stmt = (
+        select(Change)
+        .where(Change.is_active == True, ~acked)
+        .order_by(Change.created_at.desc())
+    )
+    return session.scalars(stmt).all()
+
+
+def ack_coverage(session: Session) -> List[Dict]:
+    """Per active change: how many active staff acknowledged it, of how many."""
+    staff = session.scalar(select(func.count()).select_from(User).where(User.is_active == True))
+    acked = (
+        select(Acknowledgement.change_id, func.count().label("acknowledged"))
+        .join(User, and_(User.user_id == Acknowledgement.user_id, User.is_active == True))
+        .group_by(Acknowledgement.change_id)
+        .subquery()
+    )
+    stmt = (
+        select(Change.change_id, Change.title, func.coalesce(acked.c.acknowledged, 0))
+        .outerjoin(acked, acked.c.change_id == Change.change_id)
+        .where(Change.is_active == True)
+        .order_by(Change.created_at.desc())
+    )
+    return [
+        {
+            "change_id": change_id,
+            "title": title,
+            "acknowledged": count,
+            "staff": staff,
+            "coverage": round(count / staff, 3) if staff else 0.0,
+        }
+        for change_id, title, count in session.execute(stmt)
+    ]
@@ -0,0 +1,175 @@
+# packages/core/auth_cache.py
+"""Caches that keep authentication off the database on the hot path.
+
+- ``TokenCache``: LRU of verified JWTs -> claims. An entry is only served
+  before the token's ``exp``, so caching never extends a token's life; a
+  miss falls back to full signature verification.
+- ``UserCache``: short-TTL snapshots of users by id, so an authenticated
+  request does not query ``users``. Writes to a user (ORM update/delete,
+  e.g. deactivation) invalidate its entry; the TTL bounds staleness for
+  writes this process cannot see (another worker, raw SQL).
+
+Both are per process and expose hit/miss counters through ``stats()``.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from .database import User
+
+_PENDING_KEY = "auth_cache.invalidate_users"
+
+
+class _LRU:
+    """Thread-safe LRU with per-entry expiry and hit/miss counters."""
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.time):
+        self.maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._data[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class TokenCache(_LRU):
+    def get_claims(self, token: str) -> Optional[Dict[str, Any]]:
+        return self.get(token)
+
+    def put_claims(self, token: str, claims: Dict[str, Any], exp: Optional[float]) -> None:
+        """Remember verified ``claims`` until the token's ``exp`` (tokens
+        without one are not cached: there is no safe expiry)."""
+        if exp is not None and exp > self._clock():
+            self.put(token, claims, float(exp))
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """Read-only snapshot of the ``User`` columns auth needs."""
+    user_id: str
+    role: Any
+    name: str
+    email: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        return cls(user.user_id, user.role, user.name, user.email, bool(user.is_active))
+
+
+class UserCache(_LRU):
+    def __init__(self, ttl: float = 30.0, maxsize: int = 5000, clock: Callable[[], float] = time.time):
+        super().__init__(maxsize, clock)
+        self.ttl = ttl
+
+    def load(self, user_id: str, fetch: Callable[[str], Optional[User]]) -> Optional[CachedUser]:
+        """Cached snapshot of ``user_id``, calling ``fetch`` on a miss. Unknown
+        users are not cached, so a newly created user is visible at once."""
+        cached = self.get(user_id)
+        if cached is not None:
+            return cached
+        user = fetch(user_id)
+        if user is None:
+            return None
+        snapshot = CachedUser.from_user(user)
+        self.put(user_id, snapshot, self._clock() + self.ttl)
+        return snapshot
+
+    def invalidate(self, user_id: str) -> None:
+        self.pop(user_id)
+
+
+_token_cache: Optional[TokenCache] = None
+_user_cache: Optional[UserCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """Process-wide verified-token cache (AUTH_TOKEN_CACHE_SIZE entries)."""
+    global _token_cache
+    with _cache_lock:
+        if _token_cache is None:
+            _token_cache = TokenCache(int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000")))
+        return _token_cache
+
+
+def get_user_cache() -> UserCache:
+    """Process-wide user cache (USER_CACHE_TTL seconds, USER_CACHE_SIZE entries)."""
+    global _user_cache
+    with _cache_lock:
+        if _user_cache is None:
+            _user_cache = UserCache(
+                ttl=float(os.getenv("USER_CACHE_TTL", "30")),
+                maxsize=int(os.getenv("USER_CACHE_SIZE", "5000")),
+            )
+        return _user_cache
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    get_user_cache().invalidate(target.user_id)
+    # Again after commit: a reader between this flush and the commit may
+    # have re-cached the old row
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        get_user_cache().invalidate(user_id)
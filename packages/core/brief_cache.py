@@ -0,0 +1,146 @@
+# packages/core/brief_cache.py
+"""Snapshot cache for the rendered pre-shift brief.
+
+Every tablet reads the brief at shift start, but it only changes when
+inventory, menu, reviews or changes are written. The serialized brief is
+cached with a TTL and an ETag; write endpoints call ``invalidate()``.
+
+Invalidation bumps a generation counter rather than deleting entries: a
+reader that loaded the brief before a write stores it under the old
+generation, so it can never be served after the write.
+
+The default backend is in-process (per worker). Set BRIEF_CACHE_BACKEND=redis
+(with REDIS_URL) to share snapshots and invalidations across workers; any
+client with redis-py's get/set/incr/delete methods works.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Optional, Tuple
+import hashlib
+import os
+import threading
+import time
+
+GENERATION_KEY = "brief:generation"
+
+
+@dataclass(frozen=True)
+class CachedBrief:
+    body: bytes
+    etag: str
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """True if an If-None-Match header already names this snapshot."""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or self.etag in candidates or f"W/{self.etag}" in candidates
+
+
+class InMemoryBackend:
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        with self._lock:
+            expires_at = self._clock() + ex if ex else None
+            self._data[key] = (value, expires_at)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._data.get(key, (b"0", None))[0]) + 1
+            self._data[key] = (str(value).encode(), None)
+            return value
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class RedisBackend:
+    """Thin adapter so a redis-py client (or a compatible fake) can be used."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self.client.set(key, value, ex=ex)
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(key)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+
+class BriefCache:
+    def __init__(self, backend=None, ttl: int = 60, today: Callable[[], date] = date.today):
+        self.backend = backend or InMemoryBackend()
+        self.ttl = ttl
+        self._today = today
+
+    def generation(self) -> int:
+        value = self.backend.get(GENERATION_KEY)
+        return int(value) if value is not None else 0
+
+    def _key(self, generation: int) -> str:
+        return f"brief:{self._today().isoformat()}:{generation}"
+
+    def get(self) -> Tuple[Optional[CachedBrief], int]:
+        """Return the current snapshot (or None) and the generation it belongs to.
+
+        On a miss, pass the returned generation to ``put`` once the brief has
+        been rebuilt.
+        """
+        generation = self.generation()
+        raw = self.backend.get(self._key(generation))
+        if raw is None:
+            return None, generation
+        etag, _, body = raw.partition(b"\n")
+        return CachedBrief(body=body, etag=etag.decode()), generation
+
+    def put(self, body: bytes, generation: int, fingerprint: Optional[bytes] = None) -> CachedBrief:
+        """Store a rebuilt brief. ``fingerprint`` is what the ETag is derived
+        from; pass the body minus volatile fields (generated_at) so a rebuild
+        after TTL expiry of an unchanged brief keeps its ETag."""
+        digest = hashlib.sha256(fingerprint if fingerprint is not None else body).hexdigest()
+        etag = '"' + digest[:32] + '"'
+        self.backend.set(self._key(generation), etag.encode() + b"\n" + body, ex=self.ttl)
+        return CachedBrief(body=body, etag=etag)
+
+    def invalidate(self) -> None:
+        self.backend.incr(GENERATION_KEY)
+
+
+_cache: Optional[BriefCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_brief_cache() -> BriefCache:
+    """Process-wide cache configured from BRIEF_CACHE_BACKEND/BRIEF_CACHE_TTL."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            ttl = int(os.getenv("BRIEF_CACHE_TTL", "60"))
+            backend = None
+            if os.getenv("BRIEF_CACHE_BACKEND", "memory").lower() == "redis":
+                import redis
+                backend = RedisBackend(redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379")))
+            _cache = BriefCache(backend, ttl=ttl)
+        return _cache
@@ -0,0 +1,66 @@
+# packages/core/brief_html.py
+"""HTML for the pre-shift brief, rendered from a precompiled Jinja template.
+
+The template and stylesheet are loaded once per process; Jinja compiles the
+template to Python bytecode on first use and autoescapes every field, so
+review text or notes containing markup cannot break the document.
+"""
+from datetime import datetime, date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+@lru_cache(maxsize=4096)
+def _format_iso(value: str) -> str:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return value
+
+
+def short_datetime(value: Union[str, datetime, None]) -> str:
+    """Format a timestamp as 'YYYY-MM-DD HH:MM'; accepts datetimes or ISO strings."""
+    if not value:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M')
+    return _format_iso(value)
+
+
+def stars(rating: int) -> str:
+    return "★" * rating + "☆" * (5 - rating)
+
+
+@lru_cache(maxsize=1)
+def get_environment() -> Environment:
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
+    )
+    env.filters["short_datetime"] = short_datetime
+    env.filters["stars"] = stars
+    return env
+
+
+@lru_cache(maxsize=1)
+def get_brief_css() -> str:
+    return (TEMPLATE_DIR / "brief.css").read_text(encoding="utf-8")
+
+
+def render_brief_html(brief_data: Dict[str, Any]) -> str:
+    """Render the brief document for ``brief_data`` (see PDFService.generate_brief_pdf)."""
+    template = get_environment().get_template("brief.html")
+    return template.render(
+        date=brief_data.get('date', date.today().strftime('%Y-%m-%d')),
+        generated_at=brief_data.get('generated_at', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+        eighty_six_items=brief_data.get('eighty_six_items', []),
+        low_stock_items=brief_data.get('low_stock_items', []),
+        recent_reviews=brief_data.get('recent_reviews', []),
+        changes=brief_data.get('changes', []),
+    )
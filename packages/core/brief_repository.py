@@ -0,0 +1,86 @@
+# packages/core/brief_repository.py
+"""Data access for the pre-shift brief.
+
+The brief used to issue one query per section plus a lazy ``menu_item`` load
+per inventory row. ``BriefRepository.load`` fetches everything in a fixed
+number of statements regardless of inventory size:
+
+1. 86'd and low inventory rows joined to their menu rows (split in Python)
+2. reviews from the last ``REVIEW_WINDOW_DAYS`` days
+3. active changes
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, joinedload
+
+from .database import Inventory, Review, Change, StockStatus
+
+
+@dataclass
+class BriefSnapshot:
+    eighty_six_items: List[Inventory] = field(default_factory=list)
+    low_stock_items: List[Inventory] = field(default_factory=list)
+    recent_reviews: List[Review] = field(default_factory=list)
+    changes: List[Change] = field(default_factory=list)
+    statement_count: int = 0
+
+
+@contextmanager
+def count_statements(session: Session):
+    """Count SQL statements executed on the session's connection."""
+    counter = {"count": 0}
+
+    def before_cursor_execute(*args):
+        counter["count"] += 1
+
+    connection = session.connection()
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+class BriefRepository:
+    REVIEW_WINDOW_DAYS = 7
+    MAX_STATEMENTS = 3
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def load(self, now: Optional[datetime] = None) -> BriefSnapshot:
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=self.REVIEW_WINDOW_DAYS)
+        snapshot = BriefSnapshot()
+
+        with count_statements(self.session) as counter:
+            items = self.session.execute(
+                select(Inventory)
+                .options(joinedload(Inventory.menu_item))
+                .where(Inventory.status.in_([StockStatus.EIGHTY_SIX, StockStatus.LOW]))
+                .order_by(Inventory.id)
+            ).scalars().all()
+            for item in items:
+                if item.status == StockStatus.EIGHTY_SIX:
+                    snapshot.eighty_six_items.append(item)
+                else:
+                    snapshot.low_stock_items.append(item)
+
+            snapshot.recent_reviews = self.session.execute(
+                select(Review).where(Review.created_at >= cutoff)
+            ).scalars().all()
+            snapshot.changes = self.session.execute(
+                select(Change).where(Change.is_active == True)
+            ).scalars().all()
+
+        snapshot.statement_count = counter["count"]
+        return snapshot
+
+
+def load_brief(session: Session) -> BriefSnapshot:
+    """``run_sync`` entry point for AsyncSession callers."""
+    return BriefRepository(session).load()
@@ -0,0 +1,92 @@
+# packages/core/data_export.py
+"""Streaming export of menus, inventory, reviews and changes.
+
+Rows are read with ``yield_per`` (a server-side cursor on Postgres) and
+encoded a batch at a time, so memory stays flat no matter how many years of
+reviews are exported. Two formats:
+
+- ``json``: the same document shape the admin export always produced,
+  written incrementally
+- ``ndjson``: one ``{"table": ..., "data": {...}}`` object per line
+"""
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+import zlib
+
+from sqlalchemy import select
+
+from .database import Menu, Inventory, Review, Change
+from .serializers import Serializer, change_serializer, dumps, inventory_serializer, menu_serializer, review_serializer
+
+BATCH_SIZE = 1000
+FLUSH_BYTES = 64 * 1024
+
+
+# Inventory rows are exported flat, without the joined menu item
+_inventory_flat = Serializer(Inventory, inventory_serializer.fields)
+
+EXPORT_TABLES = (
+    ("menus", Menu, menu_serializer),
+    ("inventory", Inventory, _inventory_flat),
+    ("reviews", Review, review_serializer),
+    ("changes", Change, change_serializer),
+)
+
+
+def _iter_rows(session_factory: Callable, model, batch_size: int) -> Iterator:
+    session = session_factory()
+    try:
+        # The identity map holds rows weakly, so encoded rows are freed as we go
+        result = session.execute(select(model).execution_options(yield_per=batch_size))
+        yield from result.scalars()
+    finally:
+        session.close()
+
+
+def _buffered(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    buffer, size = [], 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= FLUSH_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _json_pieces(session_factory: Callable, batch_size: int) -> Iterator[bytes]:
+    total = 0
+    yield b"{"
+    for index, (name, model, serialize) in enumerate(EXPORT_TABLES):
+        yield f'{"," if index else ""}"{name}":['.encode()
+        for count, row in enumerate(_iter_rows(session_factory, model, batch_size)):
+            if count:
+                yield b","
+            yield dumps(serialize(row))
+            total += 1
+        yield b"]"
+    yield f',"exported_at":"{datetime.utcnow().isoformat()}","total_records":{total}}}'.encode()
+
+
+def _ndjson_pieces(session_factory: Callable, batch_size: int) -> Iterator[bytes]:
+    for name, model, serialize in EXPORT_TABLES:
+        for row in _iter_rows(session_factory, model, batch_size):
+            yield dumps({"table": name, "data": serialize(row)}) + b"\n"
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(session_factory: Callable, fmt: str = "json", compress: bool = False,
+                  batch_size: int = BATCH_SIZE) -> Iterator[bytes]:
+    """Yield the export as byte chunks; ``fmt`` is ``json`` or ``ndjson``."""
+    pieces = _ndjson_pieces if fmt == "ndjson" else _json_pieces
+    chunks = _buffered(pieces(session_factory, batch_size))
+    return gzip_stream(chunks) if compress else chunks
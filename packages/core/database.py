@@ -1,5 +1,5 @@
 # packages/core/database.py
-from sqlalchemy import create_engine, Column, String, Integer, DateTime, Date, Boolean, Text, ForeignKey, Enum
+from sqlalchemy import create_engine, event, Column, String, Integer, DateTime, Date, Boolean, Text, ForeignKey, Enum, Index, text, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -37,8 +37,9 @@ class Inventory(Base):
     __tablename__ = "inventory"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    item_id = Column(String, ForeignKey("menus.item_id"), nullable=False)
-    status = Column(Enum(StockStatus), nullable=False)
+    # One stock row per menu item; the CSV import upserts on it
+    item_id = Column(String, ForeignKey("menus.item_id"), nullable=False, index=True, unique=True)
+    status = Column(Enum(StockStatus), nullable=False, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     notes = Column(Text)
     expected_back = Column(Date)
@@ -48,17 +49,102 @@ class Inventory(Base):
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Theme tagging's work queue: only reviews not tagged yet, in ingest order
+        Index(
+            "ix_reviews_untagged", "ingested_at", "review_id",
+            postgresql_where=text("tagged_at IS NULL"), sqlite_where=text("tagged_at IS NULL"),
+        ),
+    )
     
     review_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     source = Column(String, nullable=False)  # "google", "yelp", etc.
     rating = Column(Integer, nullable=False)
     text = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    theme = Column(String)  # Extracted theme from sentiment analysis
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    theme = Column(String)  # Primary theme (first matching phrase), see review_themes for all
     url = Column(String)
+    # When the row reached our database; created_at is the source's timestamp
+    ingested_at = Column(DateTime, default=datetime.utcnow, server_default=func.now(), nullable=False)
+    # Set by theme tagging in the transaction that adds the review to the rollup
+    tagged_at = Column(DateTime)
+    
+    themes = relationship("ReviewTheme", back_populates="review", cascade="all, delete-orphan", passive_deletes=True)
+
+# Full-text index over reviews.text (queried by core.review_search). It is not
+# a mapped column: Postgres keeps a generated tsvector with a GIN index (see
+# migration 008), SQLite an external-content FTS5 table synced by triggers.
+REVIEW_SEARCH_CONFIG = "english"
+REVIEW_SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE reviews ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('{REVIEW_SEARCH_CONFIG}', coalesce(text, ''))) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_reviews_search_vector ON reviews USING GIN (search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5("
+        "text, content='reviews', content_rowid='rowid', tokenize='porter unicode61')",
+        "CREATE TRIGGER IF NOT EXISTS reviews_fts_ai AFTER INSERT ON reviews BEGIN "
+        "INSERT INTO reviews_fts(rowid, text) VALUES (new.rowid, new.text); END",
+        "CREATE TRIGGER IF NOT EXISTS reviews_fts_ad AFTER DELETE ON reviews BEGIN "
+        "INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.rowid, old.text); END",
+        "CREATE TRIGGER IF NOT EXISTS reviews_fts_au AFTER UPDATE OF text ON reviews BEGIN "
+        "INSERT INTO reviews_fts(reviews_fts, rowid, text) VALUES ('delete', old.rowid, old.text); "
+        "INSERT INTO reviews_fts(rowid, text) VALUES (new.rowid, new.text); END",
+        "INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')",
+    ],
+}
+
+@event.listens_for(Review.__table__, "after_create")
+def _create_review_search(target, connection, **kw):
+    for statement in REVIEW_SEARCH_DDL.get(connection.dialect.name, []):
+        connection.exec_driver_sql(statement)
+
+@event.listens_for(Review.__table__, "before_drop")
+def _drop_review_search(target, connection, **kw):
+    # The FTS5 table would outlive reviews (the triggers go with it)
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("DROP TABLE IF EXISTS reviews_fts")
+
+class ReviewTheme(Base):
+    __tablename__ = "review_themes"
+    
+    review_id = Column(String, ForeignKey("reviews.review_id", ondelete="CASCADE"), primary_key=True)
+    theme = Column(String, primary_key=True, index=True)
+    
+    # Relationships
+    review = relationship("Review", back_populates="themes")
+
+class ReviewDailyRollup(Base):
+    """Reviews per day x source x rating x theme; theme '' counts every review."""
+    __tablename__ = "review_daily_rollups"
+    
+    day = Column(Date, primary_key=True)
+    source = Column(String, primary_key=True)
+    rating = Column(Integer, primary_key=True)
+    theme = Column(String, primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+
+class Watermark(Base):
+    """Resume point for an incremental stage: the last (position, key) processed."""
+    __tablename__ = "watermarks"
+    
+    name = Column(String, primary_key=True)
+    position = Column(DateTime)
+    last_key = Column(String)
+    version = Column(String)  # Stage configuration the watermark is valid for
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
 class Change(Base):
     __tablename__ = "changes"
+    __table_args__ = (
+        # Only active announcements are ever listed; keep the index to those rows
+        Index(
+            "ix_changes_active_created_at", "created_at",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
     
     change_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String, nullable=False)
@@ -76,7 +162,7 @@ class Shift(Base):
     __tablename__ = "shifts"
     
     shift_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    starts = Column(DateTime, nullable=False)
+    starts = Column(DateTime, nullable=False, index=True)
     ends = Column(DateTime, nullable=False)
     role = Column(String, nullable=False)
     employee = Column(String, ForeignKey("users.user_id"), nullable=False)
@@ -94,6 +180,7 @@ class User(Base):
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False)
     phone = Column(String)
+    password_hash = Column(String)  # bcrypt, see core.passwords; NULL = no login
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
@@ -105,16 +192,32 @@ class User(Base):
 
 class Acknowledgement(Base):
     __tablename__ = "acknowledgements"
+    __table_args__ = (
+        # One ack per user and change (bulk acks upsert on it); also serves the
+        # per-user anti-join, so user_id needs no index of its own
+        Index("uq_acknowledgements_user_change", "user_id", "change_id", unique=True),
+    )
     
     ack_id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.user_id"), nullable=False)
-    change_id = Column(String, ForeignKey("changes.change_id"), nullable=False)
+    change_id = Column(String, ForeignKey("changes.change_id"), nullable=False, index=True)
     acknowledged_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
     user = relationship("User", back_populates="acknowledgements")
     change = relationship("Change", back_populates="acknowledgements")
 
+def dialect_insert(session, model):
+    """``insert(model)`` for the session's dialect, with ``on_conflict_*`` support."""
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect}")
+    return insert(model)
+
 # Database connection setup
 def get_database_url():
     import os
@@ -129,16 +232,25 @@ def get_database_url():
     
     return f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
 
+def get_async_database_url():
+    return get_database_url().replace("postgresql://", "postgresql+asyncpg://", 1)
+
 def create_engine_and_session():
-    engine = create_engine(get_database_url())
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return engine, SessionLocal
+    """Return the process-wide engine and session factory (see packages.core.engine)"""
+    from .engine import init_engine, get_session_factory
+    return init_engine(), get_session_factory()
 
 def get_db():
-    """Dependency to get database session"""
-    engine, SessionLocal = create_engine_and_session()
-    db = SessionLocal()
+    """Dependency to get a database session from the shared connection pool"""
+    from .engine import get_session_factory
+    db = get_session_factory()()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """Dependency to get an AsyncSession from the shared async connection pool"""
+    from .engine import get_async_session_factory
+    async with get_async_session_factory()() as db:
+        yield db
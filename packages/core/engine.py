@@ -0,0 +1,199 @@
+# packages/core/engine.py
+"""Process-wide SQLAlchemy engines and session factories.
+
+The engine (and its connection pool) is created once per process by
+``init_engine`` -- normally from the API startup hook -- and released by
+``dispose_engine`` on shutdown. ``get_engine``/``get_session_factory`` fall
+back to lazy initialisation for callers outside an app lifecycle (scripts,
+the worker, tests).
+
+``init_async_engine`` and friends are the asyncio counterpart (asyncpg in
+production, aiosqlite in tests) used by the async read endpoints.
+"""
+from dataclasses import dataclass, asdict
+from typing import Optional
+import os
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800  # seconds; stay under server/LB idle timeouts
+    pool_pre_ping: bool = True
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_pool_settings() -> PoolSettings:
+    """Read pool sizing from the environment (DB_POOL_*)."""
+    defaults = PoolSettings()
+    return PoolSettings(
+        pool_size=int(os.getenv("DB_POOL_SIZE", defaults.pool_size)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", defaults.max_overflow)),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", defaults.pool_timeout)),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", defaults.pool_recycle)),
+        pool_pre_ping=_env_bool("DB_POOL_PRE_PING", defaults.pool_pre_ping),
+    )
+
+
+_lock = threading.Lock()
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_settings: Optional[PoolSettings] = None
+_counters = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def _engine_kwargs(url: str, settings: PoolSettings) -> dict:
+    if url.startswith("sqlite"):
+        # SQLite is only used for local tests; pool sizing does not apply.
+        kwargs = {"connect_args": {"check_same_thread": False}}
+        if make_url(url).database in (None, "", ":memory:"):
+            kwargs["poolclass"] = StaticPool
+        return kwargs
+    return {
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout": settings.pool_timeout,
+        "pool_recycle": settings.pool_recycle,
+        "pool_pre_ping": settings.pool_pre_ping,
+    }
+
+
+def _count(name: str):
+    def listener(*args):
+        _counters[name] += 1
+    return listener
+
+
+def _instrument(engine: Engine, name: str) -> None:
+    from .metrics import get_metrics
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.instrument_engine(engine, name)
+
+
+def init_engine(url: Optional[str] = None, settings: Optional[PoolSettings] = None) -> Engine:
+    """Create the process-wide engine if it does not exist yet and return it."""
+    global _engine, _session_factory, _settings
+    with _lock:
+        if _engine is not None:
+            return _engine
+        if url is None:
+            from .database import get_database_url
+            url = get_database_url()
+        settings = settings or get_pool_settings()
+
+        engine = create_engine(url, **_engine_kwargs(url, settings))
+        event.listen(engine, "connect", _count("connects"))
+        event.listen(engine, "checkout", _count("checkouts"))
+        event.listen(engine, "checkin", _count("checkins"))
+        event.listen(engine, "invalidate", _count("invalidations"))
+        _instrument(engine, "sync")
+
+        _engine = engine
+        _settings = settings
+        _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        return engine
+
+
+def dispose_engine() -> None:
+    """Close all pooled connections and forget the engine."""
+    global _engine, _session_factory, _settings
+    with _lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _session_factory = None
+        _settings = None
+        for key in _counters:
+            _counters[key] = 0
+
+
+def get_engine() -> Engine:
+    return _engine if _engine is not None else init_engine()
+
+
+def get_session_factory() -> sessionmaker:
+    if _session_factory is None:
+        init_engine()
+    return _session_factory
+
+
+def init_async_engine(url: Optional[str] = None, settings: Optional[PoolSettings] = None):
+    """Create the process-wide AsyncEngine if it does not exist yet and return it."""
+    global _async_engine, _async_session_factory
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    with _lock:
+        if _async_engine is not None:
+            return _async_engine
+        if url is None:
+            from .database import get_async_database_url
+            url = get_async_database_url()
+        settings = settings or get_pool_settings()
+
+        _async_engine = create_async_engine(url, **_engine_kwargs(url, settings))
+        _instrument(_async_engine.sync_engine, "async")
+        # Objects are read after the session closes (response serialization),
+        # where an async session cannot lazily refresh them.
+        _async_session_factory = async_sessionmaker(
+            _async_engine, autoflush=False, expire_on_commit=False
+        )
+        return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections and forget the async engine."""
+    global _async_engine, _async_session_factory
+    with _lock:
+        engine = _async_engine
+        _async_engine = None
+        _async_session_factory = None
+    if engine is not None:
+        await engine.dispose()
+
+
+def get_async_engine():
+    return _async_engine if _async_engine is not None else init_async_engine()
+
+
+def get_async_session_factory():
+    if _async_session_factory is None:
+        init_async_engine()
+    return _async_session_factory
+
+
+def pool_stats() -> dict:
+    """Current pool occupancy plus lifetime counters, for sizing the pool."""
+    if _engine is None:
+        return {"initialized": False}
+
+    pool = _engine.pool
+    stats = {
+        "initialized": True,
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+        "settings": asdict(_settings) if _settings else None,
+    }
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    stats.update(_counters)
+    return stats
@@ -0,0 +1,168 @@
+# packages/core/http_cache.py
+"""Conditional GET for read endpoints, driven by per-table version counters.
+
+Write paths call ``TableVersions.bump(table, ...)`` after committing (next to
+``brief_cache.invalidate()``). ``ConditionalGetMiddleware`` derives a GET's
+ETag from the request URL and the versions of the tables the route reads, so
+it can answer ``If-None-Match`` / ``If-Modified-Since`` with a 304 before the
+endpoint runs any query. Versions are read before the response is built: a
+write that lands mid-request only makes the tag older, never newer than the
+data, so a client can miss at most one refetch, not a change.
+
+Counters live in the brief cache backend (BRIEF_CACHE_BACKEND): shared
+across workers with redis. With the in-process default each worker only sees
+its own writes, so ETags also rotate every BRIEF_CACHE_TTL seconds to bound
+staleness the same way the brief snapshot does (and no Last-Modified is sent).
+
+Only routes whose output is a pure function of their tables belong here;
+``/api/v1/reviews`` filters on the current time and is left out.
+"""
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import hashlib
+import math
+import threading
+import time
+import uuid
+
+from .brief_cache import RedisBackend, get_brief_cache
+
+EPOCH_KEY = "tables:epoch"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    tables: Tuple[str, ...]
+    cache_control: str = "no-cache"
+
+
+# Kitchen screens poll inventory and changes, so those always revalidate;
+# the menu changes rarely enough to be reused for a minute
+READ_POLICIES: Dict[str, CachePolicy] = {
+    "/api/v1/inventory": CachePolicy(("inventory", "menus")),
+    "/api/v1/changes": CachePolicy(("changes",)),
+    "/api/v1/menu": CachePolicy(("menus",), "max-age=60, must-revalidate"),
+}
+
+
+class TableVersions:
+    def __init__(self, backend, shared: bool = False, ttl: int = 60, clock: Callable[[], float] = time.time):
+        self.backend = backend
+        self.shared = shared
+        self.ttl = ttl
+        self._clock = clock
+        self._epoch: Optional[str] = None
+
+    def epoch(self) -> str:
+        """Random token per backend, so counters restarting at 0 never reuse a tag."""
+        if self._epoch is None:
+            epoch = self.backend.get(EPOCH_KEY)
+            if epoch is None:
+                epoch = uuid.uuid4().hex.encode()
+                self.backend.set(EPOCH_KEY, epoch)
+            self._epoch = epoch.decode() if isinstance(epoch, bytes) else epoch
+        return self._epoch
+
+    def bump(self, *tables: str) -> None:
+        now = str(self._clock()).encode()
+        for table in tables:
+            self.backend.incr(f"tables:{table}:version")
+            self.backend.set(f"tables:{table}:modified", now)
+
+    def snapshot(self, tables: Iterable[str]) -> Tuple[List[int], Optional[float]]:
+        """Current versions of ``tables`` and the time of the newest write (if known)."""
+        versions, modified = [], None
+        for table in tables:
+            version = self.backend.get(f"tables:{table}:version")
+            versions.append(int(version) if version is not None else 0)
+            stamp = self.backend.get(f"tables:{table}:modified")
+            if stamp is not None:
+                modified = max(modified or 0.0, float(stamp))
+        return versions, modified
+
+    def etag(self, url: str, versions: List[int]) -> str:
+        parts = [self.epoch(), url, ",".join(map(str, versions))]
+        if not self.shared:
+            parts.append(str(int(self._clock() // self.ttl)))
+        return '"' + hashlib.sha256("|".join(parts).encode()).hexdigest()[:32] + '"'
+
+    def last_modified(self, modified: Optional[float]) -> Optional[int]:
+        """Whole-second Last-Modified, or None when it would be unsafe: it cannot
+        carry the per-process rotation of ``etag``, and a write later in the
+        current second would share it."""
+        if not self.shared or modified is None or math.floor(modified) >= math.floor(self._clock()):
+            return None
+        return math.floor(modified)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def _parse_http_date(value: str) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class ConditionalGetMiddleware:
+    """ASGI middleware: ETag/Last-Modified/Cache-Control for the configured paths."""
+
+    def __init__(self, app, policies: Dict[str, CachePolicy], versions: Optional[TableVersions] = None):
+        self.app = app
+        self.policies = policies
+        self._versions = versions
+
+    @property
+    def versions(self) -> TableVersions:
+        return self._versions or get_table_versions()
+
+    async def __call__(self, scope, receive, send):
+        policy = self.policies.get(scope.get("path")) if scope["type"] == "http" else None
+        if policy is None or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        versions, modified = self.versions.snapshot(policy.tables)
+        query = scope.get("query_string", b"").decode("latin-1")
+        etag = self.versions.etag(f"{scope['path']}?{query}", versions)
+        headers = [(b"etag", etag.encode()), (b"cache-control", policy.cache_control.encode())]
+        last_modified = self.versions.last_modified(modified)
+        if last_modified is not None:
+            headers.append((b"last-modified", formatdate(last_modified, usegmt=True).encode()))
+
+        request_headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = _etag_matches(etag, if_none_match)
+        else:
+            since = _parse_http_date(request_headers.get("if-modified-since", ""))
+            not_modified = last_modified is not None and since is not None and last_modified <= since
+        if not_modified:
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message = {**message, "headers": [*message.get("headers", []), *headers]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+_versions: Optional[TableVersions] = None
+_versions_lock = threading.Lock()
+
+
+def get_table_versions() -> TableVersions:
+    """Process-wide counters, stored alongside the brief cache."""
+    global _versions
+    with _versions_lock:
+        if _versions is None:
+            cache = get_brief_cache()
+            _versions = TableVersions(cache.backend, shared=isinstance(cache.backend, RedisBackend), ttl=cache.ttl)
+        return _versions
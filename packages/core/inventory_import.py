@@ -0,0 +1,182 @@
+# packages/core/inventory_import.py
+"""Bulk inventory import from the supplier's CSV count.
+
+The upload is parsed with ``csv.reader`` as it streams in (quoted notes with
+commas are fine) and applied in chunks: one ``IN`` lookup to validate item
+ids against the menu and tell inserts from updates, then a single
+``INSERT ... ON CONFLICT (item_id) DO UPDATE`` per chunk. Bad rows are
+reported back with their line number instead of failing the whole file.
+
+Expected columns (header row required, matched by position):
+``item_id, status, notes``
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+import csv
+import io
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .database import Inventory, Menu, StockStatus, dialect_insert
+
+CHUNK_SIZE = 1000
+
+STATUS_MAPPING = {
+    'ok': StockStatus.OK,
+    'low': StockStatus.LOW,
+    '86': StockStatus.EIGHTY_SIX,
+    'eighty_six': StockStatus.EIGHTY_SIX,
+}
+
+
+@dataclass
+class RowError:
+    line: int
+    item_id: Optional[str]
+    message: str
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    chunks: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    # (item_id, previous status or None for a new row, new status) where the status changed
+    transitions: List[Tuple[str, Optional[StockStatus], StockStatus]] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.duration_seconds if self.duration_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "message": f"Successfully updated {self.inserted + self.updated} inventory items",
+            "rows": self.rows,
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "failed": len(self.errors),
+            "errors": [error.__dict__ for error in self.errors],
+            "chunks": self.chunks,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def _parse(upload: BinaryIO, report: ImportReport) -> Iterator[Tuple[int, dict]]:
+    """Yield (line number, row values) for every valid data row."""
+    # utf-8-sig: spreadsheet exports often start with a BOM
+    text = io.TextIOWrapper(upload, encoding='utf-8-sig', newline='')
+    try:
+        reader = csv.reader(text)
+        next(reader, None)  # header
+        for row in reader:
+            line = reader.line_num
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            report.rows += 1
+            item_id = row[0].strip()
+            if not item_id:
+                report.errors.append(RowError(line, None, "Missing item_id"))
+                continue
+            if len(row) < 2:
+                report.errors.append(RowError(line, item_id, "Missing status"))
+                continue
+            status = STATUS_MAPPING.get(row[1].strip().lower())
+            if status is None:
+                report.errors.append(RowError(line, item_id, f"Unknown status '{row[1].strip()}'"))
+                continue
+            notes = row[2].strip() if len(row) > 2 and row[2].strip() else None
+            yield line, {"item_id": item_id, "status": status, "notes": notes}
+    finally:
+        text.detach()  # leave the upload open for its owner
+
+
+def _chunks(rows: Iterator[Tuple[int, dict]], size: int) -> Iterator[List[Tuple[int, dict]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _upsert_statement(session: Session, values: List[dict]):
+    stmt = dialect_insert(session, Inventory).values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[Inventory.item_id],
+        set_={
+            "status": stmt.excluded.status,
+            "notes": stmt.excluded.notes,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+def _apply_chunk(session: Session, chunk: List[Tuple[int, dict]], report: ImportReport) -> None:
+    # A later line for the same item wins, as it did when rows were applied one by one;
+    # ON CONFLICT cannot touch the same row twice in one statement
+    latest: Dict[str, Tuple[int, dict]] = {}
+    for line, values in chunk:
+        latest[values["item_id"]] = (line, values)
+
+    item_ids = list(latest)
+    known = set(session.scalars(select(Menu.item_id).where(Menu.item_id.in_(item_ids))))
+    existing = dict(session.execute(
+        select(Inventory.item_id, Inventory.status).where(Inventory.item_id.in_(item_ids))
+    ).all())
+
+    now = datetime.utcnow()
+    values = []
+    for item_id, (line, row) in latest.items():
+        if item_id not in known:
+            report.errors.append(RowError(line, item_id, "Unknown menu item"))
+            continue
+        values.append({**row, "updated_at": now})
+        if item_id in existing:
+            report.updated += 1
+        else:
+            report.inserted += 1
+        previous = existing.get(item_id)
+        if previous != row["status"]:
+            report.transitions.append((item_id, previous, row["status"]))
+
+    if values:
+        session.execute(_upsert_statement(session, values))
+    report.chunks += 1
+
+
+def _run(session: Session, rows: Iterator[Tuple[int, dict]], report: ImportReport,
+         chunk_size: int) -> ImportReport:
+    started = time.perf_counter()
+    for chunk in _chunks(rows, chunk_size):
+        _apply_chunk(session, chunk, report)
+    report.errors.sort(key=lambda error: error.line)
+    report.duration_seconds = time.perf_counter() - started
+    return report
+
+
+def import_inventory_csv(session: Session, upload: BinaryIO, chunk_size: int = CHUNK_SIZE) -> ImportReport:
+    """Apply a CSV inventory count; the caller commits."""
+    report = ImportReport()
+    return _run(session, _parse(upload, report), report, chunk_size)
+
+
+def upsert_inventory(session: Session, rows: Iterable[dict], chunk_size: int = CHUNK_SIZE) -> ImportReport:
+    """Apply already-parsed ``{item_id, status, notes}`` rows (e.g. from an
+    InventoryPort); errors are numbered by row position. The caller commits."""
+    report = ImportReport()
+
+    def numbered():
+        for line, row in enumerate(rows, start=1):
+            report.rows += 1
+            yield line, row
+
+    return _run(session, numbered(), report, chunk_size)
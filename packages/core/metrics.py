@@ -0,0 +1,259 @@
+# packages/core/metrics.py
+"""Request, SQL, pool and PDF metrics in the Prometheus text format.
+
+Off unless METRICS_ENABLED is set. When off, ``get_metrics()`` returns None
+and nothing is installed: no middleware, no engine listeners, and ``/metrics``
+is not routed, so the only cost left is a None check in the PDF pool.
+
+When on:
+
+- ``MetricsMiddleware`` times every HTTP request per route template (not raw
+  path, to keep label cardinality bounded) and, through a context variable,
+  collects the SQL statements the request ran and their total time.
+- ``instrument_engine`` hooks ``before/after_cursor_execute`` for statement
+  timing and times connection checkouts from the pool, which is where
+  requests wait when the pool is exhausted.
+- The PDF pool observes the time from submit to finished render.
+
+``render()`` produces the ``/metrics`` body; pool occupancy is read at scrape
+time. Metrics are per process: scrape every worker.
+"""
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Tuple
+import bisect
+import os
+import threading
+import time
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # label values -> [per-bucket counts..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *label_values: str) -> int:
+        with self._lock:
+            series = self._series.get(label_values)
+            return sum(series[0]) if series else 0
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(values, list(counts), total[0]) for values, (counts, total) in sorted(self._series.items())]
+        for values, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = 'le="%s"' % (bound if bound == "+Inf" else _number(bound))
+                lines.append(f"{self.name}_bucket{_labels(self.labels, values, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, values)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labels, values)} {cumulative}")
+        return lines
+
+
+class _RequestStats:
+    __slots__ = ("statements", "sql_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+_request_stats: ContextVar[Optional[_RequestStats]] = ContextVar("request_sql_stats", default=None)
+
+
+class Metrics:
+    def __init__(self):
+        self.request_seconds = Histogram(
+            "http_request_duration_seconds", "HTTP request latency by route template.",
+            ("method", "route", "status"),
+        )
+        self.request_statements = Histogram(
+            "http_request_sql_statements", "SQL statements executed per HTTP request.",
+            ("method", "route"), COUNT_BUCKETS,
+        )
+        self.request_sql_seconds = Histogram(
+            "http_request_sql_duration_seconds", "Total SQL time per HTTP request.", ("method", "route"),
+        )
+        self.statement_seconds = Histogram(
+            "db_statement_duration_seconds", "Duration of each SQL statement, in or out of requests.",
+        )
+        self.checkout_seconds = Histogram(
+            "db_pool_checkout_wait_seconds", "Time to obtain a connection from the pool.", ("engine",),
+        )
+        self.pdf_render_seconds = Histogram(
+            "pdf_render_duration_seconds", "Brief PDF renders, from submit to finished (queue included).",
+            ("status",),
+        )
+        self._histograms = [
+            self.request_seconds, self.request_statements, self.request_sql_seconds,
+            self.statement_seconds, self.checkout_seconds, self.pdf_render_seconds,
+        ]
+
+    # SQL -------------------------------------------------------------------
+
+    def instrument_engine(self, engine, name: str = "sync") -> None:
+        """Statement timing and checkout waits for ``engine`` (a sync Engine;
+        pass ``async_engine.sync_engine`` for the asyncio one)."""
+        from sqlalchemy import event
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info["metrics_started"].pop()
+            self.statement_seconds.observe(elapsed)
+            stats = _request_stats.get()
+            if stats is not None:
+                stats.statements += 1
+                stats.sql_seconds += elapsed
+
+        @event.listens_for(engine, "handle_error")
+        def _error(context):
+            started = context.connection.info.get("metrics_started") if context.connection is not None else None
+            if started:
+                started.pop()
+
+        # The pool has no "checkout started" event; time its acquire directly
+        pool = engine.pool
+        acquire = pool._do_get
+
+        def timed_acquire():
+            started = time.perf_counter()
+            try:
+                return acquire()
+            finally:
+                self.checkout_seconds.observe(time.perf_counter() - started, name)
+        pool._do_get = timed_acquire
+
+    # Exposition ------------------------------------------------------------
+
+    def render(self) -> bytes:
+        lines: List[str] = []
+        for histogram in self._histograms:
+            lines.extend(histogram.expose())
+        lines.extend(_pool_gauges())
+        return ("\n".join(lines) + "\n").encode()
+
+
+def _pool_gauges() -> List[str]:
+    from .engine import pool_stats
+    stats = pool_stats()
+    lines = []
+    for key, name, help in (
+        ("checkedout", "db_pool_checked_out", "Connections currently checked out of the pool."),
+        ("checkedin", "db_pool_checked_in", "Idle connections in the pool."),
+        ("overflow", "db_pool_overflow", "Connections opened beyond pool_size."),
+    ):
+        if key in stats:
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} gauge", f"{name} {stats[key]}"]
+    return lines
+
+
+class MetricsMiddleware:
+    """ASGI middleware: latency and per-request SQL for every HTTP request."""
+
+    def __init__(self, app, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = _RequestStats()
+        token = _request_stats.set(stats)
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            # The router stores the matched route in the scope. 304s from
+            # ConditionalGetMiddleware never reach it; their paths are fixed
+            route = getattr(scope.get("route"), "path", None)
+            if route is None:
+                route = scope["path"] if status[0] == 304 else "unmatched"
+            method = scope["method"]
+            self.metrics.request_seconds.observe(elapsed, method, route, str(status[0]))
+            self.metrics.request_statements.observe(stats.statements, method, route)
+            self.metrics.request_sql_seconds.observe(stats.sql_seconds, method, route)
+
+
+def install_metrics(app) -> Optional[Metrics]:
+    """Add the middleware and ``GET /metrics`` to ``app`` when metrics are on."""
+    metrics = get_metrics()
+    if metrics is None:
+        return None
+    from fastapi.responses import Response
+
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics():
+        return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    return metrics
+
+
+_metrics: Optional[Metrics] = None
+_metrics_lock = threading.Lock()
+
+
+def metrics_enabled() -> bool:
+    return os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+
+
+def get_metrics() -> Optional[Metrics]:
+    """Process-wide metrics, or None when METRICS_ENABLED is off."""
+    global _metrics
+    if not metrics_enabled():
+        return None
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+        return _metrics
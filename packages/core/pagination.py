@@ -0,0 +1,274 @@
+# packages/core/pagination.py
+"""Keyset pagination and column projection for the list endpoints.
+
+A ``Resource`` names the fields a list endpoint can return (each backed by
+specific SQL columns) and a stable sort order ending in the primary key.
+``page_query`` selects only the columns behind the requested ``fields`` plus
+the sort keys, and continues after the cursor with a keyset predicate
+(``(created_at, id) < (:c, :i)``), so page N costs the same as page 1 and
+rows inserted meanwhile never shift a page. ``page_envelope`` turns the rows
+into ``{"items": [...], "next_cursor": ..., "limit": n}``.
+
+Cursors are opaque url-safe base64 of the last row's sort key values, tagged
+with the resource name; a cursor from another endpoint is rejected.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import base64
+import json
+
+from sqlalchemy import BigInteger, DateTime, Integer, SmallInteger, and_, or_, select
+from sqlalchemy.sql import ColumnElement
+
+from .database import Change, Inventory, Menu, Review
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+class PaginationError(ValueError):
+    """Bad cursor, limit or field list; endpoints map it to a 400."""
+
+
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def _enum(value):
+    return value.value if hasattr(value, 'value') else value
+
+
+@dataclass(frozen=True)
+class Field:
+    columns: Tuple[ColumnElement, ...]
+    render: Callable[..., Any] = lambda value: value
+    join: Optional[Tuple[Any, Any]] = None  # (model, onclause) for an outer join
+
+
+def column(col, render=lambda value: value) -> Field:
+    return Field((col,), render)
+
+
+@dataclass(frozen=True)
+class Resource:
+    name: str
+    model: Any
+    fields: Dict[str, Field]
+    # (column, descending); must end in a unique column so the order is total
+    order_by: Tuple[Tuple[Any, bool], ...]
+
+    def resolve_fields(self, fields: Optional[str]) -> List[str]:
+        if not fields:
+            return list(self.fields)
+        names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [n for n in names if n not in self.fields]
+        if unknown:
+            raise PaginationError(
+                f"Unknown field(s) {', '.join(unknown)}; choose from {', '.join(self.fields)}"
+            )
+        return names
+
+
+def _menu_item(item_id, name, price, allergy_flags, active):
+    if item_id is None:
+        return None
+    return {"item_id": item_id, "name": name, "price": price, "allergy_flags": allergy_flags, "active": active}
+
+
+INVENTORY = Resource(
+    name="inventory",
+    model=Inventory,
+    fields={
+        "id": column(Inventory.id),
+        "item_id": column(Inventory.item_id),
+        "status": column(Inventory.status, _enum),
+        "notes": column(Inventory.notes),
+        "expected_back": column(Inventory.expected_back, _iso),
+        "updated_at": column(Inventory.updated_at, _iso),
+        "menu_item": Field(
+            (Menu.item_id.label("menu_item_id"), Menu.name, Menu.price, Menu.allergy_flags, Menu.active),
+            _menu_item,
+            join=(Menu, Menu.item_id == Inventory.item_id),
+        ),
+    },
+    order_by=((Inventory.id, False),),
+)
+
+MENU = Resource(
+    name="menu",
+    model=Menu,
+    fields={
+        "item_id": column(Menu.item_id),
+        "name": column(Menu.name),
+        "price": column(Menu.price),
+        "allergy_flags": column(Menu.allergy_flags),
+        "active": column(Menu.active),
+        "created_at": column(Menu.created_at, _iso),
+        "updated_at": column(Menu.updated_at, _iso),
+    },
+    order_by=((Menu.item_id, False),),
+)
+
+REVIEWS = Resource(
+    name="reviews",
+    model=Review,
+    fields={
+        "review_id": column(Review.review_id),
+        "source": column(Review.source),
+        "rating": column(Review.rating),
+        "text": column(Review.text),
+        "created_at": column(Review.created_at, _iso),
+        "theme": column(Review.theme),
+        "url": column(Review.url),
+    },
+    order_by=((Review.created_at, True), (Review.review_id, True)),
+)
+
+CHANGES = Resource(
+    name="changes",
+    model=Change,
+    fields={
+        "change_id": column(Change.change_id),
+        "title": column(Change.title),
+        "detail": column(Change.detail),
+        "effective_from": column(Change.effective_from, _iso),
+        "created_by": column(Change.created_by),
+        "is_active": column(Change.is_active),
+        "created_at": column(Change.created_at, _iso),
+    },
+    order_by=((Change.created_at, True), (Change.change_id, True)),
+)
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(resource: Resource, keys: Sequence[Any]) -> str:
+    payload = json.dumps([resource.name, [_encode_value(k) for k in keys]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(resource: Resource, cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, keys = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid cursor")
+    if name != resource.name or not isinstance(keys, list) or len(keys) != len(resource.order_by):
+        raise PaginationError("Cursor does not belong to this list")
+    try:
+        values = [_decode_value(k) for k in keys]
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid cursor")
+    # Keys are bound into the keyset predicate; a wrong type is a driver error (500) on Postgres
+    for value, (col, _) in zip(values, resource.order_by):
+        if value is not None and not _matches_type(value, col):
+            raise PaginationError("Invalid cursor")
+    return values
+
+
+def _int_bits(col_type) -> int:
+    if isinstance(col_type, SmallInteger):
+        return 16
+    if isinstance(col_type, BigInteger):
+        return 64
+    return 32
+
+
+def _matches_type(value, col) -> bool:
+    col_type = col.type
+    try:
+        expected = col_type.python_type
+    except NotImplementedError:
+        return True
+    if isinstance(value, bool) and expected is not bool:
+        return False
+    if not isinstance(value, expected):
+        return False
+    if isinstance(col_type, Integer):
+        bound = 1 << (_int_bits(col_type) - 1)
+        return -bound <= value < bound
+    if isinstance(col_type, DateTime) and not col_type.timezone:
+        # asyncpg refuses aware datetimes for timestamp without time zone
+        return value.tzinfo is None
+    return True
+
+
+def _after(resource: Resource, keys: Sequence[Any]):
+    """Keyset predicate: rows strictly after ``keys`` in the resource order."""
+    clauses = []
+    for i, (col, descending) in enumerate(resource.order_by):
+        equal = [c == k for (c, _), k in zip(resource.order_by[:i], keys)]
+        beyond = col < keys[i] if descending else col > keys[i]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
+
+
+def page_query(resource: Resource, fields: List[str], limit: int, cursor: Optional[str] = None,
+               where: Sequence[Any] = ()):
+    """SELECT of the requested fields' columns (plus sort keys), one row past ``limit``."""
+    if not 1 <= limit <= MAX_LIMIT:
+        raise PaginationError(f"limit must be between 1 and {MAX_LIMIT}")
+    columns, joins = [], []
+    for name in fields:
+        spec = resource.fields[name]
+        columns.extend(spec.columns)
+        if spec.join is not None:
+            joins.append(spec.join)
+    sort_columns = [col.label(f"_sort{i}") for i, (col, _) in enumerate(resource.order_by)]
+
+    stmt = select(*columns, *sort_columns).select_from(resource.model)
+    for model, onclause in joins:
+        stmt = stmt.outerjoin(model, onclause)
+    stmt = stmt.where(*where)
+    if cursor:
+        stmt = stmt.where(_after(resource, decode_cursor(resource, cursor)))
+    order = [col.desc() if descending else col.asc() for col, descending in resource.order_by]
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def prepare_page(resource: Resource, limit: Optional[int], cursor: Optional[str], fields: Optional[str],
+                 where: Sequence[Any] = ()):
+    """Validate the request and return ``(statement, field names, limit)``."""
+    names = resource.resolve_fields(fields)
+    limit = DEFAULT_LIMIT if limit is None else limit
+    return page_query(resource, names, limit, cursor, where), names, limit
+
+
+def page_envelope(resource: Resource, fields: List[str], rows: Sequence[Any], limit: int) -> Dict[str, Any]:
+    """Render rows from ``page_query`` into the paginated response body."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items = []
+    for row in rows:
+        values = iter(row)
+        item = {}
+        for name in fields:
+            spec = resource.fields[name]
+            item[name] = spec.render(*(next(values) for _ in spec.columns))
+        items.append(item)
+    next_cursor = None
+    if has_more and rows:
+        sort_keys = rows[-1][-len(resource.order_by):]
+        next_cursor = encode_cursor(resource, sort_keys)
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
+
+
+def wants_page(limit: Optional[int], cursor: Optional[str], fields: Optional[str]) -> bool:
+    """Lists keep returning a bare array unless a client asks for paging or projection."""
+    return limit is not None or cursor is not None or fields is not None
@@ -0,0 +1,144 @@
+# packages/core/passwords.py
+"""bcrypt hashing off the event loop, with a bounded backlog.
+
+At cost 12 a bcrypt call is ~250ms of CPU. Run inline, a burst of logins at
+shift change stalls every other request on the worker. ``PasswordHasher``
+runs hashes on a small dedicated thread pool (bcrypt releases the GIL while
+it works, so threads use real cores without pickling to a process pool) and
+admits at most ``max_pending`` calls, queued or running. Beyond that,
+``hash``/``verify`` raise ``HasherBusy`` right away so the endpoint can
+answer 503 with Retry-After instead of letting waits pile up.
+
+The work factor comes from BCRYPT_ROUNDS. ``verify`` reports when a stored
+hash used a different cost, so login can rehash it transparently.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+import asyncio
+import os
+import threading
+
+import bcrypt
+
+DEFAULT_ROUNDS = 12
+# bcrypt only reads 72 bytes; bcrypt 5 raises ValueError beyond that
+MAX_PASSWORD_BYTES = 72
+
+
+class HasherBusy(Exception):
+    """The hashing backlog is full; retry shortly."""
+
+
+@dataclass(frozen=True)
+class Verification:
+    ok: bool
+    needs_rehash: bool = False
+
+
+def hash_rounds(hashed: str) -> Optional[int]:
+    """Cost factor of a ``$2b$12$...`` hash (None if it is not bcrypt)."""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+def hash_sync(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def verify_sync(password: str, hashed: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    except ValueError:  # malformed stored hash
+        return False
+
+
+class PasswordHasher:
+    def __init__(self, rounds: int = DEFAULT_ROUNDS, workers: int = 2, max_pending: int = 32):
+        self.rounds = rounds
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._dummy_hash: Optional[str] = None
+        self.completed = 0
+        self.rejected = 0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="bcrypt")
+            return self._executor
+
+    async def _run(self, fn, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HasherBusy(f"{self.max_pending} password operations already pending")
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_sync, password, self.rounds)
+
+    async def verify(self, password: str, hashed: Optional[str]) -> Verification:
+        """Check ``password``; ``needs_rehash`` when the stored cost is not the
+        configured one. A missing hash still costs one bcrypt call, so unknown
+        accounts answer no faster than wrong passwords."""
+        if not hashed:
+            await self._run(verify_sync, password, await self._dummy())
+            return Verification(ok=False)
+        ok = await self._run(verify_sync, password, hashed)
+        return Verification(ok=ok, needs_rehash=ok and hash_rounds(hashed) != self.rounds)
+
+    async def _dummy(self) -> str:
+        # Made on the pool like any other hash; concurrent first calls may
+        # each make one, which is harmless
+        if self._dummy_hash is None:
+            self._dummy_hash = await self._run(hash_sync, "not-a-password", self.rounds)
+        return self._dummy_hash
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def stats(self) -> dict:
+        return {
+            "rounds": self.rounds,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending(),
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_hasher: Optional[PasswordHasher] = None
+_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Process-wide hasher from BCRYPT_ROUNDS, PASSWORD_WORKERS and PASSWORD_MAX_PENDING."""
+    global _hasher
+    with _hasher_lock:
+        if _hasher is None:
+            _hasher = PasswordHasher(
+                rounds=int(os.getenv("BCRYPT_ROUNDS", str(DEFAULT_ROUNDS))),
+                workers=int(os.getenv("PASSWORD_WORKERS", str(min(4, os.cpu_count() or 1)))),
+                max_pending=int(os.getenv("PASSWORD_MAX_PENDING", "32")),
+            )
+        return _hasher
@@ -0,0 +1,176 @@
+# packages/core/pdf_pool.py
+"""Process pool for rendering brief PDFs off the request path.
+
+WeasyPrint takes seconds per brief and holds the GIL, so rendering happens
+in worker processes that each keep one warm ``PDFService``. Results are
+cached by a content hash of the brief data (``generated_at`` excluded), and
+identical concurrent requests share one render: the hash doubles as the
+job id, so 30 tablets printing the same brief enqueue a single job.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+from .metrics import get_metrics
+
+VOLATILE_FIELDS = ("generated_at",)
+
+# Per-process PDFService, created once by the pool initializer
+_worker_service = None
+
+
+def _init_worker() -> None:
+    global _worker_service
+    from .pdf_service import PDFService
+    _worker_service = PDFService()
+
+
+def _render_brief(brief_data: Dict[str, Any]) -> bytes:
+    if _worker_service is None:
+        _init_worker()
+    return _worker_service.generate_brief_pdf(brief_data)
+
+
+def brief_fingerprint(brief_data: Dict[str, Any]) -> str:
+    content = {k: v for k, v in brief_data.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+@dataclass
+class PDFJob:
+    job_id: str
+    future: Future
+    brief_date: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def status(self) -> str:
+        if not self.future.done():
+            return "pending"
+        # Cancelled by shutdown(cancel_futures=True); exception() would raise
+        if self.future.cancelled() or self.future.exception() is not None:
+            return "failed"
+        return "done"
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.status != "failed":
+            return None
+        if self.future.cancelled():
+            return "render cancelled"
+        return str(self.future.exception())
+
+
+class PDFRenderPool:
+    def __init__(
+        self,
+        workers: int = 2,
+        cache_size: int = 32,
+        max_jobs: int = 256,
+        render: Callable[[Dict[str, Any]], bytes] = _render_brief,
+        executor_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.workers = workers
+        self.cache_size = cache_size
+        self.max_jobs = max_jobs
+        self._render = render
+        self._executor_factory = executor_factory or self._process_pool
+        self._executor = None
+        # Re-entrant: a render that finishes before add_done_callback returns
+        # runs _store on the submitting thread, which already holds the lock
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._jobs: "OrderedDict[str, PDFJob]" = OrderedDict()
+
+    def _process_pool(self):
+        # spawn: forking a threaded ASGI server is unsafe
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+
+    def start(self) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_factory()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, brief_data: Dict[str, Any]) -> PDFJob:
+        """Enqueue a render (or reuse a cached/in-flight one) and return its job."""
+        self.start()
+        job_id = brief_fingerprint(brief_data)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.status != "failed":
+                self._jobs.move_to_end(job_id)
+                return job
+
+            cached = self._cache.get(job_id)
+            if cached is not None:
+                self._cache.move_to_end(job_id)
+                future = Future()
+                future.set_result(cached)
+            else:
+                future = self._executor.submit(self._render, brief_data)
+                future.add_done_callback(lambda f, key=job_id: self._store(key, f))
+                metrics = get_metrics()
+                if metrics is not None:
+                    future.add_done_callback(partial(_observe_render, metrics, time.perf_counter()))
+
+            job = PDFJob(job_id=job_id, future=future, brief_date=brief_data.get("date"))
+            self._jobs[job_id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+            return job
+
+    def _store(self, job_id: str, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        with self._lock:
+            self._cache[job_id] = future.result()
+            self._cache.move_to_end(job_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def get_job(self, job_id: str) -> Optional[PDFJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    async def render(self, brief_data: Dict[str, Any]) -> bytes:
+        """Render (or fetch from cache) without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(brief_data).future)
+
+
+def _observe_render(metrics, started: float, future: Future) -> None:
+    failed = future.cancelled() or future.exception() is not None
+    metrics.pdf_render_seconds.observe(time.perf_counter() - started, "failed" if failed else "ok")
+
+
+_pool: Optional[PDFRenderPool] = None
+
+
+def get_pdf_pool() -> PDFRenderPool:
+    """Process-wide pool sized by PDF_WORKERS/PDF_CACHE_SIZE."""
+    global _pool
+    if _pool is None:
+        _pool = PDFRenderPool(
+            workers=int(os.getenv("PDF_WORKERS", "2")),
+            cache_size=int(os.getenv("PDF_CACHE_SIZE", "32")),
+        )
+    return _pool
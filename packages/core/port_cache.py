@@ -0,0 +1,219 @@
+# packages/core/port_cache.py
+"""Caching wrapper for adapter ports (see core.ports).
+
+``CachedPort(port)`` forwards every method call to ``port`` and caches the
+result per method and arguments:
+
+- fresh (younger than ``ttl``): served from cache, no upstream call
+- stale (up to ``stale_ttl`` past that): served from cache while one
+  background refresh runs (stale-while-revalidate)
+- older, or not cached: fetched inline. Concurrent callers for the same key
+  share one upstream call (single flight).
+
+A ``CircuitBreaker`` counts consecutive upstream failures. Once it opens,
+calls stop reaching the upstream for ``reset_after`` seconds and any cached
+value, however old, is served instead; with nothing cached the call raises
+``UpstreamUnavailable``. A failed inline fetch also falls back to the
+cached value. After ``reset_after`` one trial call is let through.
+
+Results are shared between callers and must be treated as read-only. The
+ingestion worker keeps using raw ports: it wants the upstream's current data.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamUnavailable(Exception):
+    """The circuit is open and there is no cached value to serve."""
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: Any
+    fetched_at: float
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failures: int = 5, reset_after: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failures = failures
+        self.reset_after = reset_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive = 0
+        self._opened_at = 0.0
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now. Past ``reset_after`` the first
+        caller gets the half-open trial; others wait for its outcome."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_after:
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._consecutive = 0
+
+    def failure(self) -> None:
+        with self._lock:
+            self._consecutive += 1
+            if self._state == self.HALF_OPEN or self._consecutive >= self.failures:
+                if self._state != self.OPEN:
+                    self.opened += 1
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class CachedPort:
+    def __init__(self, port, name: str = "port", ttl: float = 30.0, stale_ttl: float = 300.0,
+                 breaker: Optional[CircuitBreaker] = None, max_entries: int = 256,
+                 clock: Callable[[], float] = time.monotonic, refresh_workers: int = 2):
+        self.port = port
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self._refresh_workers = refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.counts = {"hits": 0, "stale_hits": 0, "misses": 0, "fetches": 0, "refreshes": 0,
+                       "errors": 0, "served_stale_on_error": 0}
+
+    def __getattr__(self, method: str):
+        target = getattr(self.port, method)
+        if not callable(target):
+            return target
+
+        def cached(*args, **kwargs):
+            return self._get((method, args, tuple(sorted(kwargs.items()))), target, args, kwargs)
+        cached.__name__ = method
+        return cached
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def _get(self, key, target, args, kwargs):
+        with self._lock:
+            entry = self._entries.get(key)
+        age = self._clock() - entry.fetched_at if entry is not None else None
+        if age is not None and age < self.ttl:
+            self._count("hits")
+            return entry.value
+        if age is not None and age < self.ttl + self.stale_ttl:
+            self._count("stale_hits")
+            self._refresh(key, target, args, kwargs)
+            return entry.value
+
+        self._count("misses")
+        try:
+            return self._fetch(key, target, args, kwargs).result()
+        except Exception:
+            if entry is None:
+                raise
+            # Stale-if-error: anything cached beats an error page
+            self._count("served_stale_on_error")
+            return entry.value
+
+    def _fetch(self, key, target, args, kwargs) -> Future:
+        """Single flight: join the call in progress for ``key`` or run one."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            future = self._inflight[key] = Future()
+        self._run(key, future, target, args, kwargs)
+        return future
+
+    def _refresh(self, key, target, args, kwargs) -> None:
+        with self._lock:
+            if key in self._inflight:
+                return
+            future = self._inflight[key] = Future()
+        self._count("refreshes")
+        self._pool().submit(self._run, key, future, target, args, kwargs)
+
+    def _run(self, key, future: Future, target, args, kwargs) -> None:
+        try:
+            if not self.breaker.allow():
+                raise UpstreamUnavailable(f"{self.name}: circuit open")
+            self._count("fetches")
+            try:
+                value = target(*args, **kwargs)
+            except Exception:
+                self.breaker.failure()
+                self._count("errors")
+                logger.warning("%s.%s failed", self.name, key[0], exc_info=True)
+                raise
+            self.breaker.success()
+            with self._lock:
+                self._entries.pop(key, None)
+                self._entries[key] = _Entry(value, self._clock())
+                while len(self._entries) > self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            future.set_result(value)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._refresh_workers, thread_name_prefix=f"{self.name}-refresh")
+            return self._executor
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        circuit = self.breaker.state
+        with self._lock:
+            return {**self.counts, "entries": len(self._entries), "circuit": circuit}
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def cache_port(port, name: str, env=os.environ) -> CachedPort:
+    """Wrap ``port`` with PORT_CACHE_TTL / PORT_CACHE_STALE_TTL seconds and a
+    breaker that opens after PORT_BREAKER_FAILURES errors for PORT_BREAKER_RESET seconds."""
+    return CachedPort(
+        port,
+        name=name,
+        ttl=float(env.get("PORT_CACHE_TTL", "30")),
+        stale_ttl=float(env.get("PORT_CACHE_STALE_TTL", "300")),
+        breaker=CircuitBreaker(
+            failures=int(env.get("PORT_BREAKER_FAILURES", "5")),
+            reset_after=float(env.get("PORT_BREAKER_RESET", "30")),
+        ),
+    )
@@ -0,0 +1,213 @@
+# packages/core/push.py
+"""In-process push of inventory transitions and new changes to connected tablets.
+
+Write endpoints publish to the ``PushHub`` after committing; the SSE and
+WebSocket endpoints each hold one ``Subscriber``. An event is encoded once
+at publish time and fanned out to every subscriber's bounded queue. Writers
+never wait on readers: a subscriber whose queue is full is dropped (its
+stream ends and the client reconnects, then refetches the list), so one
+stalled tablet cannot hold up a stock update or grow memory without bound.
+
+Publishing is thread-safe: sync endpoints run in the threadpool, so events
+are handed to each subscriber's event loop with one ``call_soon_threadsafe``
+per loop, not per subscriber.
+
+Event kinds:
+
+- ``eighty_six``: an item went to 86
+- ``inventory``: any other status transition (including back from 86)
+- ``change``: a new change/announcement
+
+The hub is per process; writes made by the worker or another API process
+are not pushed (those clients still see them on their next ETag revalidation).
+"""
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, FrozenSet, Iterable, List, Optional
+import asyncio
+import itertools
+import os
+import threading
+
+from .database import StockStatus
+from .serializers import dumps
+
+KINDS = frozenset({"eighty_six", "inventory", "change"})
+DEFAULT_QUEUE_SIZE = 256
+KEEPALIVE_SECONDS = 15.0
+
+
+class SubscriptionClosed(Exception):
+    """The subscriber was dropped for falling behind, or the hub closed it."""
+
+
+@dataclass(frozen=True)
+class PushEvent:
+    id: int
+    kind: str
+    data: Dict[str, Any]
+    json: bytes  # {"id", "kind", "data"}, encoded once for every subscriber
+
+    def sse(self) -> bytes:
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (self.id, self.kind.encode(), self.json)
+
+
+class Subscriber:
+    def __init__(self, hub: "PushHub", loop: asyncio.AbstractEventLoop, max_queue: int,
+                 kinds: Optional[FrozenSet[str]] = None):
+        self.hub = hub
+        self.loop = loop
+        self.max_queue = max_queue
+        self.kinds = kinds
+        self.dropped = False
+        self.closed = False
+        self._events: Deque[PushEvent] = deque()
+        self._wakeup = asyncio.Event()
+
+    def _offer(self, event: PushEvent) -> None:
+        """Runs on the subscriber's loop."""
+        if self.closed or (self.kinds is not None and event.kind not in self.kinds):
+            return
+        if len(self._events) >= self.max_queue:
+            self.dropped = True
+            self._events.clear()
+            self.hub.unsubscribe(self)
+        else:
+            self._events.append(event)
+        self._wakeup.set()
+
+    def _close(self) -> None:
+        self.closed = True
+        self._wakeup.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[PushEvent]:
+        """Next event, or None if ``timeout`` passes first. Raises
+        SubscriptionClosed once the subscriber has been dropped or closed."""
+        while not self._events:
+            if self.closed:
+                raise SubscriptionClosed("dropped: queue full" if self.dropped else "closed")
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._events.popleft()
+
+
+class PushHub:
+    def __init__(self, max_queue: int = DEFAULT_QUEUE_SIZE):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._by_loop: Dict[asyncio.AbstractEventLoop, set] = {}
+        self._ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, kinds: Optional[Iterable[str]] = None, max_queue: Optional[int] = None) -> Subscriber:
+        """Register a subscriber on the running event loop."""
+        subscriber = Subscriber(self, asyncio.get_running_loop(), max_queue or self.max_queue,
+                                frozenset(kinds) if kinds else None)
+        with self._lock:
+            self._by_loop.setdefault(subscriber.loop, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            subscribers = self._by_loop.get(subscriber.loop)
+            if subscribers is None or subscriber not in subscribers:
+                return
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._by_loop[subscriber.loop]
+            if subscriber.dropped:
+                self.dropped += 1
+        subscriber._close()
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._by_loop.values())
+
+    def publish(self, kind: str, data: Dict[str, Any]) -> PushEvent:
+        """Queue ``data`` for every subscriber; never blocks on them."""
+        event_id = next(self._ids)
+        event = PushEvent(event_id, kind, data, dumps({"id": event_id, "kind": kind, "data": data}))
+        with self._lock:
+            self.published += 1
+            targets = [(loop, list(subscribers)) for loop, subscribers in self._by_loop.items()]
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, subscribers in targets:
+            if loop is running:
+                _deliver(event, subscribers)
+                continue
+            try:
+                loop.call_soon_threadsafe(_deliver, event, subscribers)
+            except RuntimeError:  # loop closed under its subscribers
+                for subscriber in subscribers:
+                    self.unsubscribe(subscriber)
+        return event
+
+    def stats(self) -> Dict[str, int]:
+        return {"subscribers": self.subscriber_count(), "published": self.published, "dropped": self.dropped}
+
+
+def _deliver(event: PushEvent, subscribers: List[Subscriber]) -> None:
+    for subscriber in subscribers:
+        subscriber._offer(event)
+
+
+def parse_kinds(kinds: Optional[str]) -> Optional[FrozenSet[str]]:
+    """``?kinds=eighty_six,change`` -> frozenset; unknown kinds raise ValueError."""
+    if not kinds:
+        return None
+    requested = frozenset(k.strip() for k in kinds.split(",") if k.strip())
+    unknown = requested - KINDS
+    if unknown:
+        raise ValueError(f"Unknown event kind(s) {', '.join(sorted(unknown))}; choose from {', '.join(sorted(KINDS))}")
+    return requested
+
+
+def inventory_event(hub: PushHub, item_id: str, previous: Optional[StockStatus], status: StockStatus,
+                    notes: Optional[str] = None) -> Optional[PushEvent]:
+    """Publish a status transition (``previous`` is None for a new row); no-op if unchanged."""
+    previous = StockStatus(previous) if previous is not None else None
+    status = StockStatus(status)
+    if previous == status:
+        return None
+    kind = "eighty_six" if status == StockStatus.EIGHTY_SIX else "inventory"
+    return hub.publish(kind, {
+        "item_id": item_id,
+        "status": status.value,
+        "previous_status": previous.value if previous is not None else None,
+        "notes": notes,
+    })
+
+
+async def sse_stream(hub: PushHub, subscriber: Subscriber,
+                     keepalive: float = KEEPALIVE_SECONDS) -> AsyncIterator[bytes]:
+    """text/event-stream body for one subscriber; unsubscribes when the client goes."""
+    try:
+        yield b"retry: 3000\n: connected\n\n"
+        while True:
+            try:
+                event = await subscriber.get(timeout=keepalive)
+            except SubscriptionClosed:
+                return
+            yield event.sse() if event is not None else b": keepalive\n\n"
+    finally:
+        hub.unsubscribe(subscriber)
+
+
+_hub: Optional[PushHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_push_hub() -> PushHub:
+    """Process-wide hub; PUSH_QUEUE_SIZE bounds each subscriber's backlog."""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = PushHub(int(os.getenv("PUSH_QUEUE_SIZE", str(DEFAULT_QUEUE_SIZE))))
+        return _hub
@@ -0,0 +1,105 @@
+# packages/core/review_rollup.py
+"""Daily review rollup for long-range dashboards.
+
+``review_daily_rollups`` holds one row per day x source x rating x theme with
+the number of reviews; theme ``''`` counts every review regardless of theme.
+It is maintained by the theme tagging stage (``add_to_rollup`` runs in the
+same transaction that marks the reviews tagged), so trend queries read
+O(days) rollup rows instead of every review in the window. Averages are
+derived from the rating dimension: sum(rating * count) / sum(count).
+"""
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from .database import ReviewDailyRollup, dialect_insert
+
+ALL_THEMES = ""
+
+
+def add_to_rollup(session: Session, reviews: Iterable[Tuple[datetime, str, int, Sequence[str]]]) -> None:
+    """Count ``(created_at, source, rating, themes)`` reviews into the rollup."""
+    increments: Counter = Counter()
+    for created_at, source, rating, themes in reviews:
+        day = created_at.date()
+        increments[(day, source, rating, ALL_THEMES)] += 1
+        for theme in themes:
+            increments[(day, source, rating, theme)] += 1
+    if not increments:
+        return
+
+    stmt = dialect_insert(session, ReviewDailyRollup)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ReviewDailyRollup.day, ReviewDailyRollup.source, ReviewDailyRollup.rating, ReviewDailyRollup.theme],
+        set_={"review_count": ReviewDailyRollup.review_count + stmt.excluded.review_count},
+    )
+    session.execute(stmt, [
+        {"day": day, "source": source, "rating": rating, "theme": theme, "review_count": count}
+        for (day, source, rating, theme), count in increments.items()
+    ])
+
+
+def reset_rollup(session: Session) -> None:
+    session.execute(delete(ReviewDailyRollup))
+
+
+def _window(days: int, today: Optional[date]) -> Tuple[date, date]:
+    today = today or datetime.utcnow().date()
+    return today - timedelta(days=days - 1), today
+
+
+def rating_trend(session: Session, days: int, source: Optional[str] = None,
+                 today: Optional[date] = None) -> List[Dict]:
+    """One point per day (empty days included): review count and average rating."""
+    start, end = _window(days, today)
+    reviews = func.sum(ReviewDailyRollup.review_count)
+    stars = func.sum(ReviewDailyRollup.rating * ReviewDailyRollup.review_count)
+    stmt = (
+        select(ReviewDailyRollup.day, reviews, stars)
+        .where(ReviewDailyRollup.theme == ALL_THEMES, ReviewDailyRollup.day.between(start, end))
+        .group_by(ReviewDailyRollup.day)
+    )
+    if source is not None:
+        stmt = stmt.where(ReviewDailyRollup.source == source)
+    by_day = {day: (count, total) for day, count, total in session.execute(stmt)}
+
+    points = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        count, total = by_day.get(day, (0, 0))
+        points.append({
+            "date": day.isoformat(),
+            "reviews": count,
+            "average_rating": round(total / count, 2) if count else None,
+        })
+    return points
+
+
+def theme_trend(session: Session, days: int, themes: Optional[Sequence[str]] = None,
+                today: Optional[date] = None) -> List[Dict]:
+    """Per theme, most frequent first: window total, average rating and the
+    days it appeared on (sparse)."""
+    start, end = _window(days, today)
+    reviews = func.sum(ReviewDailyRollup.review_count)
+    stars = func.sum(ReviewDailyRollup.rating * ReviewDailyRollup.review_count)
+    stmt = (
+        select(ReviewDailyRollup.theme, ReviewDailyRollup.day, reviews, stars)
+        .where(ReviewDailyRollup.theme != ALL_THEMES, ReviewDailyRollup.day.between(start, end))
+        .group_by(ReviewDailyRollup.theme, ReviewDailyRollup.day)
+        .order_by(ReviewDailyRollup.theme, ReviewDailyRollup.day)
+    )
+    if themes:
+        stmt = stmt.where(ReviewDailyRollup.theme.in_(list(themes)))
+
+    trends: Dict[str, Dict] = {}
+    for theme, day, count, total in session.execute(stmt):
+        trend = trends.setdefault(theme, {"theme": theme, "total": 0, "stars": 0, "points": []})
+        trend["total"] += count
+        trend["stars"] += total
+        trend["points"].append({"date": day.isoformat(), "count": count})
+    for trend in trends.values():
+        trend["average_rating"] = round(trend.pop("stars") / trend["total"], 2)
+    return sorted(trends.values(), key=lambda t: (-t["total"], t["theme"]))
@@ -0,0 +1,115 @@
+# packages/core/review_search.py
+"""Ranked full-text search over ``reviews.text``.
+
+On Postgres the query is ``search_vector @@ websearch_to_tsquery(...)``
+against the generated ``tsvector`` column and its GIN index, ranked with
+``ts_rank_cd``; users can type quotes, ``or`` and ``-word`` as in a web
+search box. On SQLite (local runs and tests) the same endpoint reads the
+``reviews_fts`` FTS5 table, ranked by ``bm25``; there the query is reduced
+to its words, all of which must match. Both stem English (``english`` config,
+porter tokenizer), so "waited" finds "waiting".
+
+Source, rating and date filters apply to the matching rows; the index does
+the narrowing, so a search over millions of reviews reads only the postings
+for its terms. Ranking is bounded: only the ``RANK_CANDIDATES`` newest
+matches that pass the filters are scored (newest by ``created_at`` on
+Postgres, by insertion order on SQLite), so a broad term such as "food"
+costs about as much as a rare one. Older matches beyond that are not
+returned. Selective filters still visit matches one by one until enough
+pass, so their cost follows the number of matches.
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+import re
+
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.orm import Session
+
+from .database import REVIEW_SEARCH_CONFIG, Review
+
+MAX_LIMIT = 100
+# Matches scored per query; beyond this, older matches are not ranked
+RANK_CANDIDATES = 1000
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class ReviewSearch:
+    q: str
+    source: Optional[str] = None
+    min_rating: Optional[int] = None
+    max_rating: Optional[int] = None
+    since: Optional[date] = None
+    until: Optional[date] = None  # inclusive
+    limit: int = 20
+
+    def __post_init__(self):
+        if not _WORD.search(self.q):
+            raise ValueError("Search query needs at least one word")
+        if not 1 <= self.limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+        if self.since and self.until and self.since > self.until:
+            raise ValueError("since must not be after until")
+
+
+def _fts5_query(q: str) -> str:
+    # Quoted terms: FTS5 operators and punctuation in user input stay literal
+    return " ".join(f'"{word}"' for word in _WORD.findall(q))
+
+
+def search_statement(dialect: str, search: ReviewSearch, candidates: int = RANK_CANDIDATES):
+    """``SELECT review, rank`` for ``dialect``, best match first.
+
+    Only the ``candidates`` most recent matches (after filters) are scored,
+    so a term found in half the corpus costs the same as a rare one.
+    """
+    filters = []
+    if search.source:
+        filters.append(Review.source == search.source)
+    if search.min_rating is not None:
+        filters.append(Review.rating >= search.min_rating)
+    if search.max_rating is not None:
+        filters.append(Review.rating <= search.max_rating)
+    if search.since:
+        filters.append(Review.created_at >= search.since)
+    if search.until:
+        filters.append(Review.created_at < search.until + timedelta(days=1))
+
+    if dialect == "postgresql":
+        vector = literal_column("reviews.search_vector")
+        query = func.websearch_to_tsquery(REVIEW_SEARCH_CONFIG, search.q)
+        pool = (
+            select(Review.review_id)
+            .where(vector.op("@@")(query), *filters)
+            .order_by(Review.created_at.desc())
+            .limit(candidates)
+            .subquery()
+        )
+        rank = func.ts_rank_cd(vector, query)
+        stmt = select(Review, rank.label("rank")).join(pool, pool.c.review_id == Review.review_id)
+    elif dialect == "sqlite":
+        fts = table("reviews_fts", column("rowid"))
+        # Newest rowids first: FTS5 walks its doclists backwards and stops at
+        # the limit, and bm25 runs only for the rows it returns. bm25 is
+        # lower-is-better; negate so both dialects sort rank descending.
+        pool = (
+            select(fts.c.rowid.label("rowid"), (-func.bm25(literal_column("reviews_fts"))).label("rank"))
+            .join(Review, literal_column("reviews.rowid") == fts.c.rowid)
+            .where(literal_column("reviews_fts").op("MATCH")(_fts5_query(search.q)), *filters)
+            .order_by(fts.c.rowid.desc())
+            .limit(candidates)
+            .subquery()
+        )
+        rank = pool.c.rank
+        stmt = select(Review, rank.label("rank")).join(pool, pool.c.rowid == literal_column("reviews.rowid"))
+    else:
+        raise NotImplementedError(f"Review search is not supported on {dialect}")
+
+    return stmt.order_by(rank.desc(), Review.created_at.desc(), Review.review_id).limit(search.limit)
+
+
+def search_reviews(session: Session, search: ReviewSearch,
+                   candidates: int = RANK_CANDIDATES) -> List[Tuple[Review, float]]:
+    stmt = search_statement(session.get_bind().dialect.name, search, candidates)
+    return [(review, float(rank)) for review, rank in session.execute(stmt).all()]
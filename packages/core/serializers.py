@@ -0,0 +1,94 @@
+# packages/core/serializers.py
+"""Model-to-JSON serialization shared by the API and the export.
+
+A ``Serializer`` is built once per model from an explicit field list: a
+single ``attrgetter`` pulls every column in one call and the row becomes a
+dict of raw values (datetimes, enums). ``dumps`` turns payloads into bytes,
+converting those values in the encoder rather than per field in Python:
+orjson when installed (it encodes datetimes and enums natively), otherwise
+the stdlib encoder with a ``default`` hook. Both produce the compact output
+FastAPI's ``JSONResponse`` did, so endpoints can return the bytes directly
+instead of going through ``jsonable_encoder``.
+"""
+from datetime import date, datetime
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+import json
+
+from .database import Change, Inventory, Menu, Review
+
+try:
+    import orjson
+except ImportError:  # optional speed-up: pip install ops-hub[speedups]
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    return _encoder.encode(payload).encode()
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    def dumps(payload: Any) -> bytes:
+        return orjson.dumps(payload, default=_default)
+else:
+    BACKEND = "json"
+    dumps = _json_dumps
+
+
+class Serializer:
+    """Dict view of a model row: ``fields`` in order, plus nested relations."""
+
+    def __init__(self, model, fields: Sequence[str], nested: Optional[Mapping[str, "Serializer"]] = None,
+                 defaults: Optional[Mapping[str, Any]] = None):
+        self.model = model
+        self.fields = tuple(fields)
+        self.nested = dict(nested or {})
+        self.defaults = dict(defaults or {})
+        getter = attrgetter(*self.fields)
+        self._get = getter if len(self.fields) > 1 else (lambda obj: (getter(obj),))
+
+    def with_defaults(self, **defaults) -> "Serializer":
+        """Variant that replaces empty values (None, '') with the given defaults."""
+        return Serializer(self.model, self.fields, self.nested, {**self.defaults, **defaults})
+
+    def __call__(self, obj) -> Dict[str, Any]:
+        row = dict(zip(self.fields, self._get(obj)))
+        for name, default in self.defaults.items():
+            if not row[name]:
+                row[name] = default
+        for name, serializer in self.nested.items():
+            related = getattr(obj, name)
+            row[name] = serializer(related) if related is not None else None
+        return row
+
+    def many(self, objs: Iterable) -> List[Dict[str, Any]]:
+        return [self(obj) for obj in objs]
+
+
+menu_serializer = Serializer(
+    Menu, ("item_id", "name", "price", "allergy_flags", "active", "created_at", "updated_at"),
+)
+inventory_serializer = Serializer(
+    Inventory, ("id", "item_id", "status", "notes", "expected_back", "updated_at"),
+    nested={"menu_item": Serializer(Menu, ("item_id", "name", "price", "allergy_flags", "active"))},
+)
+review_serializer = Serializer(
+    Review, ("review_id", "source", "rating", "text", "created_at", "theme", "url"),
+)
+change_serializer = Serializer(
+    Change, ("change_id", "title", "detail", "effective_from", "created_by", "is_active", "created_at"),
+)
@@ -1,6 +1,7 @@
+from typing import Iterable, Optional
 from .ports import InventoryPort, ReviewsPort
 from .domain import InventoryItem, Review
-from collections import Counter
+from .themes import get_matcher
 
 class InventoryService:
     def __init__(self, inventory_port: InventoryPort):
@@ -10,11 +11,14 @@ class InventoryService:
 
 class ReviewService:
     KEYWORDS = ["slow", "cold", "overcooked", "rude", "loud"]
-    def __init__(self, reviews_port: ReviewsPort):
+    def __init__(self, reviews_port: ReviewsPort, keywords: Optional[Iterable[str]] = None):
         self.port = reviews_port
+        # Compiled once per keyword set (see core.themes)
+        self.matcher = get_matcher(tuple(keywords or self.KEYWORDS))
     def recent(self, days=7) -> list[Review]:
         return self.port.fetch_recent(days)
-    def themes(self, days=7):
-        texts = [r.text.lower() for r in self.recent(days)]
-        counts = Counter({k: sum(k in t for t in texts) for k in self.KEYWORDS})
-        return sorted([(k,v) for k,v in counts.items() if v>0], key=lambda x:-x[1])
\ No newline at end of file
+    def themes(self, days=7, reviews: Optional[Iterable[Review]] = None):
+        """(phrase, review count) most frequent first; pass ``reviews`` to skip the fetch."""
+        if reviews is None:
+            reviews = self.recent(days)
+        return self.matcher.ranked(r.text for r in reviews if r.text)
\ No newline at end of file
@@ -0,0 +1,121 @@
+# packages/core/theme_tagging.py
+"""Incremental theme tagging for reviews.
+
+``tag_new_reviews`` tags reviews whose ``tagged_at`` is still NULL, in
+ingest order and in batches, through a partial index that holds only those
+rows. Every theme a review matches goes into ``review_themes``; the first one
+in keyword order is also written to ``reviews.theme``, the batch is added to
+the daily rollup (see core.review_rollup) and its reviews get ``tagged_at``,
+all in one transaction, so each review is counted exactly once. Theme counts
+are then a ``GROUP BY`` over ``review_themes`` instead of a rescan of review
+text.
+
+A per-row marker rather than a position: ``ingested_at`` is taken before the
+inserting transaction commits, so a review committed late can land behind a
+``(ingested_at, review_id)`` watermark and would be skipped for good. Nothing
+is skipped when the queue is "rows not marked yet".
+
+The ``review_themes`` watermark row records the keyword set the tags were
+built with; when THEME_KEYWORDS changes, the tags are dropped and rebuilt on
+the next run. The row is locked per batch on Postgres, so concurrent runs
+take turns. Only the worker's themes job calls this; read endpoints do not.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.orm import Session
+
+from .database import Review, ReviewTheme, Watermark, dialect_insert
+from .review_rollup import add_to_rollup, reset_rollup
+from .themes import ThemeMatcher
+
+WATERMARK = "review_themes"
+BATCH_SIZE = 1000
+
+
+def _watermark(session: Session) -> Watermark:
+    session.execute(dialect_insert(session, Watermark).values(name=WATERMARK).on_conflict_do_nothing())
+    return session.scalars(
+        select(Watermark).where(Watermark.name == WATERMARK).with_for_update().execution_options(populate_existing=True)
+    ).one()
+
+
+def _pending(batch_size: int):
+    return (
+        select(Review.review_id, Review.text, Review.ingested_at, Review.created_at, Review.source, Review.rating)
+        .where(Review.tagged_at.is_(None))
+        .order_by(Review.ingested_at, Review.review_id)
+        .limit(batch_size)
+    )
+
+
+def tag_new_reviews(session: Session, matcher: ThemeMatcher, batch_size: int = BATCH_SIZE) -> int:
+    """Tag reviews not tagged yet; commits after each batch. Returns reviews tagged."""
+    tagged = 0
+    while True:
+        watermark = _watermark(session)
+        if watermark.version != matcher.fingerprint:
+            # Keyword set changed (or first run): rebuild from scratch. Only
+            # primary themes this stage wrote are cleared, not imported ones.
+            written = exists().where(ReviewTheme.review_id == Review.review_id, ReviewTheme.theme == Review.theme)
+            session.execute(update(Review).where(written).values(theme=None).execution_options(synchronize_session=False))
+            session.execute(delete(ReviewTheme))
+            reset_rollup(session)
+            session.execute(
+                update(Review).where(Review.tagged_at.is_not(None)).values(tagged_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            watermark.position, watermark.last_key, watermark.version = None, None, matcher.fingerprint
+
+        rows = session.execute(_pending(batch_size)).all()
+        if not rows:
+            session.commit()
+            return tagged
+
+        links, primary, tagged_rows = [], [], []
+        for row in rows:
+            themes = matcher.ordered(row.text or "")
+            links.extend({"review_id": row.review_id, "theme": theme} for theme in themes)
+            if themes:
+                primary.append({"review_id": row.review_id, "theme": themes[0]})
+            tagged_rows.append((row.created_at or row.ingested_at, row.source, row.rating, themes))
+        if links:
+            session.execute(dialect_insert(session, ReviewTheme).on_conflict_do_nothing(), links)
+        if primary:
+            session.execute(update(Review), primary)  # bulk UPDATE by primary key
+        # Same transaction as the marker, so each review is counted once
+        add_to_rollup(session, tagged_rows)
+        session.execute(
+            update(Review).where(Review.review_id.in_([row.review_id for row in rows]))
+            .values(tagged_at=datetime.utcnow()).execution_options(synchronize_session=False)
+        )
+
+        # Progress only (the marker decides what is pending)
+        last = rows[-1]
+        if watermark.position is None or last.ingested_at > watermark.position:
+            watermark.position, watermark.last_key = last.ingested_at, last.review_id
+        session.commit()
+        tagged += len(rows)
+
+
+def reset_review_aggregates(session: Session) -> None:
+    """Forget tags and rollups so the next run rebuilds them. Call after bulk
+    deletes of reviews (seeding, clearing), which the rollup cannot see."""
+    session.execute(delete(ReviewTheme))
+    reset_rollup(session)
+    session.execute(delete(Watermark).where(Watermark.name == WATERMARK))
+
+
+def theme_counts(session: Session, days: int, now: Optional[datetime] = None) -> List[Tuple[str, int]]:
+    """(theme, reviews) for reviews created in the last ``days``, most frequent first."""
+    cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+    count = func.count().label("count")
+    stmt = (
+        select(ReviewTheme.theme, count)
+        .join(Review, Review.review_id == ReviewTheme.review_id)
+        .where(Review.created_at >= cutoff)
+        .group_by(ReviewTheme.theme)
+        .order_by(count.desc(), ReviewTheme.theme)
+    )
+    return [(theme, n) for theme, n in session.execute(stmt)]
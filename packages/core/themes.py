@@ -0,0 +1,133 @@
+# packages/core/themes.py
+"""Theme phrase matching for reviews.
+
+Small keyword sets (the default five) are checked phrase by phrase: a
+substring test, confirmed on whole words only when it hits. For larger sets,
+single-word phrases are matched by intersecting the phrase set with the
+review's word tokens. Multi-word (or punctuated) phrases are compiled into
+one regex shaped like a trie (``slow(?:\\s+service)?|ticket\\s+times|...``),
+run only on reviews containing one of their first words. Either way each
+review is scanned once, and the cost no longer grows with the number of
+phrases. Matching is case-insensitive, on whole words, and any run of
+whitespace in the text matches the single space in a phrase.
+
+Each match position yields its longest phrase; shorter phrases that are a
+prefix of it ("slow" inside "slow service") are counted too, so
+overlapping phrases all register.
+"""
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+import hashlib
+import re
+
+_END = ""  # trie key marking the end of a phrase
+_WORD = re.compile(r"\w+")
+_NON_WORD = re.compile(r"\W")
+
+
+def normalize(phrase: str) -> str:
+    return " ".join(phrase.lower().split())
+
+
+def _trie_pattern(node: Dict) -> str:
+    terminal = _END in node
+    branches = []
+    for char in sorted(k for k in node if k != _END):
+        head = r"\s+" if char == " " else re.escape(char)
+        branches.append(head + _trie_pattern(node[char]))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        # Greedy: try the longer phrase first, fall back to the one ending here
+        return "(?:" + body + ")?"
+    return body
+
+
+def _phrase_pattern(phrase: str) -> "re.Pattern":
+    return re.compile(r"(?<!\w)" + re.escape(phrase).replace(r"\ ", r"\s+") + r"(?!\w)")
+
+
+class ThemeMatcher:
+    # Up to this many phrases, a C substring check per phrase (verified on
+    # whole words only when it hits) beats tokenizing every review
+    SMALL_SET = 24
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases: List[str] = list(dict.fromkeys(p for p in map(normalize, phrases) if p))
+        self.order: Dict[str, int] = {p: i for i, p in enumerate(self.phrases)}
+        self.fingerprint = hashlib.sha256("\n".join(self.phrases).encode()).hexdigest()[:16]
+        self._small = None
+        if len(self.phrases) <= self.SMALL_SET:
+            # Prefilter on the phrase's first word: whitespace inside the phrase may vary
+            self._small = [(p.split(" ")[0], _phrase_pattern(p), p) for p in self.phrases]
+
+        # Plain words (the common case) are a set lookup against the review's
+        # tokens; only multi-word or punctuated phrases need the regex
+        self._words = frozenset(p for p in self.phrases if _WORD.fullmatch(p))
+        complex_phrases = [p for p in self.phrases if p not in self._words]
+
+        trie: Dict = {}
+        for phrase in complex_phrases:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[_END] = True
+
+        # A match reports only the longest phrase at its position; any phrase
+        # that is a prefix of it ending before a non-word character matched too
+        # (plain-word prefixes are already found by the token lookup)
+        known = set(complex_phrases)
+        self._implied: Dict[str, FrozenSet[str]] = {}
+        for phrase in complex_phrases:
+            prefixes = [phrase[:i] for i in range(1, len(phrase)) if _NON_WORD.match(phrase, i)]
+            self._implied[phrase] = frozenset([phrase] + [p for p in prefixes if p in known])
+
+        # Skip the regex for reviews that contain none of the phrases' first words
+        first_words = [_WORD.match(p) for p in complex_phrases]
+        self._first_words = frozenset(m.group() for m in first_words) if all(first_words) else None
+
+        self._pattern = None
+        if complex_phrases:
+            # Zero-width lookahead so overlapping phrases at later positions are
+            # still found; (?<!\w)/(?!\w) rather than \b so phrases may end in
+            # punctuation ("20+ min")
+            self._pattern = re.compile(r"(?<!\w)(?=(" + _trie_pattern(trie) + r")(?!\w))")
+
+    def find(self, text: str) -> Set[str]:
+        """Phrases that occur in ``text``."""
+        if not text:
+            return set()
+        text = text.lower()
+        if self._small is not None:
+            return {phrase for head, pattern, phrase in self._small if head in text and pattern.search(text)}
+        tokens = set(_WORD.findall(text))
+        found = set(self._words.intersection(tokens))
+        if self._pattern is not None and (self._first_words is None or not self._first_words.isdisjoint(tokens)):
+            for match in set(self._pattern.findall(text)):
+                found |= self._implied.get(match) or self._implied[normalize(match)]
+        return found
+
+    def count(self, texts: Iterable[str]) -> Counter:
+        """Number of texts each phrase occurs in (one streaming pass)."""
+        counts: Counter = Counter()
+        find = self.find
+        for text in texts:
+            counts.update(find(text))
+        return counts
+
+    def ordered(self, text: str) -> List[str]:
+        """Phrases in ``text``, in keyword-set order."""
+        return sorted(self.find(text), key=self.order.__getitem__)
+
+    def ranked(self, texts: Iterable[str]) -> List[Tuple[str, int]]:
+        """(phrase, count) for phrases that occur, most frequent first; ties keep phrase order."""
+        counts = self.count(texts)
+        return sorted(((p, counts[p]) for p in self.phrases if counts[p]), key=lambda x: -x[1])
+
+
+@lru_cache(maxsize=64)
+def get_matcher(phrases: Tuple[str, ...]) -> ThemeMatcher:
+    """Compiled matcher for a keyword set, built once per distinct set."""
+    return ThemeMatcher(phrases)
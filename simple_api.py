@@ -2,23 +2,48 @@
 """
 Simple API without PDF dependencies for testing
 """
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import text
-import json
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
-import bcrypt
 from sqlalchemy.orm import Session, joinedload
+from contextlib import asynccontextmanager
 from datetime import datetime, date, timedelta
+from typing import Optional
 import sys
 import os
 
 # Add the project root to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
 
-from packages.core.database import get_db, Inventory, Review, Change, Menu, StockStatus, Acknowledgement, Shift
+from packages.core.database import get_db, get_async_db, Inventory, Review, Change, Menu, StockStatus, Acknowledgement, Shift, User, UserRole
+from packages.core.acknowledgements import ack_coverage, record_acks, unacknowledged_changes
+from packages.core.auth_cache import CachedUser, get_token_cache, get_user_cache
+from packages.core.brief_cache import get_brief_cache
+from packages.core.brief_repository import BriefRepository, load_brief
+from packages.core.http_cache import READ_POLICIES, ConditionalGetMiddleware, get_table_versions
+from packages.core.metrics import install_metrics
+from packages.core.data_export import stream_export
+from packages.core.push import (
+    KEEPALIVE_SECONDS, SubscriptionClosed, get_push_hub, parse_kinds, sse_stream
+)
+from packages.core.review_search import ReviewSearch, search_reviews
+from packages.core.passwords import MAX_PASSWORD_BYTES, HasherBusy, get_password_hasher, hash_sync, verify_sync
+from packages.core.pagination import (
+    INVENTORY, MENU, REVIEWS, CHANGES, PaginationError, prepare_page, page_envelope, wants_page
+)
+from packages.core.serializers import (
+    dumps, change_serializer, inventory_serializer, menu_serializer, review_serializer
+)
+from packages.core.theme_tagging import theme_counts, reset_review_aggregates
+from packages.core.review_rollup import rating_trend, theme_trend
+from packages.core.engine import (
+    init_engine, dispose_engine, init_async_engine, dispose_async_engine, pool_stats,
+    get_session_factory
+)
 
 # JWT Configuration
 SECRET_KEY = "your-secret-key-change-in-production"
@@ -28,12 +53,33 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 # Security
 security = HTTPBearer()
 
+brief_cache = get_brief_cache()
+table_versions = get_table_versions()
+push_hub = get_push_hub()
+token_cache = get_token_cache()
+user_cache = get_user_cache()
+password_hasher = get_password_hasher()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared DB engines/pools on startup and release them on shutdown"""
+    init_engine()
+    init_async_engine()
+    yield
+    password_hasher.shutdown()
+    await dispose_async_engine()
+    dispose_engine()
+
 app = FastAPI(
     title="Restaurant Ops Hub API", 
     version="0.1.0",
-    description="Centralized operations management for restaurants"
+    description="Centralized operations management for restaurants",
+    lifespan=lifespan
 )
 
+# ETag/304 for polled read endpoints; added first so CORS wraps the 304s too
+app.add_middleware(ConditionalGetMiddleware, policies=READ_POLICIES, versions=table_versions)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -43,16 +89,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GET /metrics and per-route timings when METRICS_ENABLED; added last so it times the whole stack
+install_metrics(app)
+
 # Authentication helper functions
+# These block for the whole bcrypt call; request handlers await password_hasher instead
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt"""
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+    """Hash a password using bcrypt at the configured work factor"""
+    return hash_sync(password, password_hasher.rounds)
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    return verify_sync(password, hashed)
 
 def create_access_token(data: dict) -> str:
     """Create a JWT access token"""
@@ -63,9 +111,13 @@ def create_access_token(data: dict) -> str:
     return encoded_jwt
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
-    """Verify JWT token and return user data"""
+    """Verify JWT token and return user data (verified tokens are cached until their exp)"""
+    token = credentials.credentials
+    cached = token_cache.get_claims(token)
+    if cached is not None:
+        return cached
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(
@@ -73,7 +125,9 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        return {"user_id": user_id, "role": payload.get("role", "staff")}
+        claims = {"user_id": user_id, "role": payload.get("role", "staff")}
+        token_cache.put_claims(token, claims, payload.get("exp"))
+        return claims
     except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -81,16 +135,87 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security))
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-def get_current_user(token_data: dict = Depends(verify_token), db: Session = Depends(get_db)) -> User:
-    """Get current user from database"""
-    user = db.query(User).filter(User.user_id == token_data["user_id"]).first()
-    if user is None:
+def _fetch_user(user_id: str) -> Optional[User]:
+    with get_session_factory()() as db:
+        return db.get(User, user_id)
+
+def get_current_user(token_data: dict = Depends(verify_token)) -> CachedUser:
+    """Get the current user (a short-TTL snapshot; the database is only hit on a miss)"""
+    user = user_cache.load(token_data["user_id"], _fetch_user)
+    if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
     return user
 
+def _busy() -> HTTPException:
+    return HTTPException(status_code=503, detail="Too many logins in progress, retry shortly",
+                         headers={"Retry-After": "1"})
+
+def _password(value) -> str:
+    if not isinstance(value, str) or not value:
+        raise HTTPException(status_code=400, detail="password must be a non-empty string")
+    if len(value.encode("utf-8")) > MAX_PASSWORD_BYTES:
+        raise HTTPException(status_code=400, detail=f"password must be at most {MAX_PASSWORD_BYTES} bytes")
+    return value
+
+@app.post("/api/v1/auth/login")
+async def login(request: dict, db: AsyncSession = Depends(get_async_db)):
+    """Exchange email/password for a bearer token; bcrypt runs on the hasher pool"""
+    email, password = request.get("email"), request.get("password")
+    if not isinstance(email, str) or not email or not password:
+        raise HTTPException(status_code=400, detail="email and password are required")
+    password = _password(password)
+    user = (await db.execute(select(User).where(User.email == email))).scalar_one_or_none()
+    try:
+        result = await password_hasher.verify(password, user.password_hash if user and user.is_active else None)
+    except HasherBusy:
+        raise _busy()
+    if not result.ok:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+    if result.needs_rehash:
+        # BCRYPT_ROUNDS changed since this hash was made; upgrade it while we know the password
+        try:
+            user.password_hash = await password_hasher.hash(password)
+            await db.commit()
+        except HasherBusy:
+            pass  # next login will try again
+    role = user.role.value if hasattr(user.role, 'value') else user.role
+    return {"access_token": create_access_token({"sub": user.user_id, "role": role}), "token_type": "bearer"}
+
+@app.put("/api/v1/admin/users/{user_id}/password")
+async def set_password(user_id: str, request: dict, db: AsyncSession = Depends(get_async_db),
+                       current_user: CachedUser = Depends(get_current_user)):
+    """Set a user's password; managers may set anyone's, others only their own"""
+    if current_user.user_id != user_id and current_user.role not in (UserRole.MANAGER, UserRole.ADMIN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to set this user's password")
+    password = _password(request.get("password"))
+    user = await db.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    try:
+        user.password_hash = await password_hasher.hash(password)
+    except HasherBusy:
+        raise _busy()
+    await db.commit()
+    return {"message": "Password updated"}
+
+@app.get("/api/v1/admin/passwords")
+def get_password_hasher_stats():
+    """Hasher pool occupancy and rejections"""
+    return password_hasher.stats()
+
+@app.get("/api/v1/auth/me")
+def get_me(user: CachedUser = Depends(get_current_user)):
+    """The authenticated user"""
+    return {"user_id": user.user_id, "name": user.name, "email": user.email, "role": user.role}
+
+@app.get("/api/v1/admin/auth-cache")
+def get_auth_cache_stats():
+    """Hit rates of the verified-token and user caches"""
+    return {"tokens": token_cache.stats(), "users": user_cache.stats()}
+
 @app.get("/ping")
 def ping():
     """Health check endpoint"""
@@ -100,80 +225,93 @@ def ping():
 def health():
     return {"ok": True, "message": "API is running"}
 
+def json_response(payload) -> Response:
+    """Encode once with the shared serializer, skipping FastAPI's jsonable_encoder pass"""
+    return Response(content=dumps(payload), media_type="application/json")
+
+async def fetch_page(db: AsyncSession, resource, limit, cursor, fields, where=()) -> Response:
+    try:
+        stmt, names, limit = prepare_page(resource, limit, cursor, fields, where)
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    rows = (await db.execute(stmt)).all()
+    return json_response(page_envelope(resource, names, rows, limit))
+
+def fetch_page_sync(db: Session, resource, limit, cursor, fields, where=()) -> Response:
+    try:
+        stmt, names, limit = prepare_page(resource, limit, cursor, fields, where)
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(page_envelope(resource, names, db.execute(stmt).all(), limit))
+
+# List endpoints return a bare array unless limit/cursor/fields is given, in
+# which case they return {"items", "next_cursor", "limit"} (keyset paginated)
 @app.get("/api/v1/inventory")
-def get_inventory(db: Session = Depends(get_db)):
+async def get_inventory(limit: Optional[int] = None, cursor: Optional[str] = None, fields: Optional[str] = None,
+                        db: AsyncSession = Depends(get_async_db)):
     """Get current inventory status from database"""
-    inventory_items = db.query(Inventory).options(joinedload(Inventory.menu_item)).all()
-    return [
-        {
-            "id": item.id,
-            "item_id": item.item_id,
-            "status": item.status.value if hasattr(item.status, 'value') else str(item.status),
-            "notes": item.notes,
-            "expected_back": item.expected_back.isoformat() if item.expected_back else None,
-            "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-            "menu_item": {
-                "item_id": item.menu_item.item_id if item.menu_item else None,
-                "name": item.menu_item.name if item.menu_item else None,
-                "price": item.menu_item.price if item.menu_item else None,
-                "allergy_flags": item.menu_item.allergy_flags if item.menu_item else None,
-                "active": item.menu_item.active if item.menu_item else None
-            } if item.menu_item else None
-        }
-        for item in inventory_items
-    ]
+    if wants_page(limit, cursor, fields):
+        return await fetch_page(db, INVENTORY, limit, cursor, fields)
+    result = await db.execute(select(Inventory).options(joinedload(Inventory.menu_item)))
+    return json_response(inventory_serializer.many(result.scalars()))
 
 @app.get("/api/v1/menu")
-def get_menu_items(db: Session = Depends(get_db)):
+def get_menu_items(limit: Optional[int] = None, cursor: Optional[str] = None, fields: Optional[str] = None,
+                   db: Session = Depends(get_db)):
     """Get all menu items from database"""
-    menu_items = db.query(Menu).all()
-    return [
-        {
-            "item_id": item.item_id,
-            "name": item.name,
-            "price": item.price,
-            "allergy_flags": item.allergy_flags,
-            "active": item.active,
-            "created_at": item.created_at.isoformat() if item.created_at else None,
-            "updated_at": item.updated_at.isoformat() if item.updated_at else None
-        }
-        for item in menu_items
-    ]
+    if wants_page(limit, cursor, fields):
+        return fetch_page_sync(db, MENU, limit, cursor, fields)
+    return json_response(menu_serializer.many(db.query(Menu)))
 
 @app.get("/api/v1/reviews")
-def get_reviews(days: int = 7, db: Session = Depends(get_db)):
+async def get_reviews(days: int = 7, limit: Optional[int] = None, cursor: Optional[str] = None,
+                      fields: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
     """Get recent reviews from database"""
     cutoff_date = datetime.utcnow() - timedelta(days=days)
-    reviews = db.query(Review).filter(Review.created_at >= cutoff_date).all()
-    return [
-        {
-            "review_id": review.review_id,
-            "source": review.source,
-            "rating": review.rating,
-            "text": review.text,
-            "created_at": review.created_at.isoformat() if review.created_at else None,
-            "theme": review.theme,
-            "url": review.url
-        }
-        for review in reviews
-    ]
+    if wants_page(limit, cursor, fields):
+        return await fetch_page(db, REVIEWS, limit, cursor, fields, where=[Review.created_at >= cutoff_date])
+    result = await db.execute(select(Review).where(Review.created_at >= cutoff_date))
+    return json_response(review_serializer.many(result.scalars()))
+
+@app.get("/api/v1/reviews/search")
+def search_reviews_endpoint(q: str, source: Optional[str] = None, min_rating: Optional[int] = None,
+                            max_rating: Optional[int] = None, since: Optional[date] = None,
+                            until: Optional[date] = None, limit: int = 20, db: Session = Depends(get_db)):
+    """Ranked full-text search over review text, best match first"""
+    try:
+        search = ReviewSearch(q, source, min_rating, max_rating, since, until, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response([{**review_serializer(review), "rank": rank} for review, rank in search_reviews(db, search)])
+
+@app.get("/api/v1/reviews/themes")
+def get_review_themes(days: int = 7, db: Session = Depends(get_db)):
+    """Theme counts for reviews in the window, aggregated from review_themes"""
+    # Read-only: tagging is the worker's themes job
+    return [{"name": theme, "count": count} for theme, count in theme_counts(db, days)]
+
+# Trends read only the daily rollup, so a 365-day chart costs O(days)
+@app.get("/api/v1/reviews/trends/ratings")
+def get_rating_trend(days: int = Query(30, ge=1, le=365), source: Optional[str] = None,
+                     db: Session = Depends(get_db)):
+    """Daily review count and average rating"""
+    return rating_trend(db, days, source=source)
+
+@app.get("/api/v1/reviews/trends/themes")
+def get_theme_trend(days: int = Query(30, ge=1, le=365), db: Session = Depends(get_db)):
+    """Per-theme totals, average rating and daily counts"""
+    return theme_trend(db, days)
 
 @app.get("/api/v1/changes")
-def get_changes(db: Session = Depends(get_db)):
+async def get_changes(limit: Optional[int] = None, cursor: Optional[str] = None, fields: Optional[str] = None,
+                      db: AsyncSession = Depends(get_async_db)):
     """Get active changes/announcements ordered chronologically (most recent first)"""
-    changes = db.query(Change).filter(Change.is_active == True).order_by(Change.created_at.desc()).all()
-    return [
-        {
-            "change_id": change.change_id,
-            "title": change.title,
-            "detail": change.detail,
-            "effective_from": change.effective_from.isoformat() if change.effective_from else None,
-            "created_by": change.created_by,
-            "is_active": change.is_active,
-            "created_at": change.created_at.isoformat() if change.created_at else None
-        }
-        for change in changes
-    ]
+    if wants_page(limit, cursor, fields):
+        return await fetch_page(db, CHANGES, limit, cursor, fields, where=[Change.is_active == True])
+    result = await db.execute(
+        select(Change).where(Change.is_active == True).order_by(Change.created_at.desc())
+    )
+    return json_response(change_serializer.many(result.scalars()))
 
 @app.post("/api/v1/changes")
 def create_change(
@@ -203,102 +341,103 @@ def create_change(
         
         db.add(new_change)
         db.commit()
+        brief_cache.invalidate()
+        table_versions.bump("changes")
         db.refresh(new_change)
         
-        return {
-            "change_id": new_change.change_id,
-            "title": new_change.title,
-            "detail": new_change.detail,
-            "effective_from": new_change.effective_from.isoformat() if new_change.effective_from else None,
-            "created_by": new_change.created_by,
-            "is_active": new_change.is_active,
-            "created_at": new_change.created_at.isoformat() if new_change.created_at else None
-        }
+        created = change_serializer(new_change)
+        push_hub.publish("change", created)
+        return json_response(created)
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to create change: {str(e)}")
 
+@app.post("/api/v1/acknowledgements/bulk")
+def acknowledge_changes(request: dict, db: Session = Depends(get_db)):
+    """Record many acks in one statement: {"acks": [{"user_id", "change_id"}, ...]}"""
+    try:
+        pairs = [(ack["user_id"], ack["change_id"]) for ack in request.get("acks", [])]
+    except (KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Each ack needs user_id and change_id")
+    if not all(isinstance(user_id, str) and isinstance(change_id, str) for user_id, change_id in pairs):
+        raise HTTPException(status_code=400, detail="user_id and change_id must be strings")
+    report = record_acks(db, pairs)
+    db.commit()
+    return report.to_dict()
+
+@app.get("/api/v1/users/{user_id}/unacknowledged-changes")
+def get_unacknowledged_changes(user_id: str, db: Session = Depends(get_db)):
+    """Active changes the user has not acknowledged yet (newest first)"""
+    return json_response(change_serializer.many(unacknowledged_changes(db, user_id)))
+
+@app.get("/api/v1/acknowledgements/coverage")
+def get_ack_coverage(db: Session = Depends(get_db)):
+    """Per active change: acknowledged staff out of active staff"""
+    return ack_coverage(db)
+
+# Push channel for tablets: 86/inventory transitions and new changes as they are written
+@app.get("/api/v1/events")
+async def stream_events(kinds: Optional[str] = None):
+    """Server-sent events; ?kinds=eighty_six,inventory,change filters (default all)"""
+    try:
+        subscriber = push_hub.subscribe(parse_kinds(kinds))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(
+        sse_stream(push_hub, subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.websocket("/api/v1/ws")
+async def push_socket(websocket: WebSocket, kinds: Optional[str] = None):
+    """The same events over a WebSocket, one JSON text frame each"""
+    try:
+        requested = parse_kinds(kinds)
+    except ValueError:
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    subscriber = push_hub.subscribe(requested)
+    try:
+        while True:
+            event = await subscriber.get(timeout=KEEPALIVE_SECONDS)
+            # Keepalives also surface a vanished client, since we never read
+            await websocket.send_text(event.json.decode() if event is not None else '{"kind":"keepalive"}')
+    except SubscriptionClosed:
+        await websocket.close(code=1013)  # dropped for falling behind: reconnect and refetch
+    except WebSocketDisconnect:
+        pass
+    finally:
+        push_hub.unsubscribe(subscriber)
+
 @app.get("/api/v1/brief/today")
-def get_today_brief(db: Session = Depends(get_db)):
-    """Generate today's pre-shift brief"""
-    today = date.today()
-    
-    # Get 86 items
-    eighty_six_items = db.query(Inventory).filter(Inventory.status == StockStatus.EIGHTY_SIX).all()
-    
-    # Get low stock items
-    low_stock_items = db.query(Inventory).filter(Inventory.status == StockStatus.LOW).all()
-    
-    # Get recent reviews (last 7 days)
-    cutoff_date = datetime.utcnow() - timedelta(days=7)
-    recent_reviews = db.query(Review).filter(Review.created_at >= cutoff_date).all()
-    
-    # Get active changes
-    changes = db.query(Change).filter(Change.is_active == True).all()
+async def get_today_brief(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Generate today's pre-shift brief (served from the snapshot cache until a write invalidates it)"""
+    cached, generation = brief_cache.get()
+    if cached is None:
+        brief = build_brief(await db.run_sync(load_brief))
+        fingerprint = dumps({k: v for k, v in brief.items() if k != "generated_at"})
+        cached = brief_cache.put(dumps(brief), generation, fingerprint=fingerprint)
     
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if cached.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+brief_inventory = inventory_serializer.with_defaults(notes="No notes")
+brief_review = review_serializer.with_defaults(text="No text")
+brief_change = change_serializer.with_defaults(detail="No details")
+
+def build_brief(snapshot) -> dict:
+    """Serialize a BriefSnapshot into the brief payload (raw values; encode with dumps)"""
     return {
-        "date": today.isoformat(),
-        "eighty_six_items": [
-            {
-                "id": item.id,
-                "item_id": item.item_id,
-                "status": item.status.value if hasattr(item.status, 'value') else str(item.status),
-                "notes": item.notes or "No notes",
-                "expected_back": item.expected_back.isoformat() if item.expected_back else None,
-                "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-                "menu_item": {
-                    "item_id": item.menu_item.item_id if item.menu_item else item.item_id,
-                    "name": item.menu_item.name if item.menu_item else "Unknown Item",
-                    "price": item.menu_item.price if item.menu_item else 0,
-                    "allergy_flags": item.menu_item.allergy_flags if item.menu_item else None,
-                    "active": item.menu_item.active if item.menu_item else True
-                } if item.menu_item else None
-            }
-            for item in eighty_six_items
-        ],
-        "low_stock_items": [
-            {
-                "id": item.id,
-                "item_id": item.item_id,
-                "status": item.status.value if hasattr(item.status, 'value') else str(item.status),
-                "notes": item.notes or "No notes",
-                "expected_back": item.expected_back.isoformat() if item.expected_back else None,
-                "updated_at": item.updated_at.isoformat() if item.updated_at else None,
-                "menu_item": {
-                    "item_id": item.menu_item.item_id if item.menu_item else item.item_id,
-                    "name": item.menu_item.name if item.menu_item else "Unknown Item",
-                    "price": item.menu_item.price if item.menu_item else 0,
-                    "allergy_flags": item.menu_item.allergy_flags if item.menu_item else None,
-                    "active": item.menu_item.active if item.menu_item else True
-                } if item.menu_item else None
-            }
-            for item in low_stock_items
-        ],
-        "recent_reviews": [
-            {
-                "review_id": review.review_id,
-                "source": review.source,
-                "rating": review.rating,
-                "text": review.text or "No text",
-                "created_at": review.created_at.isoformat() if review.created_at else None,
-                "theme": review.theme,
-                "url": review.url
-            }
-            for review in recent_reviews
-        ],
-        "changes": [
-            {
-                "change_id": change.change_id,
-                "title": change.title,
-                "detail": change.detail or "No details",
-                "effective_from": change.effective_from.isoformat() if change.effective_from else None,
-                "created_by": change.created_by,
-                "is_active": change.is_active,
-                "created_at": change.created_at.isoformat() if change.created_at else None
-            }
-            for change in changes
-        ],
-        "generated_at": datetime.utcnow().isoformat()
+        "date": date.today(),
+        "eighty_six_items": brief_inventory.many(snapshot.eighty_six_items),
+        "low_stock_items": brief_inventory.many(snapshot.low_stock_items),
+        "recent_reviews": brief_review.many(snapshot.recent_reviews),
+        "changes": brief_change.many(snapshot.changes),
+        "generated_at": datetime.utcnow()
     }
 
 @app.get("/api/v1/brief/today/pdf")
@@ -307,12 +446,11 @@ def get_today_brief_pdf(db: Session = Depends(get_db)):
     try:
         # Get brief data (same as the JSON endpoint)
         today = date.today()
-        
-        eighty_six_items = db.query(Inventory).filter(Inventory.status == StockStatus.EIGHTY_SIX).all()
-        low_stock_items = db.query(Inventory).filter(Inventory.status == StockStatus.LOW).all()
-        cutoff_date = datetime.utcnow() - timedelta(days=7)
-        recent_reviews = db.query(Review).filter(Review.created_at >= cutoff_date).all()
-        changes = db.query(Change).filter(Change.is_active == True).all()
+        snapshot = BriefRepository(db).load()
+        eighty_six_items = snapshot.eighty_six_items
+        low_stock_items = snapshot.low_stock_items
+        recent_reviews = snapshot.recent_reviews
+        changes = snapshot.changes
         
         # Convert to dictionaries for PDF generation
         brief_data = {
@@ -416,6 +554,11 @@ def get_today_brief_pdf(db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
+@app.get("/api/v1/admin/db-pool")
+def get_db_pool_stats():
+    """Connection pool occupancy and counters, for sizing DB_POOL_SIZE/DB_MAX_OVERFLOW"""
+    return pool_stats()
+
 @app.get("/api/v1/admin/stats")
 def get_admin_stats(db: Session = Depends(get_db)):
     """Get current database statistics"""
@@ -444,7 +587,11 @@ def inject_test_data(db: Session = Depends(get_db)):
         
         # Execute the SQL
         db.execute(text(seed_sql))
+        # The seed deletes and re-inserts reviews the tagging stage has already counted
+        reset_review_aggregates(db)
         db.commit()
+        brief_cache.invalidate()
+        table_versions.bump("menus", "inventory", "changes")
         
         # Get counts
         menu_count = db.query(Menu).count()
@@ -471,11 +618,14 @@ def clear_all_data(db: Session = Depends(get_db)):
         db.query(Acknowledgement).delete()
         db.query(Shift).delete()
         db.query(Change).delete()
+        reset_review_aggregates(db)
         db.query(Review).delete()
         db.query(Inventory).delete()
         db.query(Menu).delete()
         
         db.commit()
+        brief_cache.invalidate()
+        table_versions.bump("menus", "inventory", "changes")
         
         return {
             "message": "All data cleared successfully",
@@ -486,77 +636,25 @@ def clear_all_data(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Failed to clear data: {str(e)}")
 
 @app.get("/api/v1/admin/export-data")
-def export_data(db: Session = Depends(get_db)):
-    """Export all data as JSON"""
-    try:
-        # Get all data
-        menus = db.query(Menu).all()
-        inventory = db.query(Inventory).all()
-        reviews = db.query(Review).all()
-        changes = db.query(Change).all()
-        
-        # Convert to dictionaries
-        export_data = {
-            "menus": [
-                {
-                    "item_id": menu.item_id,
-                    "name": menu.name,
-                    "price": menu.price,
-                    "allergy_flags": menu.allergy_flags,
-                    "active": menu.active,
-                    "created_at": menu.created_at.isoformat() if menu.created_at else None,
-                    "updated_at": menu.updated_at.isoformat() if menu.updated_at else None
-                }
-                for menu in menus
-            ],
-            "inventory": [
-                {
-                    "id": item.id,
-                    "item_id": item.item_id,
-                    "status": item.status.value if hasattr(item.status, 'value') else str(item.status),
-                    "notes": item.notes,
-                    "expected_back": item.expected_back.isoformat() if item.expected_back else None,
-                    "updated_at": item.updated_at.isoformat() if item.updated_at else None
-                }
-                for item in inventory
-            ],
-            "reviews": [
-                {
-                    "review_id": review.review_id,
-                    "source": review.source,
-                    "rating": review.rating,
-                    "text": review.text,
-                    "created_at": review.created_at.isoformat() if review.created_at else None,
-                    "theme": review.theme,
-                    "url": review.url
-                }
-                for review in reviews
-            ],
-            "changes": [
-                {
-                    "change_id": change.change_id,
-                    "title": change.title,
-                    "detail": change.detail,
-                    "effective_from": change.effective_from.isoformat() if change.effective_from else None,
-                    "created_by": change.created_by,
-                    "is_active": change.is_active,
-                    "created_at": change.created_at.isoformat() if change.created_at else None
-                }
-                for change in changes
-            ],
-            "exported_at": datetime.utcnow().isoformat(),
-            "total_records": len(menus) + len(inventory) + len(reviews) + len(changes)
+def export_data(format: str = "json", gzip: bool = False):
+    """Export all data as a streamed JSON document (or NDJSON with format=ndjson)"""
+    if format not in ("json", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'ndjson'")
+    
+    # The stream opens its own session: it outlives this request handler
+    filename = f"restaurant-data-{date.today().isoformat()}.{format}"
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    
+    return StreamingResponse(
+        stream_export(get_session_factory(), fmt=format, compress=gzip),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
         }
-        
-        return Response(
-            content=json.dumps(export_data, indent=2),
-            media_type="application/json",
-            headers={
-                "Content-Disposition": f"attachment; filename=restaurant-data-{date.today().isoformat()}.json"
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to export data: {str(e)}")
+    )
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,25 @@
+import pytest
+
+from packages.core import engine
+from packages.core.brief_cache import get_brief_cache
+from packages.core.database import Base
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    """Process-wide sync + async engines bound to a throwaway SQLite file."""
+    path = tmp_path / "ops.db"
+    engine.dispose_engine()
+    eng = engine.init_engine(f"sqlite:///{path}")
+    engine.init_async_engine(f"sqlite+aiosqlite:///{path}")
+    Base.metadata.create_all(eng)
+    get_brief_cache().invalidate()
+    yield eng
+    import asyncio
+    asyncio.run(engine.dispose_async_engine())
+    engine.dispose_engine()
+
+@pytest.fixture
+def db_session(sqlite_engine):
+    session = engine.get_session_factory()()
+    yield session
+    session.close()
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from packages.core.acknowledgements import ack_coverage, record_acks, unacknowledged_changes
+from packages.core.brief_repository import count_statements
+from packages.core.database import Acknowledgement, Change, User, UserRole
+from apps.api.main import app as main_app
+from simple_api import app
+
+def staff_and_changes(db, users=40, changes=5):
+    db.add_all([User(user_id=f"U{n:02d}", role=UserRole.STAFF, name=f"Staff {n}", email=f"s{n}@example.com")
+                for n in range(users)])
+    db.add_all([Change(change_id=f"C{n}", title=f"Change {n}", created_by="U00", is_active=True)
+                for n in range(changes)])
+    db.add(Change(change_id="OLD", title="Retired", created_by="U00", is_active=False))
+    db.commit()
+
+def test_bulk_ack_is_one_insert_and_idempotent(db_session):
+    staff_and_changes(db_session)
+    pairs = [(f"U{u:02d}", f"C{c}") for u in range(40) for c in range(5)]
+
+    with count_statements(db_session) as statements:
+        report = record_acks(db_session, pairs + pairs[:10] + [("U99", "C0"), ("U00", "NOPE")])
+    db_session.commit()
+    assert statements["count"] == 3  # user lookup, change lookup, one INSERT
+    assert (report.requested, report.recorded, report.already_acknowledged) == (202, 200, 0)
+    assert (report.unknown_users, report.unknown_changes) == (["U99"], ["NOPE"])
+
+    again = record_acks(db_session, pairs[:5])
+    db_session.commit()
+    assert (again.recorded, again.already_acknowledged) == (0, 5)
+    assert db_session.query(Acknowledgement).count() == 200
+
+def test_shift_start_burst_through_the_api(db_session):
+    staff_and_changes(db_session)
+    client = TestClient(main_app)
+
+    def ack(user):
+        body = {"acks": [{"user_id": f"U{user:02d}", "change_id": f"C{c}"} for c in range(5)]}
+        return client.post("/api/v1/acknowledgements/bulk", json=body).json()["recorded"]
+
+    # Every user taps twice: the second request records nothing
+    with ThreadPoolExecutor(8) as pool:
+        recorded = list(pool.map(ack, [u for u in range(40) for _ in range(2)]))
+    assert sum(recorded) == 200 and db_session.query(Acknowledgement).count() == 200
+
+def test_unacknowledged_and_coverage(db_session):
+    staff_and_changes(db_session, users=4, changes=3)
+    record_acks(db_session, [("U00", "C0"), ("U00", "C1"), ("U01", "C0"), ("U00", "OLD")])
+    db_session.commit()
+
+    assert [c.change_id for c in unacknowledged_changes(db_session, "U00")] == ["C2"]
+    assert {c.change_id for c in unacknowledged_changes(db_session, "U03")} == {"C0", "C1", "C2"}
+
+    coverage = {row["change_id"]: (row["acknowledged"], row["staff"], row["coverage"]) for row in ack_coverage(db_session)}
+    assert coverage == {"C0": (2, 4, 0.5), "C1": (1, 4, 0.25), "C2": (0, 4, 0.0)}
+
+    client = TestClient(app)
+    assert [c["change_id"] for c in client.get("/api/v1/users/U01/unacknowledged-changes").json()] in (
+        ["C1", "C2"], ["C2", "C1"]
+    )
+    assert len(client.get("/api/v1/acknowledgements/coverage").json()) == 3
+    assert client.post("/api/v1/acknowledgements/bulk", json={"acks": [{"user_id": "U01"}]}).status_code == 400
+    for bad in ([{"user_id": ["U01"], "change_id": "C1"}],
+                [{"user_id": "U01", "change_id": "C1"}, {"user_id": 2, "change_id": "C1"}]):
+        assert client.post("/api/v1/acknowledgements/bulk", json={"acks": bad}).status_code == 400
@@ -18,7 +18,7 @@ def test_reviews_contract():
     if data:
         ReviewOut.model_validate(data[0])
 
-def test_themes_contract():
+def test_themes_contract(db_session):
     data = client.get("/themes?days=7").json()
     assert isinstance(data, list)
     if data:
@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi.testclient import TestClient
+
+from packages.core.database import Menu, Inventory, Review, Change, User, UserRole, StockStatus
+from simple_api import app
+
+def seed(db):
+    db.add(User(user_id="user-001", role=UserRole.MANAGER, name="Ana", email="ana@example.com"))
+    db.add_all([
+        Menu(item_id="CHK-001", name="Chicken", price=1800),
+        Menu(item_id="WINE-001", name="Assyrtiko", price=1200),
+    ])
+    db.add_all([
+        Inventory(item_id="CHK-001", status=StockStatus.EIGHTY_SIX, notes="Supplier delay"),
+        Inventory(item_id="WINE-001", status=StockStatus.LOW, notes="8 bottles left"),
+    ])
+    db.add_all([
+        Review(source="google", rating=2, text="Service was slow", created_at=datetime.utcnow() - timedelta(days=1)),
+        Review(source="google", rating=5, text="Old news", created_at=datetime.utcnow() - timedelta(days=30)),
+    ])
+    db.add(Change(title="New wine list", created_by="user-001", is_active=True))
+    db.commit()
+
+def test_async_read_endpoints(db_session):
+    seed(db_session)
+    client = TestClient(app)
+
+    inventory = client.get("/api/v1/inventory").json()
+    assert {i["menu_item"]["name"] for i in inventory} == {"Chicken", "Assyrtiko"}
+    assert len(client.get("/api/v1/reviews?days=7").json()) == 1
+    assert client.get("/api/v1/changes").json()[0]["title"] == "New wine list"
+
+    brief = client.get("/api/v1/brief/today").json()
+    assert [i["menu_item"]["name"] for i in brief["eighty_six_items"]] == ["Chicken"]
+    assert [i["menu_item"]["name"] for i in brief["low_stock_items"]] == ["Assyrtiko"]
+    assert len(brief["recent_reviews"]) == 1
+
+def test_concurrent_polls_share_one_event_loop(db_session):
+    seed(db_session)
+
+    async def poll():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*[client.get("/api/v1/brief/today") for _ in range(200)])
+        return [r.status_code for r in responses]
+
+    assert asyncio.run(poll()) == [200] * 200
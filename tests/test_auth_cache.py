@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from packages.core.auth_cache import TokenCache, UserCache
+from packages.core.database import User, UserRole
+from simple_api import app, create_access_token, user_cache
+
+def test_token_cache_respects_exp_and_size():
+    now = [1000.0]
+    cache = TokenCache(maxsize=2, clock=lambda: now[0])
+    cache.put_claims("a", {"user_id": "u1"}, exp=1010)
+    cache.put_claims("no-exp", {"user_id": "u1"}, exp=None)  # never cached
+    assert cache.get_claims("a") == {"user_id": "u1"} and cache.get_claims("no-exp") is None
+
+    now[0] = 1010
+    assert cache.get_claims("a") is None  # expired with the token
+
+    for token in "bcd":
+        cache.put_claims(token, {}, exp=2000)
+    assert cache.get_claims("b") is None and cache.get_claims("d") == {}
+    stats = cache.stats()
+    assert (stats["size"], stats["evictions"], stats["expired"], stats["hits"]) == (2, 1, 1, 2)
+
+def test_user_cache_ttl():
+    now = [0.0]
+    cache = UserCache(ttl=30, clock=lambda: now[0])
+    fetched = []
+
+    def fetch(user_id):
+        fetched.append(user_id)
+        return User(user_id=user_id, role=UserRole.STAFF, name="Ana", email="a@x", is_active=True)
+
+    assert cache.load("u1", fetch).name == "Ana"
+    assert cache.load("u1", fetch).name == "Ana"
+    now[0] = 31
+    cache.load("u1", fetch)
+    assert fetched == ["u1", "u1"]
+    assert cache.load("ghost", lambda user_id: None) is None and cache.stats()["size"] == 1
+
+def test_authenticated_requests_skip_the_database(db_session, sqlite_engine):
+    user_cache.clear()
+    db_session.add(User(user_id="user-001", role=UserRole.MANAGER, name="Ana", email="ana@example.com"))
+    db_session.commit()
+    client = TestClient(app)
+    # Counters are process-wide; compare against where earlier tests left them
+    before = client.get("/api/v1/admin/auth-cache").json()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': 'user-001', 'role': 'manager'})}"}
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(sqlite_engine, "before_cursor_execute", listener)
+    try:
+        assert client.get("/api/v1/auth/me", headers=headers).json()["name"] == "Ana"
+        loaded = len(statements)
+        for _ in range(20):
+            assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+        assert len(statements) == loaded == 1
+    finally:
+        event.remove(sqlite_engine, "before_cursor_execute", listener)
+
+    # Deactivation through the ORM drops the cached user at once
+    db_session.get(User, "user-001").is_active = False
+    db_session.commit()
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+    assert client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not-a-jwt"}).status_code == 401
+    after = client.get("/api/v1/admin/auth-cache").json()
+    delta = {cache: {key: after[cache][key] - before[cache][key] for key in ("hits", "misses")} for cache in after}
+    assert delta["tokens"]["hits"] >= 21
+    assert delta["users"]["hits"] / (delta["users"]["hits"] + delta["users"]["misses"]) > 0.9
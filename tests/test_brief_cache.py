@@ -0,0 +1,76 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from packages.core.brief_cache import BriefCache, InMemoryBackend, RedisBackend
+from packages.core.engine import get_async_engine
+from simple_api import app
+from tests.test_async_endpoints import seed
+
+class FakeRedis:
+    """The slice of redis-py the cache uses; TTLs are ignored."""
+    def __init__(self):
+        self.data = {}
+    def get(self, key):
+        return self.data.get(key)
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+    def delete(self, key):
+        self.data.pop(key, None)
+
+def test_snapshot_expires_after_ttl():
+    now = [0.0]
+    cache = BriefCache(InMemoryBackend(clock=lambda: now[0]), ttl=60)
+    _, generation = cache.get()
+    stored = cache.put(b'{"brief": 1}', generation)
+    assert cache.get() == (stored, generation)
+    now[0] = 61
+    assert cache.get() == (None, generation)
+
+def test_invalidate_discards_snapshots_built_before_the_write():
+    cache = BriefCache(RedisBackend(FakeRedis()))
+    _, stale_generation = cache.get()
+    cache.invalidate()  # a write lands while the stale brief is being built
+    cache.put(b"stale", stale_generation)
+    cached, generation = cache.get()
+    assert cached is None and generation == stale_generation + 1
+
+def test_snapshot_is_per_day():
+    today = [date(2026, 1, 1)]
+    cache = BriefCache(today=lambda: today[0])
+    cache.put(b"new year", cache.get()[1])
+    today[0] = date(2026, 1, 2)
+    assert cache.get()[0] is None
+
+def test_etag_ignores_volatile_fields():
+    cache = BriefCache()
+    first = cache.put(b'{"generated_at": 1}', 0, fingerprint=b"same")
+    second = cache.put(b'{"generated_at": 2}', 0, fingerprint=b"same")
+    assert first.etag == second.etag
+    assert second.matches(f"W/{first.etag}")
+
+def test_conditional_brief_skips_the_database(db_session):
+    seed(db_session)
+    client = TestClient(app)
+    first = client.get("/api/v1/brief/today")
+    etag = first.headers["etag"]
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        assert client.get("/api/v1/brief/today", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/api/v1/brief/today").json() == first.json()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+    assert statements == []
+
+    client.post("/api/v1/changes", json={"title": "Patio closed", "detail": "Rain"})
+    refreshed = client.get("/api/v1/brief/today", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert "Patio closed" in [c["title"] for c in refreshed.json()["changes"]]
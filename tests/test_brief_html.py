@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from packages.core.brief_html import render_brief_html, short_datetime
+
+def test_fields_are_escaped():
+    html = render_brief_html({
+        "eighty_six_items": [{"name": "<script>alert(1)</script>", "item_id": "X-1"}],
+        "recent_reviews": [{"source": "yelp", "rating": 2, "text": "Fish & chips <b>cold</b>"}],
+    })
+    assert "<script>" not in html
+    assert "&lt;script&gt;" in html
+    assert "Fish &amp; chips &lt;b&gt;cold&lt;/b&gt;" in html
+    assert "No notes" in html
+
+def test_empty_sections_render_placeholders():
+    html = render_brief_html({"date": "2026-01-01"})
+    assert "Pre-Shift Brief - 2026-01-01" in html
+    assert "No items are currently 86'd" in html
+    assert "All items are well stocked" in html
+    assert "No recent reviews" in html
+    assert "No active changes" in html
+
+def test_timestamps_and_ratings():
+    html = render_brief_html({
+        "recent_reviews": [{"rating": 4, "text": "Nice", "created_at": "2026-01-01T18:30:00Z"}],
+        "changes": [{"title": "Patio", "created_at": datetime(2026, 1, 2, 9, 15)}],
+    })
+    assert "★★★★☆" in html
+    assert "2026-01-01 18:30" in html
+    assert "2026-01-02 09:15" in html
+    assert short_datetime("not a date") == "not a date"
+    assert short_datetime(None) == ""
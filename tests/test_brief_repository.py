@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from packages.core.brief_repository import BriefRepository
+from packages.core.database import Menu, Inventory, Review, Change, User, UserRole, StockStatus
+
+STATUSES = [StockStatus.EIGHTY_SIX, StockStatus.LOW, StockStatus.OK]
+
+def seed_inventory(db, count):
+    db.add_all([Menu(item_id=f"ITEM-{n}", name=f"Item {n}", price=100) for n in range(count)])
+    db.add_all([Inventory(item_id=f"ITEM-{n}", status=STATUSES[n % 3]) for n in range(count)])
+    db.commit()
+
+def statements_for_brief(db):
+    """Statements to load the brief *and* touch every menu row, as the endpoints do."""
+    executed = []
+    listener = lambda *args: executed.append(args[2])
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        snapshot = BriefRepository(db).load()
+        for item in snapshot.eighty_six_items + snapshot.low_stock_items:
+            assert item.menu_item.name.startswith("Item")
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+    return snapshot, len(executed)
+
+def test_brief_splits_inventory_by_status(db_session):
+    db_session.add(User(user_id="user-001", role=UserRole.MANAGER, name="Ana", email="ana@example.com"))
+    db_session.add(Change(title="New wine list", created_by="user-001", is_active=True))
+    db_session.add(Change(title="Old special", created_by="user-001", is_active=False))
+    db_session.add(Review(source="google", rating=4, text="Great", created_at=datetime.utcnow()))
+    db_session.add(Review(source="google", rating=1, text="Stale", created_at=datetime.utcnow() - timedelta(days=9)))
+    seed_inventory(db_session, 6)
+
+    snapshot = BriefRepository(db_session).load()
+    assert [i.item_id for i in snapshot.eighty_six_items] == ["ITEM-0", "ITEM-3"]
+    assert [i.item_id for i in snapshot.low_stock_items] == ["ITEM-1", "ITEM-4"]
+    assert [r.text for r in snapshot.recent_reviews] == ["Great"]
+    assert [c.title for c in snapshot.changes] == ["New wine list"]
+    assert snapshot.statement_count == BriefRepository.MAX_STATEMENTS
+
+def test_statement_count_is_constant_as_inventory_grows(db_session):
+    seed_inventory(db_session, 10)
+    small, small_count = statements_for_brief(db_session)
+
+    db_session.add_all([Menu(item_id=f"BULK-{n}", name=f"Item bulk {n}") for n in range(500)])
+    db_session.add_all([Inventory(item_id=f"BULK-{n}", status=STATUSES[n % 3]) for n in range(500)])
+    db_session.commit()
+    db_session.expire_all()
+    large, large_count = statements_for_brief(db_session)
+
+    assert len(large.eighty_six_items) > len(small.eighty_six_items)
+    assert small_count == large_count <= BriefRepository.MAX_STATEMENTS
@@ -0,0 +1,67 @@
+import gzip
+import json
+import tracemalloc
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from packages.core.data_export import stream_export
+from packages.core.database import Review
+from packages.core.engine import get_session_factory
+from simple_api import app
+from tests.test_async_endpoints import seed
+
+def test_json_export_keeps_the_document_shape(db_session):
+    seed(db_session)
+    response = TestClient(app).get("/api/v1/admin/export-data")
+    assert response.status_code == 200
+    assert "restaurant-data-" in response.headers["content-disposition"]
+
+    data = response.json()
+    assert [m["name"] for m in data["menus"]] == ["Chicken", "Assyrtiko"]
+    assert {i["status"] for i in data["inventory"]} == {"86", "low"}
+    assert len(data["reviews"]) == 2 and len(data["changes"]) == 1
+    assert data["total_records"] == 7
+
+def test_ndjson_and_gzip(db_session):
+    seed(db_session)
+    client = TestClient(app)
+    lines = client.get("/api/v1/admin/export-data?format=ndjson").text.splitlines()
+    assert [json.loads(line)["table"] for line in lines].count("reviews") == 2
+
+    response = client.get("/api/v1/admin/export-data?format=ndjson&gzip=true")
+    assert response.headers["content-type"] == "application/gzip"
+    assert gzip.decompress(response.content).decode().splitlines() == lines
+
+    assert client.get("/api/v1/admin/export-data?format=xml").status_code == 400
+
+def _export_peak(db_session, rows):
+    text = "Slow service on the patio. " * 20
+    start = db_session.query(Review).count()
+    db_session.execute(insert(Review), [
+        {"review_id": f"R-{n}", "source": "google", "rating": 3, "text": text, "created_at": datetime(2024, 1, 1)}
+        for n in range(start, rows)
+    ])
+    db_session.commit()
+
+    tracemalloc.start()
+    try:
+        exported, chunks = 0, 0
+        for chunk in stream_export(get_session_factory(), fmt="ndjson", batch_size=500):
+            exported += len(chunk)
+            chunks += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return exported, chunks, peak
+
+def test_memory_stays_flat_as_rows_grow(db_session):
+    small_bytes, _, small_peak = _export_peak(db_session, 5_000)
+    large_bytes, chunks, large_peak = _export_peak(db_session, 20_000)
+
+    assert large_bytes > 4 * small_bytes - 1000
+    assert chunks > 100
+    # Peak is bounded by the batch, not the table
+    assert large_peak < small_peak * 1.5
+    assert large_peak < large_bytes / 5
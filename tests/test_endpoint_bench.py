@@ -0,0 +1,31 @@
+import asyncio
+from datetime import date
+
+from benchmarks.endpoints import SUITES, async_url, compare, percentile, run_suite
+from benchmarks.synthetic import SeedConfig, load
+
+def test_percentile_and_async_url():
+    values = [float(n) for n in range(1, 101)]
+    assert (percentile(values, 50), percentile(values, 95), percentile(values, 99)) == (50.0, 95.0, 99.0)
+    assert percentile([], 95) == 0.0
+    assert async_url("sqlite:////tmp/x.db") == "sqlite+aiosqlite:////tmp/x.db"
+    assert async_url("postgresql://u:p@db/ops") == "postgresql+asyncpg://u:p@db/ops"
+
+def test_suite_reports_every_endpoint(sqlite_engine):
+    load(sqlite_engine, SeedConfig(locations=1, menu_size=8, staff=4, years=0.1, reviews=200, end=date.today()))
+    names = [endpoint.name for endpoint in SUITES["simple_api"][1]]
+    results = asyncio.run(run_suite("simple_api", requests=4, concurrency=2))
+    assert list(results["endpoints"]) == names
+    assert all(result["errors"] == 0 for result in results["endpoints"].values()), results["endpoints"]
+    assert results["meta"]["dataset"]["reviews"] == 200
+    assert results["endpoints"]["changes"]["statements_per_request"] == 1
+
+def test_compare_flags_regressions():
+    def run(p95, statements=1.0, errors=0):
+        return {"endpoints": {"changes": {"p95_ms": p95, "statements_per_request": statements, "errors": errors}}}
+    assert compare(run(11.0), run(10.0), threshold=0.2) == []
+    assert compare(run(1.3), run(1.0), threshold=0.2) == []  # under the noise floor
+    assert compare(run(13.0), run(10.0), threshold=0.2) == ["changes: p95 10.0ms -> 13.0ms"]
+    assert compare(run(10.0, statements=3), run(10.0)) == ["changes: SQL statements/request 1 -> 3"]
+    assert compare(run(10.0, errors=2), run(10.0)) == ["changes: 2 errors (baseline had none)"]
+    assert compare({"endpoints": {"new": {}}}, run(10.0)) == []
@@ -0,0 +1,40 @@
+from packages.core import engine
+from packages.core.database import get_db
+
+def test_engine_is_shared_across_sessions(tmp_path):
+    engine.dispose_engine()
+    try:
+        first = engine.init_engine(f"sqlite:///{tmp_path / 'ops.db'}")
+        assert engine.init_engine() is first
+        assert engine.get_engine() is first
+
+        gen_a, gen_b = get_db(), get_db()
+        db_a, db_b = next(gen_a), next(gen_b)
+        assert db_a.get_bind() is db_b.get_bind() is first
+        gen_a.close()
+        gen_b.close()
+    finally:
+        engine.dispose_engine()
+
+def test_pool_stats_track_checkouts(tmp_path):
+    engine.dispose_engine()
+    assert engine.pool_stats() == {"initialized": False}
+    try:
+        eng = engine.init_engine(f"sqlite:///{tmp_path / 'ops.db'}")
+        with eng.connect():
+            stats = engine.pool_stats()
+            assert stats["initialized"] is True
+            assert stats["checkouts"] == 1
+            assert stats["checkedout"] == 1
+        assert engine.pool_stats()["checkins"] == 1
+    finally:
+        engine.dispose_engine()
+    assert engine.pool_stats() == {"initialized": False}
+
+def test_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    settings = engine.get_pool_settings()
+    assert settings.pool_size == 20
+    assert settings.pool_pre_ping is False
+    assert settings.max_overflow == 10
@@ -0,0 +1,79 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from packages.core.brief_cache import InMemoryBackend
+from packages.core.http_cache import CachePolicy, ConditionalGetMiddleware, TableVersions
+from apps.api.main import app as main_app
+from simple_api import app
+from tests.test_async_endpoints import seed
+
+def test_polls_revalidate_until_a_write(db_session):
+    seed(db_session)
+    client = TestClient(main_app)
+
+    first = client.get("/api/v1/changes")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+    again = client.get("/api/v1/changes", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.content == b"" and again.headers["etag"] == etag
+
+    # Query string is part of the representation
+    assert client.get("/api/v1/changes?fields=title").headers["etag"] != etag
+
+    client.post("/api/v1/changes", json={"title": "Patio open", "detail": "", "created_by": "user-001"})
+    fresh = client.get("/api/v1/changes", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200 and len(fresh.json()) == 2
+
+    menu = client.get("/api/v1/menu")
+    assert menu.headers["cache-control"].startswith("max-age=")
+    assert client.get("/api/v1/reviews").headers.get("etag") is None
+
+def test_admin_clear_invalidates_inventory(db_session):
+    seed(db_session)
+    client = TestClient(app)
+    etag = client.get("/api/v1/inventory").headers["etag"]
+    assert client.get("/api/v1/inventory", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/v1/admin/clear-data")
+    assert client.get("/api/v1/inventory", headers={"If-None-Match": etag}).json() == []
+
+def test_304_skips_the_endpoint_and_last_modified_is_safe():
+    now = [1_000_000.5]
+    versions = TableVersions(InMemoryBackend(), shared=True, clock=lambda: now[0])
+    calls = []
+
+    async def endpoint(scope, receive, send):
+        calls.append(scope["path"])
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"[]"})
+
+    middleware = ConditionalGetMiddleware(endpoint, {"/items": CachePolicy(("items",))}, versions)
+
+    def get(**headers):
+        sent = []
+        scope = {"type": "http", "method": "GET", "path": "/items", "query_string": b"",
+                 "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]}
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(middleware(scope, None, send))
+        return sent[0]["status"], dict((k.decode(), v.decode()) for k, v in sent[0]["headers"])
+
+    versions.bump("items")
+    status, headers = get()
+    # Written in the current second: a later write could share the timestamp
+    assert status == 200 and "last-modified" not in headers
+
+    now[0] += 2
+    status, headers = get()
+    assert "last-modified" in headers
+    assert get(if_modified_since=headers["last-modified"])[0] == 304
+    assert get(if_none_match=headers["etag"])[0] == 304
+    assert calls == ["/items", "/items"]
+
+    versions.bump("items")
+    now[0] += 2
+    assert get(if_modified_since=headers["last-modified"])[0] == 200
+    assert get(if_none_match=headers["etag"])[0] == 200
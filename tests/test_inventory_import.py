@@ -0,0 +1,60 @@
+import io
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+
+from apps.api.main import app
+from packages.core.brief_repository import count_statements
+from packages.core.database import Inventory, Menu, StockStatus
+from packages.core.inventory_import import import_inventory_csv
+from tests.test_async_endpoints import seed
+
+CSV = (
+    'item_id,status,notes\n'
+    'CHK-001,ok,"Back in, 40 portions"\n'
+    'WINE-001,86,\n'
+    'FISH-404,low,not on the menu\n'
+    'CHK-001,bogus,\n'
+    ',low,no id\n'
+)
+
+def test_upload_upserts_and_reports_bad_rows(db_session):
+    seed(db_session)
+    db_session.add(Menu(item_id="DESSERT-001", name="Tart"))
+    db_session.commit()
+
+    response = TestClient(app).post(
+        "/api/v1/inventory/upload",
+        files={"file": ("count.csv", CSV + "DESSERT-001,low,\n", "text/csv")},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["inserted"], report["updated"], report["failed"]) == (6, 1, 2, 3)
+    assert [(e["line"], e["message"]) for e in report["errors"]] == [
+        (4, "Unknown menu item"), (5, "Unknown status 'bogus'"), (6, "Missing item_id"),
+    ]
+
+    db_session.expire_all()
+    rows = {i.item_id: i for i in db_session.scalars(select(Inventory))}
+    assert rows["CHK-001"].status == StockStatus.OK
+    assert rows["CHK-001"].notes == "Back in, 40 portions"
+    assert rows["WINE-001"].status == StockStatus.EIGHTY_SIX and rows["WINE-001"].notes is None
+    assert rows["DESSERT-001"].status == StockStatus.LOW
+
+def test_statements_scale_with_chunks_not_rows(db_session):
+    db_session.execute(insert(Menu), [{"item_id": f"ITEM-{n}", "name": f"Item {n}"} for n in range(5000)])
+    db_session.execute(insert(Inventory), [
+        {"item_id": f"ITEM-{n}", "status": StockStatus.OK} for n in range(0, 5000, 2)
+    ])
+    db_session.commit()
+
+    lines = ["item_id,status,notes"] + [f"ITEM-{n},low,recount {n}" for n in range(5000)]
+    upload = io.BytesIO("\n".join(lines).encode())
+    with count_statements(db_session) as statements:
+        report = import_inventory_csv(db_session, upload, chunk_size=1000)
+    db_session.commit()
+
+    assert (report.inserted, report.updated, report.chunks, report.errors) == (2500, 2500, 5, [])
+    assert statements["count"] == 5 * 3  # menu lookup, inventory lookup, upsert
+    assert not upload.closed
+    assert db_session.query(Inventory).filter(Inventory.status == StockStatus.LOW).count() == 5000
@@ -0,0 +1,74 @@
+import asyncio
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from packages.core import engine, metrics as metrics_module
+from packages.core.database import Menu, get_async_db, get_db
+from packages.core.metrics import Histogram, get_metrics, install_metrics
+
+def build_app():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: str, db: Session = Depends(get_db)):
+        db.execute(text("SELECT 1"))
+        return {"name": db.scalar(select(Menu.name).where(Menu.item_id == item_id))}
+
+    @app.get("/async-items")
+    async def list_items(db: AsyncSession = Depends(get_async_db)):
+        return [item.item_id for item in (await db.execute(select(Menu))).scalars()]
+
+    return app
+
+def test_histogram_exposition():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.observe(value, 'a"b')
+    assert histogram.expose() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="a\\"b",le="0.1"} 2',
+        'latency_seconds_bucket{route="a\\"b",le="1"} 3',
+        'latency_seconds_bucket{route="a\\"b",le="+Inf"} 4',
+        'latency_seconds_sum{route="a\\"b"} 3.65',
+        'latency_seconds_count{route="a\\"b"} 4',
+    ]
+
+def test_disabled_installs_nothing(monkeypatch):
+    monkeypatch.delenv("METRICS_ENABLED", raising=False)
+    app = build_app()
+    assert get_metrics() is None and install_metrics(app) is None
+    assert TestClient(app).get("/metrics").status_code == 404
+
+def test_per_route_latency_and_sql(monkeypatch, db_session, sqlite_engine):
+    db_session.add(Menu(item_id="CHK-001", name="Chicken"))
+    db_session.commit()
+    db_session.close()
+    monkeypatch.setenv("METRICS_ENABLED", "1")
+    monkeypatch.setattr(metrics_module, "_metrics", None)
+    metrics = get_metrics()
+    # Engines are instrumented when created
+    url = str(sqlite_engine.url)
+    asyncio.run(engine.dispose_async_engine())
+    engine.dispose_engine()
+    engine.init_engine(url)
+    engine.init_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://", 1))
+
+    client = TestClient(app := build_app())
+    install_metrics(app)
+    assert client.get("/items/CHK-001").json() == {"name": "Chicken"}
+    assert client.get("/items/CHK-002").json() == {"name": None}
+    assert client.get("/async-items").json() == ["CHK-001"]
+    client.get("/nowhere")
+
+    assert metrics.request_seconds.count("GET", "/items/{item_id}", "200") == 2
+    assert metrics.request_seconds.count("GET", "unmatched", "404") == 1
+    body = client.get("/metrics").text
+    assert 'http_request_sql_statements_sum{method="GET",route="/items/{item_id}"} 4' in body
+    assert 'http_request_sql_statements_sum{method="GET",route="/async-items"} 1' in body
+    assert 'db_pool_checkout_wait_seconds_count{engine="async"} 1' in body
+    assert "db_pool_checked_out 0" in body
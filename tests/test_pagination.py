@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from packages.core.database import Review
+from packages.core.pagination import INVENTORY, MENU, REVIEWS, encode_cursor, page_query
+from apps.api.main import app as main_app
+from simple_api import app
+from tests.test_async_endpoints import seed
+
+def add_reviews(db, count, prefix="P", now=None):
+    now = now or datetime.utcnow()
+    # Pairs share a timestamp so the review_id tie-breaker is exercised
+    db.execute(insert(Review), [
+        {"review_id": f"{prefix}-{n:04d}", "source": "google", "rating": 1 + n % 5, "text": f"review {n}",
+         "created_at": now - timedelta(minutes=n // 2)}
+        for n in range(count)
+    ])
+    db.commit()
+
+@pytest.mark.parametrize("application", [app, main_app])
+def test_cursor_walk_visits_every_row_once(db_session, application):
+    add_reviews(db_session, 53)
+    client = TestClient(application)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        url = "/api/v1/reviews?days=7&limit=10" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(url).json()
+        seen.extend(item["review_id"] for item in page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        if pages == 1:
+            # Newer rows land before the cursor and never shift later pages
+            add_reviews(db_session, 3, prefix="NEW", now=datetime.utcnow() + timedelta(minutes=1))
+
+    assert pages == 6
+    assert seen == [f"P-{n:04d}" for n in sorted(range(53), key=lambda n: (n // 2, -n))]
+
+@pytest.mark.parametrize("application", [app, main_app])
+def test_fields_project_columns(db_session, application):
+    seed(db_session)
+    client = TestClient(application)
+
+    page = client.get("/api/v1/inventory?fields=item_id,status").json()
+    assert page["items"] == [{"item_id": "CHK-001", "status": "86"}, {"item_id": "WINE-001", "status": "low"}]
+    assert page["next_cursor"] is None and page["limit"] == 50
+
+    menu = client.get("/api/v1/inventory?fields=item_id,menu_item&limit=1").json()
+    assert menu["items"][0]["menu_item"]["name"] == "Chicken" and menu["next_cursor"]
+
+    assert client.get("/api/v1/changes?fields=title").json()["items"] == [{"title": "New wine list"}]
+    assert client.get("/api/v1/menu?fields=name").json()["items"] == [{"name": "Chicken"}, {"name": "Assyrtiko"}]
+
+def test_projection_selects_only_requested_columns():
+    sql = str(page_query(REVIEWS, ["rating"], 10))
+    assert "reviews.rating" in sql and "reviews.text" not in sql
+
+@pytest.mark.parametrize("application", [app, main_app])
+def test_bad_requests_are_rejected(db_session, application):
+    seed(db_session)
+    client = TestClient(application)
+
+    assert client.get("/api/v1/inventory?fields=password").status_code == 400
+    assert client.get("/api/v1/inventory?cursor=not-a-cursor").status_code == 400
+    foreign = encode_cursor(REVIEWS, [datetime.utcnow().isoformat(), "R-1"])
+    assert client.get(f"/api/v1/inventory?cursor={foreign}").status_code == 400
+    assert client.get("/api/v1/inventory?limit=501").status_code in (400, 422)
+    # Right list, wrong key types: rejected before they reach the query
+    for path, resource, keys in (("/api/v1/inventory", INVENTORY, ["1"]),
+                                 ("/api/v1/reviews", REVIEWS, ["2026-03-01", "R-1"]),
+                                 ("/api/v1/reviews", REVIEWS, [{"dt": "yesterday"}, "R-1"]),
+                                 ("/api/v1/reviews", REVIEWS, [{"dt": "2026-03-01T12:00:00+00:00"}, "R-1"]),
+                                 ("/api/v1/inventory", INVENTORY, [2 ** 31]),
+                                 ("/api/v1/inventory", INVENTORY, [-2 ** 63 - 1]),
+                                 ("/api/v1/menu", MENU, [[1]])):
+        assert client.get(f"{path}?cursor={encode_cursor(resource, keys)}").status_code == 400
+
+    # No paging parameters: the bare array the web client expects
+    assert isinstance(client.get("/api/v1/inventory").json(), list)
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import simple_api
+from packages.core.database import User, UserRole
+from packages.core.passwords import HasherBusy, PasswordHasher, hash_rounds, hash_sync
+from simple_api import app
+
+def test_verify_reports_rehash_on_cost_change():
+    hasher = PasswordHasher(rounds=4, workers=2)
+    try:
+        old = hash_sync("s3cret", 5)
+        assert asyncio.run(hasher.verify("s3cret", old)).needs_rehash
+        assert not asyncio.run(hasher.verify("wrong", old)).ok
+        assert not asyncio.run(hasher.verify("s3cret", None)).ok
+        fresh = asyncio.run(hasher.hash("s3cret"))
+        assert hash_rounds(fresh) == 4
+        assert asyncio.run(hasher.verify("s3cret", fresh)).needs_rehash is False
+    finally:
+        hasher.shutdown()
+
+def test_full_backlog_is_rejected_not_queued():
+    hasher = PasswordHasher(rounds=4, workers=1, max_pending=2)
+    release = threading.Event()
+
+    def slow(_):
+        release.wait(5)
+        return "done"
+
+    async def scenario():
+        running = [asyncio.ensure_future(hasher._run(slow, None)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert hasher.pending() == 2
+        with pytest.raises(HasherBusy):
+            await hasher.hash("x")
+        release.set()
+        return await asyncio.gather(*running)
+
+    try:
+        assert asyncio.run(scenario()) == ["done", "done"]
+        assert hasher.stats()["rejected"] == 1 and hasher.pending() == 0
+    finally:
+        hasher.shutdown()
+
+def test_login_issues_token_and_upgrades_hash(db_session, monkeypatch):
+    monkeypatch.setattr(simple_api.password_hasher, "rounds", 4)
+    db_session.add(User(user_id="user-001", role=UserRole.MANAGER, name="Ana", email="ana@example.com",
+                        password_hash=hash_sync("s3cret", 5)))
+    db_session.commit()
+    client = TestClient(app)
+
+    assert client.post("/api/v1/auth/login", json={"email": "ana@example.com", "password": "nope"}).status_code == 401
+    assert client.post("/api/v1/auth/login", json={"email": "bob@example.com", "password": "s3cret"}).status_code == 401
+
+    response = client.post("/api/v1/auth/login", json={"email": "ana@example.com", "password": "s3cret"})
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert client.get("/api/v1/auth/me", headers=headers).json()["user_id"] == "user-001"
+    db_session.expire_all()
+    assert hash_rounds(db_session.get(User, "user-001").password_hash) == 4
+
+def test_set_password_requires_manager_or_self(db_session, monkeypatch):
+    monkeypatch.setattr(simple_api.password_hasher, "rounds", 4)
+    db_session.add_all([
+        User(user_id="user-001", role=UserRole.MANAGER, name="Ana", email="ana@example.com"),
+        User(user_id="user-002", role=UserRole.STAFF, name="Ben", email="ben@example.com"),
+    ])
+    db_session.commit()
+    client = TestClient(app)
+
+    def as_user(user_id, role):
+        return {"Authorization": f"Bearer {simple_api.create_access_token({'sub': user_id, 'role': role})}"}
+
+    url = "/api/v1/admin/users/{}/password"
+    assert client.put(url.format("user-001"), json={"password": "x"}).status_code in (401, 403)
+    assert client.put(url.format("user-001"), json={"password": "x"},
+                      headers=as_user("user-002", "staff")).status_code == 403
+    assert client.put(url.format("user-002"), json={"password": "mine"},
+                      headers=as_user("user-002", "staff")).status_code == 200
+    assert client.put(url.format("user-002"), json={"password": "reset"},
+                      headers=as_user("user-001", "manager")).status_code == 200
+    login = client.post("/api/v1/auth/login", json={"email": "ben@example.com", "password": "reset"})
+    assert login.status_code == 200
+
+def test_password_must_be_a_short_enough_string(db_session, monkeypatch):
+    monkeypatch.setattr(simple_api.password_hasher, "rounds", 4)
+    db_session.add(User(user_id="user-001", role=UserRole.MANAGER, name="Ana", email="ana@example.com"))
+    db_session.commit()
+    client = TestClient(app)
+    token = simple_api.create_access_token({"sub": "user-001", "role": "manager"})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for password in (123, ["s3cret"], "x" * 73, "é" * 37):
+        assert client.put("/api/v1/admin/users/user-001/password", json={"password": password},
+                          headers=headers).status_code == 400
+        assert client.post("/api/v1/auth/login", json={"email": "ana@example.com", "password": password}).status_code == 400
+    assert client.put("/api/v1/admin/users/user-001/password", json={"password": "x" * 72},
+                      headers=headers).status_code == 200
+    assert client.post("/api/v1/auth/login", json={"email": "ana@example.com", "password": "x" * 72}).status_code == 200
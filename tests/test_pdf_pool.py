@@ -0,0 +1,111 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+import apps.api.main as main
+from packages.core.pdf_pool import PDFRenderPool, brief_fingerprint
+
+BRIEF = {"date": "2026-01-01", "eighty_six_items": [{"name": "Branzino"}], "generated_at": "12:00"}
+
+class CountingRenderer:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+    def __call__(self, brief_data):
+        self.calls += 1
+        self.release.wait(5)
+        if brief_data.get("boom"):
+            raise RuntimeError("weasyprint exploded")
+        return b"%PDF " + brief_data["date"].encode()
+
+def make_pool(renderer, **kwargs):
+    return PDFRenderPool(render=renderer, executor_factory=lambda: ThreadPoolExecutor(2), **kwargs)
+
+def test_fingerprint_ignores_generated_at():
+    assert brief_fingerprint(BRIEF) == brief_fingerprint(dict(BRIEF, generated_at="16:45"))
+    assert brief_fingerprint(BRIEF) != brief_fingerprint(dict(BRIEF, date="2026-01-02"))
+
+def test_concurrent_identical_requests_share_one_render():
+    renderer = CountingRenderer()
+    pool = make_pool(renderer)
+    jobs = [pool.submit(dict(BRIEF, generated_at=str(n))) for n in range(30)]
+    assert {job.job_id for job in jobs} == {jobs[0].job_id}
+    assert jobs[0].status == "pending"
+
+    renderer.release.set()
+    assert jobs[0].future.result(5) == b"%PDF 2026-01-01"
+    assert pool.get_job(jobs[0].job_id).status == "done"
+    assert renderer.calls == 1
+    pool.shutdown()
+
+def test_rendered_pdf_is_served_from_cache():
+    renderer = CountingRenderer()
+    renderer.release.set()
+    pool = make_pool(renderer, max_jobs=1)
+    first = pool.submit(BRIEF)
+    first.future.result(5)
+    pool.submit(dict(BRIEF, date="2026-01-02")).future.result(5)  # evicts the first job record
+
+    again = pool.submit(BRIEF)
+    assert again.status == "done" and again.future.result() == b"%PDF 2026-01-01"
+    assert renderer.calls == 2
+    pool.shutdown()
+
+def test_failed_render_is_reported_and_retried():
+    renderer = CountingRenderer()
+    renderer.release.set()
+    pool = make_pool(renderer)
+    job = pool.submit(dict(BRIEF, boom=True))
+    job.future.exception(5)
+    assert job.status == "failed" and "exploded" in job.error
+
+    retry = pool.submit(dict(BRIEF, boom=True))
+    retry.future.exception(5)
+    assert renderer.calls == 2
+    pool.shutdown()
+
+def test_cancelled_job_is_failed_and_resubmitted():
+    renderer = CountingRenderer()
+    pool = PDFRenderPool(render=renderer, executor_factory=lambda: ThreadPoolExecutor(1))
+    running = pool.submit(dict(BRIEF, date="2026-01-02"))
+    queued = pool.submit(BRIEF)
+    pool.shutdown()  # cancels the render still waiting for a worker
+    renderer.release.set()
+    running.future.result(5)
+    assert queued.future.cancelled()
+    assert queued.status == "failed" and queued.error == "render cancelled"
+
+    retry = pool.submit(BRIEF)
+    assert retry is not queued and retry.future.result(5) == b"%PDF 2026-01-01"
+    pool.shutdown()
+
+def test_job_endpoint_polls_to_the_pdf(db_session, monkeypatch):
+    renderer = CountingRenderer()
+    pool = make_pool(renderer)
+    monkeypatch.setattr(main, "pdf_pool", pool)
+    client = TestClient(main.app)
+
+    queued = client.post("/api/v1/brief/today/pdf/jobs")
+    assert queued.status_code == 202
+    url = queued.json()["url"]
+    assert client.get(url).status_code == 202
+
+    # Fetched after midnight: the filename keeps the date the brief was for
+    today = date.today()
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return today + timedelta(days=1)
+    monkeypatch.setattr(main, "date", Tomorrow)
+
+    renderer.release.set()
+    deadline = time.time() + 5
+    while (response := client.get(url)).status_code == 202 and time.time() < deadline:
+        time.sleep(0.01)
+    assert response.status_code == 200 and response.content == b"%PDF " + today.isoformat().encode()
+    assert response.headers["content-disposition"] == f"attachment; filename=pre-shift-brief-{today}.pdf"
+    assert client.get("/api/v1/brief/today/pdf/jobs/nope").status_code == 404
+    pool.shutdown()
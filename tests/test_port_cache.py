@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+
+from apps.api.adapter_registry import AdapterRegistry
+from packages.core.port_cache import CachedPort, CircuitBreaker, UpstreamUnavailable
+
+class Upstream:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+        self.gate = None
+
+    def fetch_recent(self, days=14):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise ConnectionError("upstream down")
+        return [f"review-{self.calls}-{days}"]
+
+def make(ttl=10, stale_ttl=50, failures=2, reset_after=30):
+    now = [0.0]
+    clock = lambda: now[0]
+    upstream = Upstream()
+    port = CachedPort(upstream, "reviews", ttl=ttl, stale_ttl=stale_ttl, clock=clock,
+                      breaker=CircuitBreaker(failures, reset_after, clock=clock))
+    return port, upstream, now
+
+def test_fresh_then_stale_while_revalidate():
+    port, upstream, now = make()
+    assert port.fetch_recent(7) == ["review-1-7"]
+    assert port.fetch_recent(7) == ["review-1-7"] and upstream.calls == 1
+    assert port.fetch_recent(days=3) == ["review-2-3"]  # arguments are part of the key
+
+    now[0] = 15  # stale: served at once, refreshed in the background
+    assert port.fetch_recent(7) == ["review-1-7"]
+    port.shutdown()
+    assert port.fetch_recent(7) == ["review-3-7"]
+    assert port.stats()["stale_hits"] == 1 and port.stats()["refreshes"] == 1
+
+    now[0] = 100  # past the stale window: fetched inline
+    assert port.fetch_recent(7) == ["review-4-7"]
+
+def test_concurrent_misses_share_one_call():
+    port, upstream, _ = make()
+    upstream.gate = threading.Event()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(port.fetch_recent(7))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    upstream.gate.set()
+    for thread in threads:
+        thread.join()
+    assert upstream.calls == 1 and results == [["review-1-7"]] * 8
+
+def test_breaker_serves_stale_while_upstream_is_down():
+    port, upstream, now = make(failures=2, reset_after=30)
+    port.fetch_recent(7)
+    upstream.fail = True
+    now[0] = 100
+    assert port.fetch_recent(7) == ["review-1-7"]  # stale-if-error
+    assert port.fetch_recent(7) == ["review-1-7"]
+    assert port.breaker.state == "open" and upstream.calls == 3
+
+    assert port.fetch_recent(7) == ["review-1-7"] and upstream.calls == 3  # open: upstream not called
+    with pytest.raises(UpstreamUnavailable):
+        port.fetch_recent(1)  # nothing cached to fall back on
+
+    upstream.fail = False
+    now[0] = 130  # half-open trial succeeds and closes the circuit
+    assert port.fetch_recent(7) == ["review-4-7"] and port.breaker.state == "closed"
+
+def test_registry_caches_request_path_ports_only():
+    assert not isinstance(AdapterRegistry(["mock"]).reviews(), CachedPort)
+    registry = AdapterRegistry(["mock"], cache=True)
+    assert registry.reviews() is registry.reviews() is registry.cached_ports["reviews"]
+    assert len(registry.inventory().fetch_current()) == 3
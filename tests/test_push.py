@@ -0,0 +1,93 @@
+import asyncio
+import io
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from packages.core.database import StockStatus
+from packages.core.push import PushHub, SubscriptionClosed, inventory_event, sse_stream
+from apps.api.main import app as main_app
+from tests.test_async_endpoints import seed
+
+def test_thousand_subscribers_and_a_stalled_one_never_block_writers():
+    async def scenario():
+        hub = PushHub(max_queue=256)
+        subscribers = [hub.subscribe() for _ in range(1000)]
+        stalled = hub.subscribe(max_queue=16)  # never reads
+        received = [0] * len(subscribers)
+
+        async def consume(n, subscriber):
+            while received[n] < 200:
+                await subscriber.get()
+                received[n] += 1
+
+        consumers = asyncio.gather(*[consume(n, s) for n, s in enumerate(subscribers)])
+
+        # Writers are sync endpoints in the threadpool: publish from threads
+        publish_times = []
+
+        def writer(offset):
+            for n in range(100):
+                start = time.perf_counter()
+                inventory_event(hub, f"ITEM-{offset + n}", StockStatus.OK, StockStatus.EIGHTY_SIX)
+                publish_times.append(time.perf_counter() - start)
+                if n % 10 == 0:
+                    time.sleep(0.001)  # a real write commits between events
+
+        threads = [threading.Thread(target=writer, args=(offset,)) for offset in (0, 1000)]
+        for thread in threads:
+            thread.start()
+        await asyncio.to_thread(lambda: [thread.join() for thread in threads])
+        await asyncio.wait_for(consumers, 30)
+
+        assert received == [200] * 1000
+        assert stalled.dropped and hub.stats() == {"subscribers": 1000, "published": 200, "dropped": 1}
+        try:
+            await stalled.get()
+        except SubscriptionClosed:
+            pass
+        else:
+            raise AssertionError("stalled subscriber should be closed")
+        # Publishing is a fan-out hand-off, not a wait on 1000 readers
+        assert max(publish_times) < 0.5
+
+    asyncio.run(scenario())
+
+def test_sse_frames_filters_and_keepalive():
+    async def scenario():
+        hub = PushHub()
+        subscriber = hub.subscribe(kinds={"eighty_six"})
+        stream = sse_stream(hub, subscriber, keepalive=0.01)
+        assert (await anext(stream)).startswith(b"retry:")
+        assert await anext(stream) == b": keepalive\n\n"
+
+        inventory_event(hub, "CHK-001", StockStatus.EIGHTY_SIX, StockStatus.OK)  # filtered out
+        inventory_event(hub, "CHK-001", StockStatus.OK, StockStatus.OK)  # not a transition
+        event = inventory_event(hub, "CHK-001", StockStatus.LOW, StockStatus.EIGHTY_SIX)
+        frame = await anext(stream)
+        assert frame.startswith(f"id: {event.id}\nevent: eighty_six\ndata: ".encode())
+        assert b'"previous_status":"low"' in frame
+
+        await stream.aclose()
+        assert hub.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+def test_websocket_receives_writes(db_session):
+    seed(db_session)
+    client = TestClient(main_app)
+
+    with client.websocket_connect("/api/v1/ws?kinds=eighty_six,change") as socket:
+        client.put("/api/v1/inventory/2", json={"item_id": "WINE-001", "status": "86", "notes": "Out"})
+        event = socket.receive_json()
+        assert event["kind"] == "eighty_six"
+        assert event["data"] == {"item_id": "WINE-001", "status": "86", "previous_status": "low", "notes": "Out"}
+
+        upload = io.BytesIO(b"item_id,status,notes\nCHK-001,ok,\nWINE-001,86,Out\n")
+        client.post("/api/v1/inventory/upload", files={"file": ("count.csv", upload, "text/csv")})
+        client.post("/api/v1/changes", json={"title": "Patio open"})
+        # CHK-001 back to ok is an "inventory" event, filtered; WINE-001 was already 86
+        assert socket.receive_json()["data"]["title"] == "Patio open"
+
+    assert client.get("/api/v1/events?kinds=bogus").status_code == 400
@@ -0,0 +1,111 @@
+"""EXPLAIN-based guard: hot endpoint queries must be served by an index.
+
+Runs against SQLite by default (EXPLAIN QUERY PLAN). Set TEST_DATABASE_URL to
+a scratch Postgres database to check the real planner instead; that database
+is dropped and recreated from the models.
+"""
+import json
+import os
+import random
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import joinedload
+
+from packages.core.database import (
+    Base, Menu, Inventory, Review, Change, Shift, User, Acknowledgement, UserRole, StockStatus
+)
+from packages.core.review_search import ReviewSearch, search_statement
+
+ROWS = 20_000
+NOW = datetime(2026, 1, 1, 12, 0)
+
+def hot_queries(dialect="sqlite"):
+    cutoff = NOW - timedelta(days=7)
+    return {
+        "brief inventory": select(Inventory).options(joinedload(Inventory.menu_item))
+            .where(Inventory.status.in_([StockStatus.EIGHTY_SIX, StockStatus.LOW])),
+        "86 board": select(Inventory).where(Inventory.status == StockStatus.EIGHTY_SIX),
+        "inventory by item": select(Inventory).where(Inventory.item_id == "ITEM-42"),
+        "recent reviews": select(Review).where(Review.created_at >= cutoff),
+        "active changes": select(Change).where(Change.is_active == True).order_by(Change.created_at.desc()),
+        "acks for change": select(Acknowledgement).where(Acknowledgement.change_id == "CHG-7"),
+        "acks for user": select(Acknowledgement).where(Acknowledgement.user_id == "USER-7"),
+        "today's shifts": select(Shift).where(Shift.starts >= NOW, Shift.starts < NOW + timedelta(days=1)),
+        "review search": search_statement(dialect, ReviewSearch("cold soup", source="google")),
+    }
+
+def seed(conn):
+    rng = random.Random(4)
+    users = [{"user_id": f"USER-{n}", "role": UserRole.STAFF, "name": f"Staff {n}", "email": f"s{n}@example.com"}
+             for n in range(200)]
+    conn.execute(insert(User), users)
+    conn.execute(insert(Menu), [{"item_id": f"ITEM-{n}", "name": f"Item {n}"} for n in range(ROWS)])
+    # Realistic skew: the vast majority of items are in stock
+    statuses = [StockStatus.OK] * 48 + [StockStatus.LOW, StockStatus.EIGHTY_SIX]
+    conn.execute(insert(Inventory), [{"item_id": f"ITEM-{n}", "status": rng.choice(statuses)} for n in range(ROWS)])
+    conn.execute(insert(Review), [
+        {"review_id": f"R-{n}", "source": "google", "rating": rng.randint(1, 5),
+         "text": rng.choice(["ok", "cold soup", "slow service", "great wine"]),
+         "created_at": NOW - timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60))}
+        for n in range(ROWS)
+    ])
+    conn.execute(insert(Change), [
+        {"change_id": f"CHG-{n}", "title": f"Change {n}", "created_by": "USER-0", "is_active": n % 50 == 0,
+         "created_at": NOW - timedelta(hours=n)}
+        for n in range(ROWS)
+    ])
+    conn.execute(insert(Acknowledgement), [
+        {"ack_id": f"ACK-{n}", "user_id": f"USER-{n % 200}", "change_id": f"CHG-{n % ROWS}"} for n in range(ROWS)
+    ])
+    conn.execute(insert(Shift), [
+        {"shift_id": f"S-{n}", "starts": NOW - timedelta(hours=8 * n), "ends": NOW - timedelta(hours=8 * n - 6),
+         "role": "server", "employee": f"USER-{n % 200}"}
+        for n in range(ROWS)
+    ])
+
+def sqlite_full_scans(conn, sql):
+    plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).fetchall()
+    details = [row[-1] for row in plan]
+    # anon_N are bounded subqueries (e.g. search's candidate set), not tables
+    return [d for d in details if re.fullmatch(r"SCAN (?!anon_)\w+", d)]
+
+def postgres_full_scans(conn, sql):
+    (plan,), = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql).fetchall()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    scans, nodes = [], [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if node["Node Type"] == "Seq Scan":
+            scans.append(f"Seq Scan on {node['Relation Name']}")
+        nodes.extend(node.get("Plans", []))
+    return scans
+
+@pytest.fixture(scope="module")
+def seeded_engine(tmp_path_factory):
+    url = os.getenv("TEST_DATABASE_URL") or f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed(conn)
+        # SQLite's ANALYZE keeps only per-index averages (no histograms), so a
+        # skewed column like inventory.status looks unselective to it. Without
+        # stats it plans from index availability, which is what we guard here;
+        # Postgres gets real statistics.
+        if engine.dialect.name != "sqlite":
+            conn.execute(text("ANALYZE"))
+    yield engine
+    if os.getenv("TEST_DATABASE_URL"):
+        Base.metadata.drop_all(engine)
+    engine.dispose()
+
+@pytest.mark.parametrize("name", list(hot_queries()))
+def test_hot_query_uses_an_index(seeded_engine, name):
+    stmt = hot_queries(seeded_engine.dialect.name)[name]
+    sql = str(stmt.compile(dialect=seeded_engine.dialect, compile_kwargs={"literal_binds": True}))
+    full_scans = sqlite_full_scans if seeded_engine.dialect.name == "sqlite" else postgres_full_scans
+    with seeded_engine.connect() as conn:
+        assert full_scans(conn, sql) == [], f"{name} falls back to a sequential scan:\n{sql}"
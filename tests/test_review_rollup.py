@@ -0,0 +1,68 @@
+from datetime import date, datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from packages.core.database import Review, ReviewDailyRollup
+from packages.core.review_rollup import rating_trend, theme_trend
+from packages.core.theme_tagging import tag_new_reviews
+from packages.core.themes import ThemeMatcher
+from apps.api.main import app as main_app
+from simple_api import app
+
+MATCHER = ThemeMatcher(["slow", "cold"])
+TODAY = date(2026, 3, 31)
+
+def add(db, *reviews, today=TODAY):
+    start = db.query(Review).count()
+    db.execute(insert(Review), [
+        {"review_id": f"R-{start + n}", "source": source, "rating": rating, "text": text,
+         "created_at": datetime.combine(today - timedelta(days=days_ago), datetime.min.time()) + timedelta(hours=19)}
+        for n, (days_ago, source, rating, text) in enumerate(reviews)
+    ])
+    db.commit()
+
+def test_rollup_follows_the_tagging_watermark(db_session):
+    add(db_session, (0, "google", 2, "slow and cold"), (0, "google", 4, "fine"), (2, "yelp", 1, "cold"))
+    tag_new_reviews(db_session, MATCHER)
+    add(db_session, (0, "google", 2, "slow again"))
+    tag_new_reviews(db_session, MATCHER)
+    tag_new_reviews(db_session, MATCHER)  # nothing new: counted once
+
+    points = rating_trend(db_session, 3, today=TODAY)
+    assert points == [
+        {"date": "2026-03-29", "reviews": 1, "average_rating": 1.0},
+        {"date": "2026-03-30", "reviews": 0, "average_rating": None},
+        {"date": "2026-03-31", "reviews": 3, "average_rating": 2.67},
+    ]
+    assert rating_trend(db_session, 1, source="yelp", today=TODAY)[0]["reviews"] == 0
+
+    assert theme_trend(db_session, 3, today=TODAY) == [
+        {"theme": "cold", "total": 2, "average_rating": 1.5,
+         "points": [{"date": "2026-03-29", "count": 1}, {"date": "2026-03-31", "count": 1}]},
+        {"theme": "slow", "total": 2, "average_rating": 2.0, "points": [{"date": "2026-03-31", "count": 2}]},
+    ]
+
+def test_trends_read_rollup_rows_not_reviews(db_session):
+    add(db_session, *[(n % 90, "google", 1 + n % 5, "slow" if n % 3 else "cold") for n in range(3000)])
+    tag_new_reviews(db_session, MATCHER)
+
+    # 90 days x 5 ratings x (all + one theme): bounded by days, not reviews
+    assert db_session.query(ReviewDailyRollup).count() <= 90 * 5 * 2
+    points = rating_trend(db_session, 90, today=TODAY)
+    assert len(points) == 90 and sum(p["reviews"] for p in points) == 3000
+    assert {t["theme"]: t["total"] for t in theme_trend(db_session, 90, today=TODAY)} == {"slow": 2000, "cold": 1000}
+
+def test_trend_endpoints_and_reset_on_clear(db_session):
+    add(db_session, (0, "google", 2, "Service was slow"), today=datetime.utcnow().date() - timedelta(days=1))
+    client = TestClient(app)
+    # Trends read the rollup only; the review counts once the worker has tagged it
+    assert sum(p["reviews"] for p in client.get("/api/v1/reviews/trends/ratings?days=30").json()) == 0
+    tag_new_reviews(db_session, MATCHER)
+    assert sum(p["reviews"] for p in client.get("/api/v1/reviews/trends/ratings?days=30").json()) == 1
+    assert client.get("/api/v1/reviews/trends/themes?days=30").json()[0]["theme"] == "slow"
+    assert client.get("/api/v1/reviews/trends/ratings?days=400").status_code == 422
+    assert TestClient(main_app).get("/api/v1/reviews/trends/themes?days=30").json()[0]["points"][0]["count"] == 1
+
+    assert client.post("/api/v1/admin/clear-data").status_code == 200
+    assert sum(p["reviews"] for p in client.get("/api/v1/reviews/trends/ratings?days=30").json()) == 0
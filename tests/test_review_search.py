@@ -0,0 +1,59 @@
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from packages.core.database import Review
+from packages.core.review_search import ReviewSearch, search_reviews
+from simple_api import app
+
+REVIEWS = [
+    ("R-1", "google", 2, "Waited forty minutes for the pasta, service was slow", datetime(2026, 3, 1)),
+    ("R-2", "yelp", 5, "Fresh pasta and a great wine list", datetime(2026, 3, 5)),
+    ("R-3", "google", 1, "Slow service, slow kitchen, slow everything. Slow!", datetime(2026, 3, 9)),
+    ("R-4", "yelp", 4, "Lovely patio", datetime(2026, 3, 12)),
+]
+
+@pytest.fixture
+def reviews(db_session):
+    db_session.add_all([Review(review_id=rid, source=source, rating=rating, text=text, created_at=created)
+                        for rid, source, rating, text, created in REVIEWS])
+    db_session.commit()
+    return db_session
+
+def ids(db, **kw):
+    return [review.review_id for review, _ in search_reviews(db, ReviewSearch(**kw))]
+
+def test_ranked_match_with_stemming(reviews):
+    assert ids(reviews, q="slow service") == ["R-3", "R-1"]  # denser match ranks first
+    assert ids(reviews, q="waiting") == ["R-1"]  # porter stems waited/waiting
+    assert ids(reviews, q='"pasta" AND wine)') == ["R-2"]  # FTS5 syntax in input is taken as plain words
+    assert ids(reviews, q="patio") == ["R-4"]
+
+def test_filters(reviews):
+    assert ids(reviews, q="pasta", source="yelp") == ["R-2"]
+    assert ids(reviews, q="pasta", max_rating=3) == ["R-1"]
+    assert ids(reviews, q="slow", since=date(2026, 3, 2), until=date(2026, 3, 9)) == ["R-3"]
+    with pytest.raises(ValueError):
+        ReviewSearch(q="?!")
+
+def test_only_the_newest_candidates_are_ranked(reviews):
+    newest = search_reviews(reviews, ReviewSearch(q="pasta"), candidates=1)
+    assert [review.review_id for review, _ in newest] == ["R-2"]
+    assert sorted(r.review_id for r, _ in search_reviews(reviews, ReviewSearch(q="pasta"), candidates=2)) == ["R-1", "R-2"]
+    # Filters apply before the cap, so they cannot empty the candidate set
+    capped = search_reviews(reviews, ReviewSearch(q="pasta", source="google"), candidates=1)
+    assert [review.review_id for review, _ in capped] == ["R-1"]
+
+def test_index_follows_updates_and_deletes(reviews):
+    reviews.get(Review, "R-4").text = "Slow patio service"
+    reviews.delete(reviews.get(Review, "R-3"))
+    reviews.commit()
+    assert sorted(ids(reviews, q="slow")) == ["R-1", "R-4"]
+    assert ids(reviews, q="patio") == ["R-4"] and ids(reviews, q="everything") == []
+
+def test_search_endpoint(reviews):
+    client = TestClient(app)
+    hits = client.get("/api/v1/reviews/search", params={"q": "pasta", "min_rating": 4}).json()
+    assert [(hit["review_id"], hit["rating"]) for hit in hits] == [("R-2", 5)] and hits[0]["rank"] > 0
+    assert client.get("/api/v1/reviews/search", params={"q": "..."}).status_code == 400
@@ -0,0 +1,60 @@
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+from packages.core.database import Change, Inventory, Menu, StockStatus
+from packages.core import serializers
+from packages.core.serializers import change_serializer, dumps, inventory_serializer
+from simple_api import app
+from tests.test_async_endpoints import seed
+
+def test_dumps_matches_fastapi_json_response():
+    item = Inventory(id=1, item_id="CHK-001", status=StockStatus.EIGHTY_SIX, notes="Supplier délai",
+                     expected_back=date(2026, 3, 2), updated_at=datetime(2026, 3, 1, 12, 30, 15, 250))
+    item.menu_item = Menu(item_id="CHK-001", name="Chicken", price=1800, active=True)
+
+    row = inventory_serializer(item)
+    legacy = {
+        "id": 1, "item_id": "CHK-001", "status": "86", "notes": "Supplier délai",
+        "expected_back": "2026-03-02", "updated_at": "2026-03-01T12:30:15.000250",
+        "menu_item": {"item_id": "CHK-001", "name": "Chicken", "price": 1800, "allergy_flags": None, "active": True},
+    }
+    # Same bytes FastAPI's JSONResponse rendered from the hand-built dicts
+    expected = json.dumps(jsonable_encoder([legacy]), ensure_ascii=False, separators=(",", ":")).encode()
+    assert dumps([row]) == expected
+
+def test_orjson_backend_matches_stdlib():
+    orjson = pytest.importorskip("orjson")
+    payload = [{
+        "status": StockStatus.EIGHTY_SIX, "notes": None, "text": "Supplier délai",
+        "expected_back": date(2026, 3, 2), "updated_at": datetime(2026, 3, 1, 12, 30, 15, 250),
+        "created_at": datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc), "price": 18.5, "active": True,
+    }]
+    assert orjson.dumps(payload, default=serializers._default) == serializers._json_dumps(payload)
+    assert serializers.BACKEND == "orjson" and dumps(payload) == serializers._json_dumps(payload)
+
+def test_defaults_fill_empty_values():
+    brief_change = change_serializer.with_defaults(detail="No details")
+    assert brief_change(Change(change_id="C1", title="t", detail=""))["detail"] == "No details"
+    assert change_serializer(Change(change_id="C1", title="t", detail=""))["detail"] == ""
+
+def test_endpoints_return_the_same_shapes(db_session):
+    seed(db_session)
+    client = TestClient(app)
+
+    inventory = client.get("/api/v1/inventory").json()
+    assert inventory[0]["status"] == "86" and inventory[0]["menu_item"]["name"] == "Chicken"
+    assert set(inventory[0]) == {"id", "item_id", "status", "notes", "expected_back", "updated_at", "menu_item"}
+    assert set(client.get("/api/v1/reviews").json()[0]) == {
+        "review_id", "source", "rating", "text", "created_at", "theme", "url"
+    }
+
+    created = client.post("/api/v1/changes", json={"title": "Patio open"}).json()
+    assert created["detail"] == "" and created["effective_from"] == date.today().isoformat() + "T00:00:00"
+
+    brief = client.get("/api/v1/brief/today").json()
+    assert brief["date"] == date.today().isoformat()
+    assert brief["changes"][0]["detail"] == "No details"
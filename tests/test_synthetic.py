@@ -0,0 +1,35 @@
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import psycopg2
+
+from benchmarks.synthetic import SeedConfig, TABLES, copy_csv, load, reviews, users
+from packages.core.acknowledgements import ack_coverage
+from packages.core.database import Acknowledgement, Review, Shift, User
+
+CONFIG = SeedConfig(locations=2, menu_size=10, staff=5, years=0.25, reviews=500, seed=3, end=date(2026, 3, 1))
+
+def test_same_seed_same_rows():
+    assert list(reviews(CONFIG)) == list(reviews(CONFIG))
+    other = SeedConfig(**{**CONFIG.__dict__, "seed": 4})
+    assert [r["text"] for r in reviews(other)] != [r["text"] for r in reviews(CONFIG)]
+
+def test_load_is_consistent(db_session, sqlite_engine):
+    counts = load(sqlite_engine, CONFIG, batch_size=64)
+    assert counts["users"] == 12 and counts["menus"] == counts["inventory"] == 20 and counts["reviews"] == 500
+    assert list(counts) == [model.__table__.name for model, _ in TABLES]
+    assert db_session.scalar(select(func.count()).select_from(Review)) == 500
+    assert db_session.scalar(select(func.max(Review.created_at))) <= CONFIG.end_at
+    # Acks and shifts only reference staff of the change's/shift's own location
+    assert db_session.scalar(
+        select(func.count()).select_from(Acknowledgement)
+        .where(func.substr(Acknowledgement.user_id, 1, 3) != func.substr(Acknowledgement.change_id, 1, 3))
+    ) == 0
+    assert db_session.scalar(select(func.count()).select_from(Shift)) == counts["shifts"]
+    coverage = ack_coverage(db_session)
+    assert coverage and all(row["acknowledged"] == 4 for row in coverage)
+
+def test_copy_csv_renders_like_binds():
+    batch = list(users(CONFIG))[:2]
+    lines = copy_csv(User.__table__, batch, psycopg2.dialect()).getvalue().splitlines()
+    assert lines[0].startswith("L00-U000,STAFF,Staff L00-0,l00.u0@example.com,True")
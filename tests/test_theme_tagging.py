@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from packages.core.brief_repository import count_statements
+from packages.core.database import Review, ReviewTheme, Watermark
+from packages.core.theme_tagging import tag_new_reviews, theme_counts
+from packages.core.themes import ThemeMatcher
+from simple_api import app
+from tests.test_async_endpoints import seed
+
+MATCHER = ThemeMatcher(["slow", "cold", "ticket times"])
+
+def add_reviews(db, texts, days_ago=1):
+    start = db.query(Review).count()
+    db.execute(insert(Review), [
+        {"review_id": f"R-{start + n:05d}", "source": "google", "rating": 3, "text": text,
+         "created_at": datetime.utcnow() - timedelta(days=days_ago)}
+        for n, text in enumerate(texts)
+    ])
+    db.commit()
+
+def test_tags_only_reviews_past_the_watermark(db_session):
+    add_reviews(db_session, ["Cold soup, slow service", "Lovely", "Ticket times were long and it was cold"])
+    assert tag_new_reviews(db_session, MATCHER, batch_size=2) == 3
+    assert tag_new_reviews(db_session, MATCHER) == 0
+
+    add_reviews(db_session, ["So slow"] * 5)
+    with count_statements(db_session) as statements:
+        assert tag_new_reviews(db_session, MATCHER) == 5
+    # watermark x2, pending x2, link insert, theme update, tagged_at update (+ watermark write)
+    assert statements["count"] <= 9
+
+    assert theme_counts(db_session, days=7) == [("slow", 6), ("cold", 2), ("ticket times", 1)]
+    themes = {r.review_id: r.theme for r in db_session.query(Review)}
+    assert themes["R-00000"] == "slow" and themes["R-00001"] is None and themes["R-00002"] == "cold"
+
+def test_review_committed_late_is_not_skipped(db_session):
+    add_reviews(db_session, ["slow"])
+    tag_new_reviews(db_session, MATCHER)
+    # Ingested (ingested_at taken) before the last run but committed after it
+    db_session.execute(insert(Review), [{"review_id": "R-late", "source": "google", "rating": 2, "text": "cold",
+                                         "created_at": datetime.utcnow(), "ingested_at": datetime(2000, 1, 1)}])
+    db_session.commit()
+    assert tag_new_reviews(db_session, MATCHER) == 1
+    assert tag_new_reviews(db_session, MATCHER) == 0
+    assert theme_counts(db_session, days=7) == [("cold", 1), ("slow", 1)]
+
+def test_window_and_keyword_changes(db_session):
+    add_reviews(db_session, ["slow"], days_ago=1)
+    add_reviews(db_session, ["slow and cold"], days_ago=20)
+    tag_new_reviews(db_session, MATCHER)
+    assert theme_counts(db_session, days=7) == [("slow", 1)]
+    assert theme_counts(db_session, days=30) == [("slow", 2), ("cold", 1)]
+
+    # A new keyword set retags everything
+    assert tag_new_reviews(db_session, ThemeMatcher(["cold"])) == 2
+    assert theme_counts(db_session, days=30) == [("cold", 1)]
+    assert db_session.query(ReviewTheme).count() == 1
+    assert db_session.get(Watermark, "review_themes").version == ThemeMatcher(["cold"]).fingerprint
+
+def test_theme_endpoints_aggregate_persisted_tags(db_session):
+    seed(db_session)
+    client = TestClient(app)
+    # GETs only read: nothing is tagged until the worker runs
+    assert client.get("/api/v1/reviews/themes?days=7").json() == []
+    assert db_session.get(Watermark, "review_themes") is None
+    tag_new_reviews(db_session, ThemeMatcher(["slow", "cold", "overcooked", "rude", "loud"]))
+    data = client.get("/api/v1/reviews/themes?days=7").json()
+    assert data == [{"name": "slow", "count": 1}]
+    assert TestClient(app).get("/api/v1/reviews?days=7").json()[0]["theme"] == "slow"
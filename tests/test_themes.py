@@ -0,0 +1,35 @@
+import pytest
+
+from packages.core.services import ReviewService
+from packages.core.themes import ThemeMatcher, get_matcher
+from packages.adapters.reviews_mock import ReviewsMockAdapter
+
+TEXT = "Slow   Service on the patio, soup was COLD. Ticket\ntimes 20+ min; slowly improving"
+
+@pytest.fixture(params=[True, False], ids=["small-set", "large-set"])
+def matcher(request, monkeypatch):
+    # Same answers whichever strategy the set size picks
+    monkeypatch.setattr(ThemeMatcher, "SMALL_SET", 100 if request.param else 0)
+    return ThemeMatcher(["slow", "slow service", "service", "cold", "20+ min", "20", "ticket  times", "rude"])
+
+def test_whole_words_and_overlapping_phrases(matcher):
+    assert matcher.find(TEXT) == {
+        "slow", "slow service", "service", "cold", "20+ min", "20", "ticket times",
+    }
+    assert matcher.find("slowly, rudely, coldest") == set()
+    assert matcher.find("20+ minutes") == {"20"}
+
+def test_counts_reviews_not_occurrences(matcher):
+    counts = matcher.count(["slow slow slow", "cold and slow", "fine", ""])
+    assert counts == {"slow": 2, "cold": 1}
+    assert matcher.ranked(["cold", "slow", "cold"]) == [("cold", 2), ("slow", 1)]
+
+def test_matcher_is_compiled_once_per_keyword_set():
+    assert get_matcher(("slow", "cold")) is get_matcher(("slow", "cold"))
+    assert ReviewService(ReviewsMockAdapter()).matcher is ReviewService(ReviewsMockAdapter()).matcher
+
+def test_service_can_reuse_fetched_reviews():
+    svc = ReviewService(ReviewsMockAdapter(), keywords=["slow", "ticket times", "attentive"])
+    reviews = svc.recent(7)
+    assert svc.themes(reviews=reviews) == svc.themes(7)
+    assert dict(svc.themes(reviews=reviews)) == {"slow": 1, "ticket times": 1, "attentive": 1}
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+from apps.api.adapter_registry import AdapterRegistry
+from apps.worker.jobs import build_jobs, ingest_inventory, ingest_reviews
+from apps.worker.scheduler import Job, Scheduler
+from packages.core.database import Inventory, Menu, Review, StockStatus
+from packages.core.engine import get_session_factory
+
+async def run_for(scheduler, seconds):
+    stop = asyncio.Event()
+    task = asyncio.ensure_future(scheduler.run(stop))
+    await asyncio.sleep(seconds)
+    stop.set()
+    await task
+
+def test_jobs_run_concurrently_on_their_own_intervals():
+    calls = {"fast": 0, "slow": 0}
+
+    async def fast():
+        calls["fast"] += 1
+
+    async def slow():
+        calls["slow"] += 1
+        await asyncio.sleep(0.2)
+
+    scheduler = Scheduler([Job("fast", fast, interval=0.05), Job("slow", slow, interval=10)])
+    asyncio.run(run_for(scheduler, 0.5))
+
+    # The slow job never held up the fast one
+    assert calls["fast"] >= 5 and calls["slow"] == 1
+    metrics = scheduler.metrics()
+    assert metrics["slow"]["last_duration"] >= 0.2
+    assert metrics["fast"]["behind"] is False
+
+def test_timed_out_sync_job_is_not_run_again_while_still_running():
+    release = threading.Event()
+    started = []
+
+    def stuck():
+        started.append(time.monotonic())
+        release.wait(5)
+
+    scheduler = Scheduler([Job("stuck", stuck, interval=0.05, timeout=0.05, backoff=0.05)])
+    try:
+        asyncio.run(run_for(scheduler, 0.4))
+    finally:
+        release.set()
+
+    stats = scheduler.stats["stuck"]
+    assert len(started) == 1
+    assert stats.timeouts == 1 and stats.skipped >= 2
+    assert scheduler.metrics()["stuck"]["behind"] is True
+
+def test_failures_back_off_and_reset_on_success():
+    outcomes = [False, False, False, True]
+
+    def flaky():
+        if not outcomes.pop(0):
+            raise RuntimeError("adapter down")
+
+    job = Job("flaky", flaky, interval=300, backoff=30, max_backoff=100)
+    scheduler = Scheduler([job])
+
+    async def drive():
+        delays = []
+        for _ in range(4):
+            await scheduler.run_once(job)
+            delays.append(scheduler.next_delay(job))
+        return delays
+
+    assert asyncio.run(drive()) == [30, 60, 100, 300]
+    assert scheduler.stats["flaky"].failures == 3
+    assert scheduler.stats["flaky"].last_error is None
+
+def test_jitter_stays_within_bounds():
+    job = Job("jittery", lambda: None, interval=60, jitter=5)
+    scheduler = Scheduler([job])
+    delays = [scheduler.next_delay(job) for _ in range(200)]
+    assert all(60 <= d <= 65 for d in delays) and len(set(delays)) > 1
+
+def test_ingest_jobs_write_through_the_ports(db_session):
+    db_session.add_all([Menu(item_id="i1", name="Branzino"), Menu(item_id="i2", name="Assyrtiko")])
+    db_session.commit()
+    registry = AdapterRegistry(["mock"])
+
+    assert [job.name for job in build_jobs(registry, get_session_factory(), env={})] == ["inventory", "reviews", "themes"]
+    assert ingest_inventory(registry.inventory(), get_session_factory()) == 2  # i3 is not on the menu
+    assert ingest_reviews(registry.reviews(), get_session_factory()) == 3
+    assert ingest_reviews(registry.reviews(), get_session_factory()) == 0
+
+    db_session.expire_all()
+    statuses = {i.item_id: i.status for i in db_session.query(Inventory)}
+    assert statuses == {"i1": StockStatus.EIGHTY_SIX, "i2": StockStatus.LOW}
+    assert db_session.query(Review).count() == 3